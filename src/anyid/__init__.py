@@ -1,11 +1,35 @@
-from .cuid import cuid
-from .cuid2 import cuid2
-from .ksuid import ksuid
-from .nanoid import nanoid
-from .snowflake import setup_snowflake_id_generator, snowflake
-from .ulid import ulid
-from .uuid import uuid
-from .xid import xid
+import importlib
+import sys
+import types
+
+# `typing` alone takes longer to import than the rest of this module, so the
+# type-checking imports below are guarded without it.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, List
+
+    from .cuid import cuid
+    from .cuid2 import cuid2
+    from .ksuid import ksuid
+    from .nanoid import nanoid
+    from .snowflake import setup_snowflake_id_generator, snowflake
+    from .ulid import ulid
+    from .uuid import uuid
+    from .xid import xid
+
+# Public names and the submodules defining them. Submodules are imported on
+# first attribute access (PEP 562) so that `import anyid` stays cheap.
+_EXPORTS = {
+    "cuid": ".cuid",
+    "cuid2": ".cuid2",
+    "ksuid": ".ksuid",
+    "nanoid": ".nanoid",
+    "snowflake": ".snowflake",
+    "setup_snowflake_id_generator": ".snowflake",
+    "ulid": ".ulid",
+    "uuid": ".uuid",
+    "xid": ".xid",
+}
 
 __all__ = [
     "cuid",
@@ -18,3 +42,36 @@ __all__ = [
     "uuid",
     "xid",
 ]
+
+
+def __getattr__(name: str) -> "Any":
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> "List[str]":
+    return sorted(set(globals()) | set(__all__))
+
+
+class _Package(types.ModuleType):
+    """
+    The type of the `anyid` module object.
+
+    The import system binds every imported submodule as an attribute of its
+    package. Most public functions share their submodule's name (`anyid.cuid`
+    is the `cuid` function), so that binding would shadow the function
+    whenever a submodule is imported directly. Such bindings are dropped and
+    the name is left to `__getattr__`.
+    """
+
+    def __setattr__(self, name: str, value: "Any") -> None:
+        if name in _EXPORTS and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
@@ -0,0 +1,206 @@
+"""
+A shared, buffered pool of cryptographically secure random bytes.
+
+Every random-bearing generator in anyid draws from the module-level pool
+instead of calling `secrets` per ID or per character. The pool reads large
+blocks from `os.urandom` (which uses `getrandom(2)` where available) and
+hands out slices, so most draws cost a slice instead of a system call.
+Bytes are never handed out twice, and a forked child discards the parent's
+buffer so the two processes never share random output.
+"""
+
+import os
+import threading
+from typing import List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_BUFFER_SIZE = 4096
+
+# Values wider than a byte are reduced from 64-bit words, so the modulo bias
+# is at most bound / 2**64. Bounds are capped to keep that bias below 2**-32.
+_MAX_BOUND = 1 << 32
+
+
+class EntropyPool:
+    """
+    A thread-safe buffer of random bytes refilled in bulk from the OS CSPRNG.
+
+    Attributes
+    ----------
+    buffer_size : int
+        The number of bytes read from the operating system per refill.
+        Requests larger than half of it bypass the buffer.
+    """
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        """
+        Initializes an empty pool; the first draw fills it.
+
+        Parameters
+        ----------
+        buffer_size : int, optional
+            The number of bytes read per refill. Defaults to 4096.
+
+        Raises
+        ------
+        ValueError
+            If `buffer_size` is less than 64.
+        """
+        if buffer_size < 64:
+            raise ValueError("Buffer size must be at least 64 bytes.")
+        self.buffer_size = buffer_size
+        self._buffer = b""
+        self._offset = 0
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        """
+        Discards all buffered bytes.
+
+        This is called in forked children so they never reuse bytes that the
+        parent may also hand out. The lock is replaced too, because another
+        thread of the parent may have held it at the time of the fork.
+        """
+        self._lock = threading.Lock()
+        self._buffer = b""
+        self._offset = 0
+
+    def token_bytes(self, n: int) -> bytes:
+        """
+        Returns `n` random bytes.
+
+        Parameters
+        ----------
+        n : int
+            The number of bytes.
+
+        Returns
+        -------
+        bytes
+            The random bytes.
+        """
+        if n > self.buffer_size // 2:
+            return os.urandom(n)
+        with self._lock:
+            offset = self._offset
+            end = offset + n
+            if end > len(self._buffer):
+                self._buffer = os.urandom(self.buffer_size)
+                offset, end = 0, n
+            self._offset = end
+            return self._buffer[offset:end]
+
+    def randbelow(self, bound: int) -> int:
+        """
+        Returns a random integer in the range [0, bound).
+
+        Uses rejection sampling over the smallest number of bits that can
+        hold `bound - 1`, so the result is exactly uniform.
+
+        Parameters
+        ----------
+        bound : int
+            The exclusive upper bound.
+
+        Returns
+        -------
+        int
+            The random value.
+
+        Raises
+        ------
+        ValueError
+            If `bound` is not positive.
+        """
+        if bound <= 0:
+            raise ValueError("Upper bound must be positive.")
+        bits = bound.bit_length()
+        size = (bits + 7) // 8
+        shift = size * 8 - bits
+        while True:
+            value = int.from_bytes(self.token_bytes(size), "big") >> shift
+            if value < bound:
+                return value
+
+    def randbelow_many(self, bound: int, count: int) -> List[int]:
+        """
+        Returns `count` random integers in the range [0, bound).
+
+        Bounds of up to 256 are served from single bytes with masking and
+        rejection, which is exactly uniform. Larger bounds are reduced from
+        64-bit words, with a modulo bias of at most 2**-32.
+
+        Parameters
+        ----------
+        bound : int
+            The exclusive upper bound. Must be between 1 and 2**32.
+        count : int
+            How many values to return.
+
+        Returns
+        -------
+        List[int]
+            The random values.
+
+        Raises
+        ------
+        ValueError
+            If `bound` is out of range.
+        """
+        if count <= 0:
+            return []
+        if not (0 < bound <= _MAX_BOUND):
+            raise ValueError(f"Upper bound must be between 1 and {_MAX_BOUND}.")
+        if bound > 256:
+            words = memoryview(self.token_bytes(8 * count)).cast("Q")
+            return [word % bound for word in words]
+
+        mask = (1 << (bound - 1).bit_length()) - 1
+        values: List[int] = []
+        while len(values) < count:
+            missing = count - len(values)
+            # Over-draw by the expected rejection rate so one read usually
+            # suffices.
+            draw = missing * (mask + 1) // bound + 8
+            values.extend(
+                value
+                for value in (byte & mask for byte in self.token_bytes(draw))
+                if value < bound
+            )
+        del values[count:]
+        return values
+
+    def choice(self, seq: Sequence[T]) -> T:
+        """
+        Returns a random element of a non-empty sequence.
+
+        Parameters
+        ----------
+        seq : Sequence[T]
+            The sequence to choose from.
+
+        Returns
+        -------
+        T
+            The chosen element.
+
+        Raises
+        ------
+        IndexError
+            If `seq` is empty.
+        """
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[self.randbelow(len(seq))]
+
+
+_pool = EntropyPool()
+
+token_bytes = _pool.token_bytes
+randbelow = _pool.randbelow
+randbelow_many = _pool.randbelow_many
+choice = _pool.choice
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_pool.reset)
@@ -0,0 +1,62 @@
+"""
+Re-initialisation of generator state in forked child processes.
+
+A child created by `os.fork` (pre-fork servers, `multiprocessing` with the
+fork start method) inherits a copy of every generator in its parent. Without
+intervention parent and child would continue the same counters, monotonic
+streams and process fingerprints and emit overlapping IDs. Modules register
+hooks for module-level state here, and generator instances with per-process
+state are tracked so they can reseed themselves in the child.
+"""
+
+import os
+import weakref
+from typing import Any, Callable, List
+
+# Imported first so that its own at-fork hook, which discards the buffered
+# random bytes, is registered (and therefore runs) before ours: the hooks
+# below draw fresh randomness from the pool.
+from . import _entropy  # noqa: F401
+
+_hooks: List[Callable[[], None]] = []
+_instances: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def register(hook: Callable[[], None]) -> None:
+    """
+    Registers a function resetting module-level state in forked children.
+
+    Hooks run in registration order, before any tracked instance is reset.
+
+    Parameters
+    ----------
+    hook : Callable[[], None]
+        The function to call in the child.
+    """
+    _hooks.append(hook)
+
+
+def track(instance: Any) -> None:
+    """
+    Tracks a generator whose `_after_fork` method must run in forked children.
+
+    Only a weak reference is kept, so tracking does not extend the lifetime
+    of the generator.
+
+    Parameters
+    ----------
+    instance : Any
+        The generator. It must define an `_after_fork()` method.
+    """
+    _instances.add(instance)
+
+
+def _after_fork_in_child() -> None:
+    for hook in _hooks:
+        hook()
+    for instance in list(_instances):
+        instance._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
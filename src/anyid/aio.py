@@ -0,0 +1,198 @@
+"""
+Asyncio-friendly ID generation.
+
+Snowflake and ULID generators occasionally have to wait for the clock:
+Snowflake when its 4096 sequence numbers per millisecond are used up or,
+under the "wait" policy, when the clock moved backwards, ULID when the 80-bit
+random component overflows. The synchronous `generate` methods spin or sleep
+in place, which would stall every coroutine on an event loop. The functions
+here yield to the loop while waiting instead, and move large, CPU-bound
+batches (such as CUID2 hashing) to an executor.
+
+Every generator is supported; those that never wait are simply called
+directly.
+
+Usage:
+    >>> from anyid import aio
+    >>> from anyid.ulid.generator import ULIDGenerator
+    >>> generator = ULIDGenerator()
+    >>> async def handler():
+    ...     one = await aio.agenerate(generator)
+    ...     batch = await aio.agenerate_many(generator, 10_000)
+    ...     async for value in aio.aiter_ids(generator):
+    ...         break
+"""
+
+import asyncio
+import functools
+import time
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, Callable, List, Optional
+
+from .clock import ClockBehind
+
+# How long to yield to the event loop before retrying a generator that is
+# waiting for the next millisecond or for its clock to catch up.
+TICK_WAIT = 0.0001
+
+# Batches of at least this many IDs are generated in an executor.
+DEFAULT_OFFLOAD_THRESHOLD = 1024
+
+
+def _record_waits(
+    generator: Any, overflow: Optional[float], regression: Optional[float]
+) -> None:
+    """
+    Records the seconds waited for the next millisecond (`overflow`) and for
+    the clock to catch up (`regression`) if the generator has stats. None
+    means there was no wait of that kind.
+    """
+    stats = getattr(generator, "stats", None)
+    if stats is None:
+        return
+    if overflow is not None:
+        stats.record_overflow()
+        stats.record_wait(overflow)
+    if regression is not None:
+        stats.record_regression_wait(regression)
+
+
+async def _retry(generator: Any, attempt: Callable[[], Any]) -> Any:
+    """
+    Calls `attempt` until it returns a non-empty result, yielding to the
+    event loop between tries.
+
+    An empty result (None or ``[]``) means the next millisecond has to be
+    waited for, `ClockBehind` that the clock has to catch up; the two kinds
+    of wait are recorded separately.
+    """
+    overflow: Optional[float] = None
+    regression: Optional[float] = None
+    while True:
+        started = time.perf_counter()
+        try:
+            result = attempt()
+        except ClockBehind:
+            behind = True
+        else:
+            if result:
+                break
+            behind = False
+        await asyncio.sleep(TICK_WAIT)
+        waited = time.perf_counter() - started
+        if behind:
+            regression = (regression or 0.0) + waited
+        else:
+            overflow = (overflow or 0.0) + waited
+    if overflow is not None or regression is not None:
+        _record_waits(generator, overflow, regression)
+    return result
+
+
+async def agenerate(generator: Any, **kwargs: Any) -> Any:
+    """
+    Generates one ID without blocking the event loop.
+
+    Args:
+        generator: Any anyid generator instance.
+        **kwargs: Passed on to the generator's `generate` method, e.g. `size`
+                  for a `NanoidGenerator`.
+
+    Returns:
+        The new ID, as returned by the generator's `generate` method.
+    """
+    try_generate = getattr(generator, "_try_generate", None)
+    if try_generate is None:
+        return generator.generate(**kwargs)
+    return await _retry(generator, try_generate)
+
+
+async def agenerate_many(
+    generator: Any,
+    n: int,
+    *,
+    executor: Optional[Executor] = None,
+    offload_threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+    **kwargs: Any,
+) -> List[Any]:
+    """
+    Generates `n` IDs without blocking the event loop.
+
+    Batches of at least `offload_threshold` IDs are generated by the
+    generator's `generate_many` in `executor`. Smaller batches run on the
+    loop, which is yielded to whenever the generator has to wait for the
+    next millisecond.
+
+    Args:
+        generator: Any anyid generator instance.
+        n: The number of IDs to generate.
+        executor: The executor for large batches. Defaults to the loop's
+                  default executor.
+        offload_threshold: The batch size from which the work is moved to
+                           the executor.
+        **kwargs: Passed on to the generator's `generate_many` method.
+
+    Returns:
+        The new IDs, in the order `generate_many` would return them.
+
+    Raises:
+        ValueError: If `n` is negative.
+    """
+    if n < 0:
+        raise ValueError("The number of IDs must be non-negative.")
+    if n >= offload_threshold:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, functools.partial(generator.generate_many, n, **kwargs)
+        )
+
+    take_many = getattr(generator, "_take_many", None)
+    if take_many is None:
+        return generator.generate_many(n, **kwargs)
+    ids: List[Any] = []
+    while len(ids) < n:
+        ids.extend(await _retry(generator, lambda: take_many(n - len(ids))))
+    return ids
+
+
+async def aiter_ids(
+    generator: Any,
+    chunk_size: int = 1024,
+    *,
+    executor: Optional[Executor] = None,
+    offload_threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+    **kwargs: Any,
+) -> AsyncIterator[Any]:
+    """
+    Yields IDs forever, generating them `chunk_size` at a time.
+
+    The event loop is yielded to after every chunk, so a consumer that never
+    awaits anything else still lets other coroutines run.
+
+    Args:
+        generator: Any anyid generator instance.
+        chunk_size: The number of IDs generated per batch.
+        executor: The executor for batches of at least `offload_threshold`.
+        offload_threshold: The batch size from which the work is moved to
+                           the executor.
+        **kwargs: Passed on to the generator's `generate_many` method.
+
+    Yields:
+        A new ID.
+
+    Raises:
+        ValueError: If `chunk_size` is less than 1.
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+    while True:
+        ids = await agenerate_many(
+            generator,
+            chunk_size,
+            executor=executor,
+            offload_threshold=offload_threshold,
+            **kwargs,
+        )
+        for value in ids:
+            yield value
+        await asyncio.sleep(0)
@@ -0,0 +1,23 @@
+"""
+Benchmarks for the anyid generators and codecs.
+
+Run the suite with ``python -m anyid.bench``; see ``--help`` for options.
+"""
+
+from .compare import (
+    MetricChange,
+    compare_results,
+    format_report,
+    load_results,
+    save_results,
+)
+from .runner import run_benchmarks
+
+__all__ = [
+    "MetricChange",
+    "compare_results",
+    "format_report",
+    "load_results",
+    "run_benchmarks",
+    "save_results",
+]
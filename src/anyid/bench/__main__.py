@@ -0,0 +1,110 @@
+"""
+Command line entry point: ``python -m anyid.bench``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from .compare import compare_results, format_report, load_results, save_results
+from .runner import run_benchmarks
+
+
+def _parse_thread_counts(value: str) -> List[int]:
+    if not value:
+        return []
+    return [int(part) for part in value.split(",")]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the benchmark suite from the command line.
+
+    Parameters
+    ----------
+    argv : List[str], optional
+        The command line arguments. Defaults to `sys.argv[1:]`.
+
+    Returns
+    -------
+    int
+        The process exit code: 1 if a regression against the baseline was
+        found, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m anyid.bench",
+        description="Benchmark the anyid generators and codecs.",
+    )
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+    parser.add_argument(
+        "-b", "--baseline", help="compare the results against this JSON file"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="relative worsening counted as a regression (default: 0.10)",
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        metavar="CASE",
+        help="only run the named cases, e.g. ulid xid ulid.decode_base32",
+    )
+    parser.add_argument(
+        "--threads",
+        type=_parse_thread_counts,
+        default=[1, 2, 4, 8],
+        help="comma separated thread counts; empty to skip (default: 1,2,4,8)",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=100_000,
+        help="calls per case for throughput and latency (default: 100000)",
+    )
+    parser.add_argument(
+        "--import-repeat",
+        type=int,
+        default=5,
+        help="fresh interpreters per cold import measurement; 0 to skip",
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="run with small iteration counts, for smoke testing",
+    )
+    args = parser.parse_args(argv)
+
+    iterations = 2_000 if args.quick else args.iterations
+    results = run_benchmarks(
+        iterations=iterations,
+        latency_samples=iterations,
+        alloc_iterations=max(1, iterations // 10),
+        thread_counts=args.threads,
+        thread_iterations=max(1, iterations // 5),
+        import_repeat=min(1, args.import_repeat) if args.quick else args.import_repeat,
+        only=args.only,
+    )
+
+    if args.output:
+        save_results(results, args.output)
+    else:
+        json.dump(results, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write("\n")
+
+    if args.baseline:
+        changes = compare_results(
+            results, load_results(args.baseline), threshold=args.threshold
+        )
+        print(format_report(changes), file=sys.stderr)
+        if any(change.regressed for change in changes):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
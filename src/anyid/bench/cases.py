@@ -0,0 +1,266 @@
+"""
+Benchmark cases for the anyid benchmark suite.
+
+Each case is a factory that performs any setup (building generators,
+preparing inputs) and returns a zero-argument callable. Only the returned
+callable is timed, so construction cost never leaks into the results.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict
+
+Operation = Callable[[], Any]
+CaseFactory = Callable[[], Operation]
+
+# Number of IDs produced by each call of a bulk case.
+BULK_BATCH_SIZE = 1000
+
+
+def _cuid() -> Operation:
+    from anyid.cuid import cuid
+
+    return cuid
+
+
+def _cuid_slug() -> Operation:
+    from anyid.cuid import slug
+
+    return slug
+
+
+def _cuid2() -> Operation:
+    from anyid.cuid2 import cuid2
+
+    return cuid2
+
+
+def _ksuid() -> Operation:
+    from anyid.ksuid import ksuid
+
+    return ksuid
+
+
+def _nanoid() -> Operation:
+    from anyid.nanoid import nanoid
+
+    return nanoid
+
+
+def _nanoid_custom() -> Operation:
+    from anyid.nanoid import custom_alphabet
+
+    return custom_alphabet("0123456789abcdef", 16)
+
+
+def _snowflake_generator() -> Any:
+    from anyid.snowflake import SnowflakeIdGenerator
+
+    return SnowflakeIdGenerator(worker_id=1, datacenter_id=1)
+
+
+def _snowflake() -> Operation:
+    return _snowflake_generator().generate
+
+
+def _snowflake_int() -> Operation:
+    return _snowflake_generator().generate_int
+
+
+def _snowflake_ints() -> Operation:
+    generate_many_ints = _snowflake_generator().generate_many_ints
+    return lambda: generate_many_ints(BULK_BATCH_SIZE)
+
+
+def _ulid() -> Operation:
+    from anyid.ulid import ulid
+
+    return ulid
+
+
+def _ulid_bytes() -> Operation:
+    from anyid.ulid.generator import ULIDGenerator
+
+    return ULIDGenerator().generate_bytes
+
+
+def _ulid_many_bytes() -> Operation:
+    from anyid.ulid.generator import ULIDGenerator
+
+    generate_many_bytes = ULIDGenerator().generate_many_bytes
+    return lambda: generate_many_bytes(BULK_BATCH_SIZE)
+
+
+def _uuid() -> Operation:
+    from anyid.uuid import uuid
+
+    return uuid
+
+
+def _xid() -> Operation:
+    from anyid.xid import xid
+
+    return xid
+
+
+def _generator_class(module: str, name: str) -> Callable[[], Any]:
+    """Returns a constructor for the generator class `module.name`."""
+
+    def build() -> Any:
+        from importlib import import_module
+
+        return getattr(import_module(module), name)()
+
+    return build
+
+
+def _sharded(module: str, name: str) -> CaseFactory:
+    """Builds a `generate` case on a generator in sharded mode."""
+
+    def factory() -> Operation:
+        from importlib import import_module
+
+        return getattr(import_module(module), name)(sharded=True).generate
+
+    return factory
+
+
+def _bulk(build: Callable[[], Any]) -> CaseFactory:
+    """Wraps a generator constructor into a `generate_many` case."""
+
+    def factory() -> Operation:
+        generate_many = build().generate_many
+        return lambda: generate_many(BULK_BATCH_SIZE)
+
+    return factory
+
+
+def _ulid_encode_base32() -> Operation:
+    from anyid.ulid.generator import ULIDGenerator
+
+    generator = ULIDGenerator()
+    data = generator.decode_base32(generator.generate())
+    return lambda: generator.encode_base32(data)
+
+
+def _ulid_decode_base32() -> Operation:
+    from anyid.ulid.generator import ULIDGenerator
+
+    generator = ULIDGenerator()
+    encoded = generator.generate()
+    return lambda: generator.decode_base32(encoded)
+
+
+def _ksuid_base62_encode() -> Operation:
+    from anyid.ksuid.generator import KsuidGenerator, base62_encode
+
+    number = int.from_bytes(KsuidGenerator().generate().to_bytes(), "big")
+    return lambda: base62_encode(number, 27)
+
+
+def _ksuid_parse() -> Operation:
+    from anyid.ksuid.generator import Ksuid, KsuidGenerator
+
+    encoded = str(KsuidGenerator().generate())
+    return lambda: Ksuid.parse(encoded)
+
+
+def _xid_from_string() -> Operation:
+    from anyid.xid.generator import Xid, XidGenerator
+
+    encoded = str(XidGenerator().generate())
+    return lambda: Xid.from_string(encoded)
+
+
+def _codec_encode_base36() -> Operation:
+    from anyid import codec
+
+    # The size of the SHA-512 digests CUID2 encodes.
+    number = (1 << 512) - 12345
+    return lambda: codec.encode_base36(number)
+
+
+def _codec_decode_base62() -> Operation:
+    from anyid import codec
+
+    encoded = codec.encode_base62((1 << 160) - 12345, 27)
+    return lambda: codec.decode_base62(encoded)
+
+
+def _codec_encode_base32_many() -> Operation:
+    import os
+
+    from anyid import codec
+
+    items = [os.urandom(16) for _ in range(BULK_BATCH_SIZE)]
+    return lambda: codec.encode_base32_many(items)
+
+
+# ID generators, keyed by the public name of the ID type.
+GENERATOR_CASES: Dict[str, CaseFactory] = {
+    "cuid": _cuid,
+    "cuid.slug": _cuid_slug,
+    "cuid2": _cuid2,
+    "ksuid": _ksuid,
+    "nanoid": _nanoid,
+    "nanoid.custom": _nanoid_custom,
+    "snowflake": _snowflake,
+    "snowflake.int": _snowflake_int,
+    "ulid": _ulid,
+    "ulid.bytes": _ulid_bytes,
+    "uuid": _uuid,
+    "xid": _xid,
+}
+
+# Batch generation through `generate_many`, one batch per operation.
+BULK_CASES: Dict[str, CaseFactory] = {
+    "cuid": _bulk(_generator_class("anyid.cuid", "CuidGenerator")),
+    "cuid2": _bulk(_generator_class("anyid.cuid2", "Cuid2Generator")),
+    "ksuid": _bulk(_generator_class("anyid.ksuid", "KsuidGenerator")),
+    "nanoid": _bulk(_generator_class("anyid.nanoid", "NanoidGenerator")),
+    "snowflake": _bulk(_snowflake_generator),
+    "snowflake.ints": _snowflake_ints,
+    "ulid": _bulk(_generator_class("anyid.ulid.generator", "ULIDGenerator")),
+    "ulid.bytes": _ulid_many_bytes,
+    "uuid": _bulk(_generator_class("anyid.uuid", "UuidGenerator")),
+    "xid": _bulk(_generator_class("anyid.xid", "XidGenerator")),
+}
+
+# Encoding and decoding paths that sit on the generate/parse hot paths.
+CODEC_CASES: Dict[str, CaseFactory] = {
+    "ulid.encode_base32": _ulid_encode_base32,
+    "ulid.decode_base32": _ulid_decode_base32,
+    "ksuid.base62_encode": _ksuid_base62_encode,
+    "ksuid.parse": _ksuid_parse,
+    "xid.from_string": _xid_from_string,
+    "codec.encode_base36": _codec_encode_base36,
+    "codec.decode_base62": _codec_decode_base62,
+    "codec.encode_base32_many": _codec_encode_base32_many,
+}
+
+# Generators exercised from several threads at once. The sharded variants
+# give each thread its own counter block or monotonic stream; comparing them
+# with the shared ones shows how generation scales across cores, which is
+# most telling on free-threaded builds (see ``meta.gil_enabled``).
+THREAD_CASES: Dict[str, CaseFactory] = dict(
+    GENERATOR_CASES,
+    **{
+        "cuid.sharded": _sharded("anyid.cuid", "CuidGenerator"),
+        "ulid.sharded": _sharded("anyid.ulid.generator", "ULIDGenerator"),
+        "xid.sharded": _sharded("anyid.xid", "XidGenerator"),
+    },
+)
+
+# Modules whose cold import time is measured in a fresh interpreter.
+IMPORT_TARGETS = (
+    "anyid",
+    "anyid.codec",
+    "anyid.cuid",
+    "anyid.cuid2",
+    "anyid.ksuid",
+    "anyid.nanoid",
+    "anyid.snowflake",
+    "anyid.ulid",
+    "anyid.uuid",
+    "anyid.xid",
+)
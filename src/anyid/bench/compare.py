@@ -0,0 +1,151 @@
+"""
+Comparison of benchmark results against a stored baseline.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Iterator, List, NamedTuple, Tuple
+
+# Metric names whose values improve as they grow. Everything else (latency,
+# allocation and import figures) improves as it shrinks.
+_HIGHER_IS_BETTER = ("ops_per_sec", "ids_per_sec")
+
+
+class MetricChange(NamedTuple):
+    """The change of a single metric between a baseline and a new run."""
+
+    name: str
+    baseline: float
+    current: float
+    change: float
+    regressed: bool
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """
+    Loads benchmark results from a JSON file.
+
+    Parameters
+    ----------
+    path : str
+        The path of the JSON file.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The results, as produced by `run_benchmarks`.
+    """
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def save_results(results: Dict[str, Any], path: str) -> None:
+    """
+    Writes benchmark results to a JSON file.
+
+    Parameters
+    ----------
+    results : Dict[str, Any]
+        The results, as produced by `run_benchmarks`.
+    path : str
+        The path of the JSON file.
+    """
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(results, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+
+
+def _flatten(results: Dict[str, Any]) -> Iterator[Tuple[str, float, bool]]:
+    """Yields ``(name, value, higher_is_better)`` for every numeric metric."""
+    for section in ("generators", "bulk", "codecs", "import"):
+        for case, metrics in results.get(section, {}).items():
+            for metric, value in metrics.items():
+                yield (
+                    f"{section}.{case}.{metric}",
+                    float(value),
+                    metric in _HIGHER_IS_BETTER,
+                )
+    for case, by_threads in results.get("threads", {}).items():
+        for threads, value in by_threads.items():
+            yield f"threads.{case}.{threads}", float(value), True
+
+
+def compare_results(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.10
+) -> List[MetricChange]:
+    """
+    Compares two benchmark runs metric by metric.
+
+    Only metrics present in both runs are compared.
+
+    Parameters
+    ----------
+    current : Dict[str, Any]
+        The results of the new run.
+    baseline : Dict[str, Any]
+        The stored baseline results.
+    threshold : float, optional
+        The relative worsening tolerated before a metric counts as a
+        regression. Defaults to 0.10 (10%).
+
+    Returns
+    -------
+    List[MetricChange]
+        One entry per shared metric, sorted by name. `change` is the relative
+        change, signed so that positive always means "worse".
+    """
+    baseline_metrics = {
+        name: (value, higher) for name, value, higher in _flatten(baseline)
+    }
+    changes = []
+    for name, value, higher_is_better in _flatten(current):
+        if name not in baseline_metrics:
+            continue
+        base_value = baseline_metrics[name][0]
+        worsening = base_value - value if higher_is_better else value - base_value
+        if base_value:
+            change = worsening / abs(base_value)
+        else:
+            change = float("inf") if worsening > 0 else 0.0
+        changes.append(
+            MetricChange(
+                name=name,
+                baseline=base_value,
+                current=value,
+                change=change,
+                regressed=change > threshold,
+            )
+        )
+    changes.sort(key=lambda item: item.name)
+    return changes
+
+
+def format_report(changes: List[MetricChange], regressions_only: bool = False) -> str:
+    """
+    Renders metric changes as a plain-text table.
+
+    Parameters
+    ----------
+    changes : List[MetricChange]
+        The output of `compare_results`.
+    regressions_only : bool, optional
+        Only list regressed metrics. Defaults to False.
+
+    Returns
+    -------
+    str
+        The formatted report.
+    """
+    rows = [change for change in changes if change.regressed or not regressions_only]
+    if not rows:
+        return "No regressions." if regressions_only else "No shared metrics."
+    width = max(len(row.name) for row in rows)
+    lines = [f"{'metric':<{width}}  {'baseline':>14}  {'current':>14}  {'worse':>8}"]
+    for row in rows:
+        marker = "  REGRESSION" if row.regressed else ""
+        lines.append(
+            f"{row.name:<{width}}  {row.baseline:>14.1f}  {row.current:>14.1f}"
+            f"  {row.change:>+8.1%}{marker}"
+        )
+    return "\n".join(lines)
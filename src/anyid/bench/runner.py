@@ -0,0 +1,356 @@
+"""
+Measurement primitives and the top-level benchmark driver.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .cases import (
+    BULK_BATCH_SIZE,
+    BULK_CASES,
+    CODEC_CASES,
+    GENERATOR_CASES,
+    IMPORT_TARGETS,
+    THREAD_CASES,
+    CaseFactory,
+    Operation,
+)
+
+RESULTS_FORMAT_VERSION = 1
+
+
+def _percentile(sorted_values: Sequence[int], fraction: float) -> int:
+    """
+    Returns the nearest-rank percentile of an already sorted sequence.
+
+    Parameters
+    ----------
+    sorted_values : Sequence[int]
+        The values, sorted in ascending order.
+    fraction : float
+        The percentile as a fraction between 0 and 1.
+
+    Returns
+    -------
+    int
+        The value at the requested percentile.
+    """
+    index = max(0, min(len(sorted_values) - 1, int(len(sorted_values) * fraction)))
+    return sorted_values[index]
+
+
+def measure_throughput(operation: Operation, iterations: int) -> float:
+    """
+    Measures how many times per second `operation` can be called.
+
+    The garbage collector is paused while timing so that collection pauses
+    are not attributed to whichever operation happens to trigger them.
+
+    Parameters
+    ----------
+    operation : Operation
+        The zero-argument callable to time.
+    iterations : int
+        How many times to call `operation`.
+
+    Returns
+    -------
+    float
+        The number of operations per second.
+    """
+    loop = range(iterations)
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in loop:
+            operation()
+        elapsed = time.perf_counter() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return iterations / elapsed if elapsed > 0 else float("inf")
+
+
+def measure_latency(operation: Operation, samples: int) -> Dict[str, int]:
+    """
+    Times individual calls of `operation` and reports latency percentiles.
+
+    Parameters
+    ----------
+    operation : Operation
+        The zero-argument callable to time.
+    samples : int
+        How many individually timed calls to make.
+
+    Returns
+    -------
+    Dict[str, int]
+        The p50, p99 and p999 latencies in nanoseconds. The figures include
+        the cost of one `time.perf_counter_ns` call.
+    """
+    timer = time.perf_counter_ns
+    durations: List[int] = [0] * samples
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for i in range(samples):
+            start = timer()
+            operation()
+            durations[i] = timer() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    durations.sort()
+    return {
+        "p50_ns": _percentile(durations, 0.50),
+        "p99_ns": _percentile(durations, 0.99),
+        "p999_ns": _percentile(durations, 0.999),
+    }
+
+
+def measure_allocations(operation: Operation, iterations: int) -> Dict[str, float]:
+    """
+    Measures the memory retained per call of `operation`.
+
+    The results of every call are kept alive while the snapshot is taken,
+    so the figures describe what one ID costs to hold in memory, including
+    any intermediate objects the generator leaks or caches.
+
+    Parameters
+    ----------
+    operation : Operation
+        The zero-argument callable to measure.
+    iterations : int
+        How many calls to average over.
+
+    Returns
+    -------
+    Dict[str, float]
+        The retained bytes and allocated blocks per call.
+    """
+    results: List[Any] = []
+    append = results.append
+    operation()  # Let lazy initialisation happen outside the measurement.
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for _ in range(iterations):
+            append(operation())
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    return {
+        "alloc_bytes_per_op": size / iterations,
+        "alloc_blocks_per_op": blocks / iterations,
+    }
+
+
+def measure_threads(
+    factory: CaseFactory, thread_counts: Iterable[int], iterations: int
+) -> Dict[str, float]:
+    """
+    Measures aggregate throughput of one shared operation across threads.
+
+    Every thread calls the same operation `iterations` times; the threads
+    are released together by a barrier so the measurement covers the period
+    in which all of them compete for the generator.
+
+    Parameters
+    ----------
+    factory : CaseFactory
+        Builds the operation shared by all threads.
+    thread_counts : Iterable[int]
+        The numbers of threads to measure.
+    iterations : int
+        How many calls each thread makes.
+
+    Returns
+    -------
+    Dict[str, float]
+        The aggregate operations per second, keyed by thread count.
+    """
+    results: Dict[str, float] = {}
+    for count in thread_counts:
+        operation = factory()
+        barrier = threading.Barrier(count + 1)
+
+        def worker() -> None:
+            barrier.wait()
+            for _ in range(iterations):
+                operation()
+
+        threads = [threading.Thread(target=worker) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        results[str(count)] = (count * iterations) / elapsed if elapsed > 0 else 0.0
+    return results
+
+
+def measure_import(module: str, repeat: int) -> float:
+    """
+    Measures the cold import time of `module` in fresh interpreters.
+
+    Parameters
+    ----------
+    module : str
+        The dotted name of the module to import.
+    repeat : int
+        How many interpreters to start; the median is reported.
+
+    Returns
+    -------
+    float
+        The median import time in milliseconds.
+    """
+    import anyid
+
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(anyid.__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [package_root, env.get("PYTHONPATH")])
+    )
+    script = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            check=True,
+            capture_output=True,
+            env=env,
+            text=True,
+        ).stdout
+        timings.append(float(output.strip()) * 1000)
+    return statistics.median(timings)
+
+
+def _metadata() -> Dict[str, Any]:
+    """Describes the interpreter and machine the results were taken on."""
+    try:
+        from importlib.metadata import version
+
+        anyid_version: Optional[str] = version("anyid")
+    except Exception:  # pylint: disable=broad-except
+        anyid_version = None
+    gil_check = getattr(sys, "_is_gil_enabled", None)
+    return {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "anyid_version": anyid_version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "gil_enabled": gil_check() if gil_check is not None else True,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.time(),
+    }
+
+
+def _select(cases: Dict[str, CaseFactory], only: Optional[Sequence[str]]):
+    if not only:
+        return cases
+    return {name: factory for name, factory in cases.items() if name in only}
+
+
+def run_benchmarks(
+    iterations: int = 100_000,
+    latency_samples: int = 100_000,
+    alloc_iterations: int = 10_000,
+    thread_counts: Sequence[int] = (1, 2, 4, 8),
+    thread_iterations: int = 20_000,
+    import_repeat: int = 5,
+    only: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Runs the full benchmark suite and returns the results.
+
+    Parameters
+    ----------
+    iterations : int, optional
+        Calls per case for the throughput measurement.
+    latency_samples : int, optional
+        Individually timed calls per case for the latency percentiles.
+    alloc_iterations : int, optional
+        Calls per case for the allocation measurement.
+    thread_counts : Sequence[int], optional
+        Thread counts for the contention measurement. An empty sequence
+        skips it.
+    thread_iterations : int, optional
+        Calls per thread for the contention measurement.
+    import_repeat : int, optional
+        Fresh interpreters per module for the import measurement. Zero skips
+        it.
+    only : Sequence[str], optional
+        Restricts the run to the named cases, e.g. ``["ulid", "xid"]``.
+
+    Returns
+    -------
+    Dict[str, Any]
+        A JSON-serialisable mapping with ``meta``, ``generators``, ``bulk``,
+        ``codecs``, ``threads`` and ``import`` sections.
+    """
+    results: Dict[str, Any] = {
+        "meta": _metadata(),
+        "generators": {},
+        "bulk": {},
+        "codecs": {},
+        "threads": {},
+        "import": {},
+    }
+
+    for section, cases in (
+        ("generators", GENERATOR_CASES),
+        ("codecs", CODEC_CASES),
+    ):
+        for name, factory in _select(cases, only).items():
+            operation = factory()
+            entry: Dict[str, Any] = {
+                "ops_per_sec": measure_throughput(operation, iterations)
+            }
+            entry.update(measure_latency(operation, latency_samples))
+            entry.update(measure_allocations(operation, alloc_iterations))
+            results[section][name] = entry
+
+    bulk_iterations = max(1, iterations // BULK_BATCH_SIZE)
+    for name, factory in _select(BULK_CASES, only).items():
+        batches_per_sec = measure_throughput(factory(), bulk_iterations)
+        results["bulk"][name] = {"ids_per_sec": batches_per_sec * BULK_BATCH_SIZE}
+
+    if thread_counts:
+        for name, factory in _select(THREAD_CASES, only).items():
+            results["threads"][name] = measure_threads(
+                factory, thread_counts, thread_iterations
+            )
+
+    if import_repeat > 0:
+        for module in IMPORT_TARGETS:
+            if only and module.rpartition(".")[2] not in only and module != "anyid":
+                continue
+            results["import"][module] = {
+                "cold_import_ms": measure_import(module, import_repeat)
+            }
+
+    return results
@@ -0,0 +1,208 @@
+"""
+Clocks the anyid generators read their timestamps from.
+
+Every generator takes a `clock` and reads the current time from it as an
+integer number of nanoseconds since the Unix epoch, deriving milliseconds or
+seconds with integer division, so no float rounding is involved. Three clocks
+are provided:
+
+- `SystemClock` reads the wall clock on every call. It is the default.
+- `MonotonicClock` reads the wall clock once and then advances with the
+  monotonic clock, so NTP steps and slews cannot make it go backwards and
+  reorder IDs.
+- `CoarseClock` caches the time of another clock and refreshes it from a
+  background thread once per tick, for generators that need seconds (KSUID,
+  XID) or can live with a coarser resolution.
+
+Any object with a `time_ns()` method returning an `int` can be used instead,
+e.g. a fake clock in tests.
+
+Usage:
+    >>> from anyid.clock import MonotonicClock
+    >>> from anyid.snowflake import SnowflakeIdGenerator
+    >>> generator = SnowflakeIdGenerator(1, 1, clock=MonotonicClock())
+"""
+
+import threading
+import time
+from typing import Optional
+
+from . import _fork
+
+
+class Clock:
+    """
+    The interface of the clocks the generators read.
+
+    Subclasses implement `time_ns`.
+    """
+
+    def time_ns(self) -> int:
+        """
+        Returns the current time.
+
+        Returns
+        -------
+        int
+            The number of nanoseconds since the Unix epoch.
+        """
+        raise NotImplementedError
+
+
+class ClockBehind(Exception):
+    """
+    Raised by a generator's non-blocking hooks when the clock moved backwards
+    and the generator waits for it to catch up.
+
+    The waiting is left to the caller, e.g. `anyid.aio`, so that it happens
+    without the generator's lock and without blocking an event loop.
+
+    Attributes
+    ----------
+    behind : float
+        How far the clock is behind, in seconds.
+    """
+
+    def __init__(self, behind: float):
+        super().__init__(behind)
+        self.behind = behind
+
+
+class SystemClock(Clock):
+    """Reads the system wall clock (`time.time_ns`) on every call."""
+
+    def time_ns(self) -> int:
+        return time.time_ns()
+
+
+class MonotonicClock(Clock):
+    """
+    Wall-clock time that never goes backwards.
+
+    The time of `source` is read once, as an anchor, and from then on the
+    clock advances with `time.monotonic_ns`. Adjustments of the system clock
+    after the anchor was taken are ignored, so the clock can drift from the
+    wall clock over a long uptime; call `resync` to take a new anchor.
+
+    Attributes
+    ----------
+    source : Clock
+        The clock the anchor is read from.
+    """
+
+    def __init__(self, source: Optional[Clock] = None):
+        """
+        Initializes the clock and takes its anchor.
+
+        Parameters
+        ----------
+        source : Clock, optional
+            The clock the anchor is read from. Defaults to the system clock.
+        """
+        self.source = source if source is not None else SYSTEM_CLOCK
+        self.resync()
+
+    def resync(self) -> None:
+        """
+        Re-anchors the clock on the current time of `source`.
+
+        If `source` is behind this clock, the clock goes backwards.
+        """
+        self._offset = self.source.time_ns() - time.monotonic_ns()
+
+    def time_ns(self) -> int:
+        return time.monotonic_ns() + self._offset
+
+
+class CoarseClock(Clock):
+    """
+    The time of another clock, cached and refreshed once per tick.
+
+    Reading a coarse clock costs an attribute access. A daemon thread,
+    started on first use, refreshes the cached time every `resolution`
+    seconds; the thread is restarted in forked children.
+
+    Attributes
+    ----------
+    source : Clock
+        The clock whose time is cached.
+    resolution : float
+        The interval between refreshes, in seconds.
+    """
+
+    def __init__(self, source: Optional[Clock] = None, resolution: float = 0.001):
+        """
+        Initializes the clock. The refresh thread starts on first use.
+
+        Parameters
+        ----------
+        source : Clock, optional
+            The clock whose time is cached. Defaults to the system clock.
+        resolution : float, optional
+            The interval between refreshes, in seconds. Defaults to 0.001.
+
+        Raises
+        ------
+        ValueError
+            If `resolution` is not positive.
+        """
+        if resolution <= 0:
+            raise ValueError("Resolution must be positive.")
+        self.source = source if source is not None else SYSTEM_CLOCK
+        self.resolution = resolution
+        self._now: Optional[int] = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        _fork.track(self)
+
+    def _after_fork(self) -> None:
+        """Forgets the refresh thread, which does not exist in a forked child."""
+        self._lock = threading.Lock()
+        self._thread = None
+        self._now = None
+
+    def time_ns(self) -> int:
+        now = self._now
+        if now is None:
+            now = self._start()
+        return now
+
+    def _start(self) -> int:
+        """Starts the refresh thread unless it runs, and returns the time."""
+        with self._lock:
+            now = self.source.time_ns()
+            if self._thread is None:
+                self._now = now
+                self._stopped = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._refresh,
+                    args=(self._stopped,),
+                    name="anyid-coarse-clock",
+                    daemon=True,
+                )
+                self._thread.start()
+            return now
+
+    def _refresh(self, stopped: threading.Event) -> None:
+        """Body of the refresh thread."""
+        source, resolution = self.source, self.resolution
+        while not stopped.wait(resolution):
+            self._now = source.time_ns()
+
+    def stop(self) -> None:
+        """
+        Stops the refresh thread.
+
+        The clock stays usable: the thread is started again on next use.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stopped.set()
+            if thread is not None:
+                thread.join()
+            self._now = None
+
+
+# The clock generators use unless they are given another one.
+SYSTEM_CLOCK = SystemClock()
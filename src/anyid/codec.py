@@ -0,0 +1,435 @@
+"""
+Table-driven text encodings shared by the anyid generators.
+
+Encoders look up two output characters at a time in precomputed tables and
+join the pieces once, instead of prepending one character per `divmod` step
+(which copies the partial string every time). Crockford base32 is cut
+straight into fixed 10-bit groups of the input. Decoders translate the input
+in one pass and hand the conversion to `int`, validating every character.
+
+Usage:
+    >>> from anyid import codec
+    >>> codec.encode_base32(bytes(16))
+    '00000000000000000000000000'
+    >>> codec.decode_base62(codec.encode_base62(12345, 27))
+    12345
+"""
+
+import string
+from typing import Dict, Iterable, List, Optional, Tuple
+
+CROCKFORD_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+BASE36_ALPHABET = string.digits + string.ascii_lowercase
+BASE62_ALPHABET = string.digits + string.ascii_uppercase + string.ascii_lowercase
+
+
+def _pairs(alphabet: str) -> Tuple[str, ...]:
+    """Returns every two-character string over `alphabet`, in value order."""
+    return tuple(high + low for high in alphabet for low in alphabet)
+
+
+# Every two-character string of each alphabet, in value order: the pair at
+# index ``i`` encodes the value ``i`` as two digits.
+CROCKFORD_PAIRS = _pairs(CROCKFORD_ALPHABET)
+BASE36_PAIRS = _pairs(BASE36_ALPHABET)
+BASE62_PAIRS = _pairs(BASE62_ALPHABET)
+
+
+def _crockford_translation() -> Dict[int, str]:
+    """
+    Maps Crockford digits, in either case, onto the digits `int(..., 32)`
+    understands. Every other ASCII letter (I, L, O and U) maps to a character
+    that is not alphanumeric, so it fails validation.
+    """
+    int32_digits = string.digits + string.ascii_uppercase
+    mapping = {char: "!" for char in string.ascii_letters}
+    for value, char in enumerate(CROCKFORD_ALPHABET):
+        mapping[char] = mapping[char.lower()] = int32_digits[value]
+    return str.maketrans(mapping)
+
+
+_CROCKFORD_TO_INT32 = _crockford_translation()
+
+_BASE62_VALUES: Dict[str, int] = {char: i for i, char in enumerate(BASE62_ALPHABET)}
+
+# Bit offsets of the 10-bit groups of an encoding, keyed by its width.
+_BASE32_SHIFTS: Dict[int, Tuple[int, ...]] = {}
+
+
+def _invalid_character(encoded: str, valid: str, name: str) -> ValueError:
+    """Builds the error for the first character of `encoded` not in `valid`."""
+    for char in encoded:
+        if char not in valid:
+            return ValueError(f"Invalid character '{char}' in {name} string")
+    return ValueError(f"Invalid {name} string")
+
+
+def _encode_pairs(number: int, pairs: Tuple[str, ...], base: int, width: int) -> str:
+    """
+    Encodes a non-negative integer two digits at a time.
+
+    The result is left-padded with the zero digit to at least `width`
+    characters; it is never truncated.
+    """
+    if number < 0:
+        raise ValueError("Cannot encode negative integers.")
+    square = base * base
+    chunks: List[str] = []
+    while number >= square:
+        number, remainder = divmod(number, square)
+        chunks.append(pairs[remainder])
+    chunks.append(pairs[number])
+    chunks.reverse()
+    encoded = "".join(chunks)
+    zero = pairs[0][0]
+    # The leading pair may start with a zero digit.
+    if encoded[0] == zero and len(encoded) > 1:
+        encoded = encoded[1:]
+    if len(encoded) < width:
+        encoded = zero * (width - len(encoded)) + encoded
+    return encoded
+
+
+def encode_base32_int(number: int, width: int) -> str:
+    """
+    Encodes a non-negative integer as a fixed-width Crockford base32 string.
+
+    Parameters
+    ----------
+    number : int
+        The integer to encode. It must fit in `5 * width` bits.
+    width : int
+        The number of characters of the result.
+
+    Returns
+    -------
+    str
+        The upper-case Crockford base32 string.
+
+    Raises
+    ------
+    ValueError
+        If `number` is negative or does not fit in `width` characters.
+    """
+    if number < 0:
+        raise ValueError("Cannot encode negative integers.")
+    if number >> (5 * width):
+        raise ValueError(f"Integer does not fit in {width} base32 characters")
+    shifts = _BASE32_SHIFTS.get(width)
+    if shifts is None:
+        # An odd width is encoded one character wider and the leading zero
+        # dropped, so that every group is a full table lookup.
+        shifts = tuple(range(5 * (width + (width & 1) - 2), -1, -10))
+        _BASE32_SHIFTS[width] = shifts
+    pairs = CROCKFORD_PAIRS
+    encoded = "".join([pairs[(number >> shift) & 0x3FF] for shift in shifts])
+    return encoded[1:] if width & 1 else encoded
+
+
+def decode_base32_int(encoded: str) -> int:
+    """
+    Decodes a Crockford base32 string into an integer.
+
+    Decoding is case-insensitive. The optional aliases of the Crockford
+    specification (I and L for 1, O for 0) are rejected.
+
+    Parameters
+    ----------
+    encoded : str
+        The string to decode.
+
+    Returns
+    -------
+    int
+        The decoded value. An empty string decodes to 0.
+
+    Raises
+    ------
+    ValueError
+        If `encoded` contains a character outside the Crockford alphabet.
+    """
+    if not encoded:
+        return 0
+    translated = encoded.translate(_CROCKFORD_TO_INT32)
+    if not (translated.isascii() and translated.isalnum()):
+        raise _invalid_character(
+            encoded.upper(), CROCKFORD_ALPHABET, "Crockford base32"
+        )
+    return int(translated, 32)
+
+
+def encode_base32(data: bytes) -> str:
+    """
+    Encodes bytes as Crockford base32, as used by ULID.
+
+    The bytes are read as one big-endian integer, so the result has
+    `ceil(8 * len(data) / 5)` characters and any spare bits are leading
+    zeros. Sixteen bytes give the 26 characters of a ULID.
+
+    Parameters
+    ----------
+    data : bytes
+        The bytes to encode.
+
+    Returns
+    -------
+    str
+        The upper-case Crockford base32 string.
+    """
+    return encode_base32_int(int.from_bytes(data, "big"), (len(data) * 8 + 4) // 5)
+
+
+def decode_base32(encoded: str, size: Optional[int] = None) -> bytes:
+    """
+    Decodes a Crockford base32 string into bytes.
+
+    Parameters
+    ----------
+    encoded : str
+        The string to decode; see `decode_base32_int`.
+    size : int, optional
+        The number of bytes of the result. Defaults to the largest number of
+        whole bytes the string encodes, e.g. 16 for the 26 characters of a
+        ULID.
+
+    Returns
+    -------
+    bytes
+        The decoded bytes.
+
+    Raises
+    ------
+    ValueError
+        If `encoded` contains an invalid character, or its value does not
+        fit in `size` bytes.
+    """
+    if size is None:
+        size = len(encoded) * 5 // 8
+    number = decode_base32_int(encoded)
+    if number >> (8 * size):
+        raise ValueError(f"Base32 string does not fit in {size * 8} bits")
+    return number.to_bytes(size, "big")
+
+
+def encode_base36(number: int, width: int = 0) -> str:
+    """
+    Encodes a non-negative integer as lower-case base36.
+
+    Parameters
+    ----------
+    number : int
+        The integer to encode.
+    width : int, optional
+        The minimum length; shorter results are left-padded with ``"0"``.
+        Defaults to 0 (no padding).
+
+    Returns
+    -------
+    str
+        The base36 string; ``"0"`` for zero.
+
+    Raises
+    ------
+    ValueError
+        If `number` is negative.
+    """
+    return _encode_pairs(number, BASE36_PAIRS, 36, width)
+
+
+def decode_base36(encoded: str) -> int:
+    """
+    Decodes a base36 string, case-insensitively.
+
+    Parameters
+    ----------
+    encoded : str
+        The string to decode.
+
+    Returns
+    -------
+    int
+        The decoded value.
+
+    Raises
+    ------
+    ValueError
+        If `encoded` is empty or contains a character outside the alphabet.
+    """
+    if not (encoded.isascii() and encoded.isalnum()):
+        raise _invalid_character(encoded.lower(), BASE36_ALPHABET, "base36")
+    return int(encoded, 36)
+
+
+def encode_base62(number: int, width: int = 0) -> str:
+    """
+    Encodes a non-negative integer as base62, as used by KSUID.
+
+    Parameters
+    ----------
+    number : int
+        The integer to encode.
+    width : int, optional
+        The minimum length; shorter results are left-padded with ``"0"``.
+        Defaults to 0 (no padding).
+
+    Returns
+    -------
+    str
+        The base62 string; ``"0"`` for zero.
+
+    Raises
+    ------
+    ValueError
+        If `number` is negative.
+    """
+    return _encode_pairs(number, BASE62_PAIRS, 62, width)
+
+
+def decode_base62(encoded: str) -> int:
+    """
+    Decodes a base62 string. Decoding is case-sensitive.
+
+    Parameters
+    ----------
+    encoded : str
+        The string to decode.
+
+    Returns
+    -------
+    int
+        The decoded value.
+
+    Raises
+    ------
+    ValueError
+        If `encoded` is empty or contains a character outside the alphabet.
+    """
+    if not encoded:
+        raise ValueError("Invalid base62 string")
+    values = _BASE62_VALUES
+    number = 0
+    try:
+        for char in encoded:
+            number = number * 62 + values[char]
+    except KeyError:
+        raise _invalid_character(encoded, BASE62_ALPHABET, "base62") from None
+    return number
+
+
+def encode_hex(data: bytes) -> str:
+    """
+    Encodes bytes as lower-case hexadecimal, as used by XID.
+
+    Parameters
+    ----------
+    data : bytes
+        The bytes to encode.
+
+    Returns
+    -------
+    str
+        Two hexadecimal digits per byte.
+    """
+    return data.hex()
+
+
+def decode_hex(encoded: str) -> bytes:
+    """
+    Decodes a hexadecimal string, case-insensitively.
+
+    Unlike `bytes.fromhex`, whitespace is not skipped.
+
+    Parameters
+    ----------
+    encoded : str
+        The string to decode.
+
+    Returns
+    -------
+    bytes
+        The decoded bytes.
+
+    Raises
+    ------
+    ValueError
+        If `encoded` has an odd length or contains a non-hexadecimal
+        character.
+    """
+    try:
+        data = bytes.fromhex(encoded)
+    except ValueError:
+        data = b""
+    # `fromhex` skips whitespace, which shows up as missing output bytes.
+    if 2 * len(data) != len(encoded):
+        raise ValueError("Invalid hexadecimal string")
+    return data
+
+
+def encode_base32_many(items: Iterable[bytes]) -> List[str]:
+    """Encodes every byte string of `items` with `encode_base32`."""
+    return [encode_base32(item) for item in items]
+
+
+def decode_base32_many(items: Iterable[str], size: Optional[int] = None) -> List[bytes]:
+    """Decodes every string of `items` with `decode_base32`."""
+    return [decode_base32(item, size) for item in items]
+
+
+def decode_base32_int_many(items: Iterable[str], width: int) -> List[int]:
+    """
+    Decodes strings of exactly `width` Crockford base32 characters each.
+
+    The strings are joined and translated in one pass, which is much faster
+    than decoding them one at a time.
+
+    Parameters
+    ----------
+    items : Iterable[str]
+        The strings to decode; see `decode_base32_int`.
+    width : int
+        The length every string must have.
+
+    Returns
+    -------
+    List[int]
+        The decoded values, in the order of `items`.
+
+    Raises
+    ------
+    ValueError
+        If a string is not `width` characters long or contains a character
+        outside the Crockford alphabet.
+    """
+    items = list(items)
+    for item in items:
+        if len(item) != width:
+            raise ValueError(f"Base32 string must be {width} characters long")
+    translated = "".join(items).translate(_CROCKFORD_TO_INT32)
+    if not (translated.isascii() and translated.isalnum()):
+        for item in items:
+            decode_base32_int(item)
+    return [
+        int(translated[offset : offset + width], 32)
+        for offset in range(0, len(translated), width)
+    ]
+
+
+def encode_base62_many(numbers: Iterable[int], width: int = 0) -> List[str]:
+    """Encodes every integer of `numbers` with `encode_base62`."""
+    pairs = BASE62_PAIRS
+    return [_encode_pairs(number, pairs, 62, width) for number in numbers]
+
+
+def decode_base62_many(items: Iterable[str]) -> List[int]:
+    """Decodes every string of `items` with `decode_base62`."""
+    return [decode_base62(item) for item in items]
+
+
+def encode_hex_many(items: Iterable[bytes]) -> List[str]:
+    """Encodes every byte string of `items` as hexadecimal."""
+    return [item.hex() for item in items]
+
+
+def decode_hex_many(items: Iterable[str]) -> List[bytes]:
+    """Decodes every string of `items` with `decode_hex`."""
+    return [decode_hex(item) for item in items]
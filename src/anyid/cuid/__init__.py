@@ -1,3 +1,3 @@
-from .generator import CuidGenerator, cuid
+from .generator import CuidGenerator, cuid, slug
 
-__all__ = ["CuidGenerator", "cuid"]
+__all__ = ["CuidGenerator", "cuid", "slug"]
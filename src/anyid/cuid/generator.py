@@ -1,11 +1,26 @@
-import time
 import os
-import secrets
-import socket
 import threading
+from typing import Iterator, List, Optional, Tuple
 
+from .. import _entropy, _fork, codec
+from .._sharding import CounterBlocks
+from ..clock import SYSTEM_CLOCK, Clock
+from ..stats import StatsMixin
 
-class CuidGenerator:
+# The number of values of a 4-character block, and of two of them.
+_BLOCK_VALUES = 36**4
+_TWO_BLOCK_VALUES = _BLOCK_VALUES**2
+
+
+def _block(value: int) -> str:
+    """Encodes a value below 36**4 as a zero-padded 4-character block."""
+    # Two lookups in the table of two-character base36 strings.
+    high, low = divmod(value, 1296)
+    pairs = codec.BASE36_PAIRS
+    return pairs[high] + pairs[low]
+
+
+class CuidGenerator(StatsMixin):
     """
     A generator for creating CUIDs.
 
@@ -26,18 +41,74 @@ class CuidGenerator:
         A lock for thread-safe counter increments.
     fingerprint : str
         A fingerprint of the host machine.
+    clock : Clock
+        The clock timestamps are read from.
     """
 
-    def __init__(self):
+    _stats_lock_attribute = "lock"
+
+    def __init__(self, sharded: bool = False, clock: Optional[Clock] = None):
         """
         Initializes the CUID generator.
+
+        Parameters
+        ----------
+        sharded : bool, optional
+            Give every thread its own block of counter values, so `generate`
+            only takes the lock once per block. This lets generation scale
+            across cores on free-threaded builds, but CUIDs from different
+            threads are no longer issued in counter order. Defaults to False.
+        clock : Clock, optional
+            The clock timestamps are read from. Defaults to the system clock.
         """
+        self.clock = clock if clock is not None else SYSTEM_CLOCK
         self.base = 36
         self.block_size = 4
         self.discrete_values = self.base**self.block_size
-        self.counter = secrets.randbelow(self.discrete_values)
+        self.counter = _entropy.randbelow(self.discrete_values)
         self.lock = threading.Lock()  # To ensure thread-safe counter increments.
         self.fingerprint = self._get_fingerprint()
+        self._blocks: Optional[CounterBlocks] = CounterBlocks() if sharded else None
+        # The last millisecond read and its base36 form, shared by every CUID
+        # of that millisecond.
+        self._timestamp_cache: Tuple[int, str] = (-1, "")
+        _fork.track(self)
+
+    def _after_fork(self) -> None:
+        """
+        Re-initializes per-process state in a forked child.
+
+        The fingerprint is recomputed from the child's PID and the counter is
+        reseeded, so the child's CUIDs cannot overlap with the parent's.
+        """
+        self.lock = threading.Lock()
+        self._instrument_lock()
+        self.counter = _entropy.randbelow(self.discrete_values)
+        self.fingerprint = self._get_fingerprint()
+        if self._blocks is not None:
+            self._blocks.reset()
+
+    def _reserve_counters(self, n: int) -> int:
+        """
+        Reserves `n` consecutive counter values.
+
+        Parameters
+        ----------
+        n : int
+            The number of counter values.
+
+        Returns
+        -------
+        int
+            The first reserved value. The others follow it modulo
+            `discrete_values`.
+        """
+        with self.lock:
+            start = self.counter
+            self.counter = (start + n) % self.discrete_values
+        if self.stats is not None:
+            self.stats.record_counter_wraps((start + n) // self.discrete_values)
+        return start
 
     def _pad(self, value: str, size: int) -> str:
         """
@@ -73,14 +144,7 @@ class CuidGenerator:
         str
             The base36-encoded string.
         """
-        if n == 0:
-            return "0"
-        chars = "0123456789abcdefghijklmnopqrstuvwxyz"
-        result = ""
-        while n > 0:
-            n, remainder = divmod(n, self.base)
-            result = chars[remainder] + result
-        return result
+        return codec.encode_base36(n)
 
     def _get_fingerprint(self) -> str:
         """
@@ -93,6 +157,8 @@ class CuidGenerator:
         str
             The machine fingerprint.
         """
+        import socket
+
         pid = os.getpid()
         hostname = socket.gethostname()
 
@@ -110,46 +176,208 @@ class CuidGenerator:
 
         return pad_pid + pad_host
 
+    def _next_counter(self) -> int:
+        """Returns the next counter value."""
+        if self._blocks is not None:
+            counter_val = (
+                self._blocks.next(self._reserve_counters) % self.discrete_values
+            )
+            if self.stats is not None:
+                self.stats.record_ids()
+        else:
+            # Increment the counter in a thread-safe way and wrap around if necessary
+            with self.lock:
+                counter_val = self.counter
+                self.counter = (self.counter + 1) % self.discrete_values
+            if self.stats is not None:
+                self.stats.record_ids()
+                if counter_val == self.discrete_values - 1:
+                    self.stats.record_counter_wraps()
+        return counter_val
+
+    def _timestamp(self) -> str:
+        """
+        Returns the current time in milliseconds in base36 (no padding).
+
+        The encoding is computed once per millisecond.
+        """
+        ms_time = self.clock.time_ns() // 1_000_000
+        cached = self._timestamp_cache
+        if cached[0] != ms_time:
+            cached = (ms_time, codec.encode_base36(ms_time))
+            self._timestamp_cache = cached
+        return cached[1]
+
     def generate(self) -> str:
         """
         Generates a new CUID string.
 
+        Both random blocks are cut from a single random value below 36**8,
+        which gives them the same distribution as two separate draws.
+
         Returns
         -------
         str
             A new, unique CUID string.
         """
-        # Increment the counter in a thread-safe way and wrap around if necessary
-        with self.lock:
-            counter_val = self.counter
-            self.counter = (self.counter + 1) % self.discrete_values
+        counter_val = self._next_counter()
+        random_high, random_low = divmod(
+            _entropy.randbelow(_TWO_BLOCK_VALUES), _BLOCK_VALUES
+        )
+        return "".join(
+            (
+                "c",  # The CUID prefix
+                self._timestamp(),
+                _block(counter_val),
+                self.fingerprint,
+                _block(random_high),
+                _block(random_low),
+            )
+        )
 
-        # Get the current time in milliseconds in base36 (no padding)
-        timestamp = self._to_base36(int(time.time() * 1000))
+    def slug(self) -> str:
+        """
+        Generates a new CUID slug.
 
-        # Pad the counter to block_size
-        counter_str = self._pad(self._to_base36(counter_val), self.block_size)
+        Slugs are 7 to 10 characters long, as in the reference implementation:
+        the last two characters of the timestamp, the last (up to) four of
+        the counter, the first and last characters of the fingerprint and two
+        random characters. They are much more likely to collide than CUIDs
+        and suit short, non-critical identifiers such as URL suffixes.
 
-        # Generate two random blocks, each padded to block_size
-        random_block1 = self._pad(
-            self._to_base36(secrets.randbelow(self.discrete_values)),
-            self.block_size,
-        )
-        random_block2 = self._pad(
-            self._to_base36(secrets.randbelow(self.discrete_values)),
-            self.block_size,
+        Returns
+        -------
+        str
+            A new CUID slug.
+        """
+        counter_val = self._next_counter()
+        return "".join(
+            (
+                self._timestamp()[-2:],
+                codec.encode_base36(counter_val)[-4:],
+                self.fingerprint[0],
+                self.fingerprint[-1],
+                codec.BASE36_PAIRS[_entropy.randbelow(1296)],
+            )
         )
 
-        # Assemble the CUID parts
-        parts = [
-            "c",  # The CUID prefix
-            timestamp,
-            counter_str,
-            self.fingerprint,
-            random_block1,
-            random_block2,
+    def generate_many(self, n: int) -> List[str]:
+        """
+        Generates `n` CUID strings in one batch.
+
+        The counter block is reserved with a single lock acquisition, the
+        clock is read once, and the random blocks of every CUID are drawn in
+        one request from the shared entropy pool. The counter values are
+        consecutive, exactly as with `n` calls of `generate`.
+
+        Parameters
+        ----------
+        n : int
+            The number of CUIDs to generate.
+
+        Returns
+        -------
+        List[str]
+            The new CUID strings, in counter order.
+
+        Raises
+        ------
+        ValueError
+            If `n` is negative.
+        """
+        if n < 0:
+            raise ValueError("The number of IDs must be non-negative.")
+
+        start = self._reserve_counters(n)
+        if self.stats is not None:
+            self.stats.record_ids(n)
+
+        prefix = "c" + self._timestamp()
+        randoms = _entropy.randbelow_many(self.discrete_values, 2 * n)
+        fingerprint, discrete_values = self.fingerprint, self.discrete_values
+
+        return [
+            "".join(
+                (
+                    prefix,
+                    _block((start + i) % discrete_values),
+                    fingerprint,
+                    _block(randoms[2 * i]),
+                    _block(randoms[2 * i + 1]),
+                )
+            )
+            for i in range(n)
+        ]
+
+    def slug_many(self, n: int) -> List[str]:
+        """
+        Generates `n` CUID slugs in one batch.
+
+        Like `generate_many`, the counter values are reserved at once, the
+        clock is read once and the random characters are drawn together.
+
+        Parameters
+        ----------
+        n : int
+            The number of slugs to generate.
+
+        Returns
+        -------
+        List[str]
+            The new slugs, in counter order.
+
+        Raises
+        ------
+        ValueError
+            If `n` is negative.
+        """
+        if n < 0:
+            raise ValueError("The number of IDs must be non-negative.")
+
+        start = self._reserve_counters(n)
+        if self.stats is not None:
+            self.stats.record_ids(n)
+
+        prefix = self._timestamp()[-2:]
+        suffix = self.fingerprint[0] + self.fingerprint[-1]
+        randoms = _entropy.randbelow_many(1296, n)
+        encode, discrete_values = codec.encode_base36, self.discrete_values
+        pairs = codec.BASE36_PAIRS
+        return [
+            "".join(
+                (
+                    prefix,
+                    encode((start + i) % discrete_values)[-4:],
+                    suffix,
+                    pairs[randoms[i]],
+                )
+            )
+            for i in range(n)
         ]
-        return "".join(parts)
+
+    def iter_ids(self, chunk_size: int = 1024) -> Iterator[str]:
+        """
+        Yields CUIDs forever, generating them `chunk_size` at a time.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            The number of CUIDs generated per batch. Defaults to 1024.
+
+        Yields
+        ------
+        str
+            A new, unique CUID string.
+
+        Raises
+        ------
+        ValueError
+            If `chunk_size` is less than 1.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        while True:
+            yield from self.generate_many(chunk_size)
 
 
 # Module-level singleton instance of CuidGenerator (lazy, thread-safe initialization)
@@ -157,6 +385,24 @@ _cuid_generator = None
 _cuid_generator_lock = threading.Lock()
 
 
+def _reset_after_fork() -> None:
+    global _cuid_generator_lock
+    _cuid_generator_lock = threading.Lock()
+
+
+_fork.register(_reset_after_fork)
+
+
+def _get_generator() -> CuidGenerator:
+    """Returns the module-level CuidGenerator, creating it on first use."""
+    global _cuid_generator
+    if _cuid_generator is None:
+        with _cuid_generator_lock:
+            if _cuid_generator is None:
+                _cuid_generator = CuidGenerator()
+    return _cuid_generator
+
+
 def cuid() -> str:
     """
     Generates a new CUID.
@@ -168,9 +414,18 @@ def cuid() -> str:
     str
         A new, unique CUID string.
     """
-    global _cuid_generator
-    if _cuid_generator is None:
-        with _cuid_generator_lock:
-            if _cuid_generator is None:
-                _cuid_generator = CuidGenerator()
-    return _cuid_generator.generate()
+    return _get_generator().generate()
+
+
+def slug() -> str:
+    """
+    Generates a new CUID slug; see `CuidGenerator.slug`.
+
+    This function uses the same module-level `CuidGenerator` as `cuid`.
+
+    Returns
+    -------
+    str
+        A new CUID slug.
+    """
+    return _get_generator().slug()
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import time
-import secrets
-from typing import Callable, Final, Optional
+import string
+import threading
+from typing import Callable, Final, Iterator, List, Optional
 
 from . import utils
-
+from .. import _entropy, _fork
+from ..clock import SYSTEM_CLOCK, Clock
+from ..stats import StatsMixin
 
 # ~22k hosts before 50% chance of initial counter collision
 # with a remaining counter range of 9.0e+15 in JavaScript.
@@ -16,12 +18,13 @@ _big_length = 32
 MAXIMUM_LENGTH = _big_length
 
 
-class Cuid2Generator:  # pylint: disable=too-few-public-methods
+class Cuid2Generator(StatsMixin):  # pylint: disable=too-few-public-methods
     def __init__(
         self: Cuid2Generator,
         counter: Callable[[int], Callable[[], int]] = utils.create_counter,
         length: int = _default_length,
         fingerprint: Callable[[], str] = utils.create_fingerprint,
+        clock: Optional[Clock] = None,
     ) -> None:
         """
         Initializes the Cuid2Generator class for generating CUIDs.
@@ -37,6 +40,8 @@ class Cuid2Generator:  # pylint: disable=too-few-public-methods
         fingerprint : "FingerprintCallable", optional
             A function that generates a machine fingerprint.
             Defaults to `utils.create_fingerprint`.
+        clock : Clock, optional
+            The clock timestamps are read from. Defaults to the system clock.
 
         Raises
         ------
@@ -47,9 +52,22 @@ class Cuid2Generator:  # pylint: disable=too-few-public-methods
             msg = f"Length must be between 2 and {MAXIMUM_LENGTH} (inclusive)."
             raise ValueError(msg)
 
-        self._counter: Callable[[], int] = counter(secrets.randbelow(INITIAL_COUNT_MAX))
+        self.clock = clock if clock is not None else SYSTEM_CLOCK
+        self._create_counter = counter
+        self._create_fingerprint = fingerprint
+        self._counter: Callable[[], int] = counter(
+            _entropy.randbelow(INITIAL_COUNT_MAX)
+        )
         self._length: int = length
         self._fingerprint: str = fingerprint()
+        _fork.track(self)
+
+    def _after_fork(self: Cuid2Generator) -> None:
+        """
+        Re-initializes the counter and fingerprint in a forked child.
+        """
+        self._counter = self._create_counter(_entropy.randbelow(INITIAL_COUNT_MAX))
+        self._fingerprint = self._create_fingerprint()
 
     def generate(self: Cuid2Generator, length: Optional[int] = None) -> str:
         """
@@ -77,24 +95,126 @@ class Cuid2Generator:  # pylint: disable=too-few-public-methods
             raise ValueError(msg)
 
         first_letter: str = utils.create_letter()
-        base36_time: str = utils.base36_encode(time.time_ns())
+        base36_time: str = utils.base36_encode(self.clock.time_ns())
         base36_count: str = utils.base36_encode(self._counter())
         salt: str = utils.create_entropy(length=length)
+        if self.stats is not None:
+            self.stats.record_ids()
         hash_input: str = base36_time + salt + base36_count + self._fingerprint
 
         return first_letter + utils.create_hash(hash_input)[1 : length or self._length]
 
+    def generate_many(
+        self: Cuid2Generator, n: int, length: Optional[int] = None
+    ) -> List[str]:
+        """
+        Generates `n` CUID strings in one batch.
+
+        The clock is read once for the whole batch and the first letters and
+        salts of every CUID are drawn in bulk from the shared entropy pool.
+        Each CUID still gets its own counter value and hash.
+
+        Parameters
+        ----------
+        n : int
+            The number of CUIDs to generate.
+        length : int, optional
+            The desired length of the CUIDs. If not provided, the length
+            specified during initialization is used.
+
+        Returns
+        -------
+        List[str]
+            The generated CUID strings.
+
+        Raises
+        ------
+        ValueError
+            If `n` is negative or the length is not between 2 and
+            `MAXIMUM_LENGTH`.
+        """
+        if n < 0:
+            raise ValueError("The number of IDs must be non-negative.")
+        length = length or self._length
+        if not (2 <= length <= MAXIMUM_LENGTH):
+            msg = f"Length must be between 2 and {MAXIMUM_LENGTH} (inclusive)."
+            raise ValueError(msg)
+
+        letters: str = string.ascii_lowercase
+        digits: str = string.digits + string.ascii_lowercase
+        base36_time: str = utils.base36_encode(self.clock.time_ns())
+        letter_values: List[int] = _entropy.randbelow_many(len(letters), n)
+        salt_values: List[int] = _entropy.randbelow_many(len(digits), n * length)
+        if self.stats is not None:
+            self.stats.record_ids(n)
+
+        ids: List[str] = []
+        for i in range(n):
+            first_letter: str = letters[letter_values[i]]
+            salt: str = "".join(
+                [digits[value] for value in salt_values[i * length : (i + 1) * length]]
+            )
+            base36_count: str = utils.base36_encode(self._counter())
+            hash_input: str = base36_time + salt + base36_count + self._fingerprint
+            ids.append(first_letter + utils.create_hash(hash_input)[1:length])
+        return ids
+
+    def iter_ids(
+        self: Cuid2Generator, chunk_size: int = 1024, length: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Yields CUIDs forever, generating them `chunk_size` at a time.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            The number of CUIDs generated per batch. Defaults to 1024.
+        length : int, optional
+            The desired length of the CUIDs. If not provided, the length
+            specified during initialization is used.
+
+        Yields
+        ------
+        str
+            A generated CUID string.
+
+        Raises
+        ------
+        ValueError
+            If `chunk_size` is less than 1.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        while True:
+            yield from self.generate_many(chunk_size, length=length)
+
+
+# Module-level singleton instance of Cuid2Generator (lazy, thread-safe initialization)
+_cuid2_generator: Optional[Cuid2Generator] = None
+_cuid2_generator_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    global _cuid2_generator_lock
+    _cuid2_generator_lock = threading.Lock()
+
 
-_cuid2_generator = Cuid2Generator()
+_fork.register(_reset_after_fork)
 
 
 def cuid2() -> str:
     """
     Generates a new CUID2.
-    This function uses a module-level singleton instance of `Cuid2Generator`.
+    This function uses a module-level singleton instance of `Cuid2Generator`,
+    which is created (and its fingerprint hashed) on first use.
     Returns
     -------
     str
         A new, unique CUID2 string.
     """
+    global _cuid2_generator
+    if _cuid2_generator is None:
+        with _cuid2_generator_lock:
+            if _cuid2_generator is None:
+                _cuid2_generator = Cuid2Generator()
     return _cuid2_generator.generate()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 import string
+import threading
 from typing import TYPE_CHECKING, Callable, Final, Optional
-import secrets
+
+from .. import _entropy, _fork, codec
 
 try:
     from hashlib import sha3_512 as sha512
@@ -24,7 +26,7 @@ if TYPE_CHECKING:
 
 def create_counter(count: int) -> Callable[[], int]:
     """
-    Creates a counter function.
+    Creates a thread-safe counter function.
 
     Parameters
     ----------
@@ -37,10 +39,16 @@ def create_counter(count: int) -> Callable[[], int]:
         A function that returns an incremented value each time it is called.
     """
 
+    # `count += 1` is a separate read and write, so without the lock two
+    # threads could return the same value; on free-threaded builds this
+    # happens readily.
+    lock = threading.Lock()
+
     def counter() -> int:
         nonlocal count
-        count += 1
-        return count
+        with lock:
+            count += 1
+            return count
 
     return counter
 
@@ -48,6 +56,15 @@ def create_counter(count: int) -> Callable[[], int]:
 _process_fingerprint: Optional[str] = None
 
 
+def _reset_after_fork() -> None:
+    # A forked child is a different process and gets its own fingerprint.
+    global _process_fingerprint
+    _process_fingerprint = None
+
+
+_fork.register(_reset_after_fork)
+
+
 def create_fingerprint(fingerprint_data: Optional[str] = None) -> str:
     """
     Creates a machine fingerprint.
@@ -71,7 +88,7 @@ def create_fingerprint(fingerprint_data: Optional[str] = None) -> str:
 
     if not fingerprint_data:
         if _process_fingerprint is None:
-            _process_fingerprint = create_hash(secrets.token_hex(BIG_LENGTH))[
+            _process_fingerprint = create_hash(_entropy.token_bytes(BIG_LENGTH).hex())[
                 :BIG_LENGTH
             ]
         return _process_fingerprint
@@ -104,11 +121,9 @@ def create_entropy(length: int = 4) -> str:
         msg = "Cannot create entropy without a length >= 1."
         raise ValueError(msg)
 
-    # TODO: make more readable
-    entropy: str = ""
-    while len(entropy) < length:
-        entropy += base36_encode(secrets.randbelow(36))
-    return entropy
+    alphabet: str = string.digits + string.ascii_lowercase
+    values = _entropy.randbelow_many(len(alphabet), length)
+    return "".join([alphabet[value] for value in values])
 
 
 def create_hash(data: str) -> str:
@@ -145,7 +160,7 @@ def create_letter() -> str:
         A single random lowercase letter.
     """
     alphabet: str = string.ascii_lowercase
-    return secrets.choice(alphabet)
+    return _entropy.choice(alphabet)
 
 
 def base36_encode(number: int) -> str:
@@ -167,16 +182,4 @@ def base36_encode(number: int) -> str:
     ValueError
         If the input number is negative.
     """
-    if number < 0:
-        msg = "Cannot encode negative integers."
-        raise ValueError(msg)
-
-    encoded_string: str = ""
-    alphabet: str = string.digits + string.ascii_lowercase
-    alphabet_length: int = len(alphabet)
-
-    while number != 0:
-        number, mod = divmod(number, alphabet_length)
-        encoded_string = alphabet[mod] + encoded_string
-
-    return encoded_string or "0"
+    return codec.encode_base36(number)
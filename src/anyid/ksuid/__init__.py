@@ -1,3 +1,3 @@
-from .generator import KsuidGenerator, ksuid
+from .generator import Ksuid, KsuidGenerator, format_many, ksuid, parse_many
 
-__all__ = ["KsuidGenerator", "ksuid"]
+__all__ = ["Ksuid", "KsuidGenerator", "ksuid", "parse_many", "format_many"]
@@ -1,14 +1,23 @@
-import datetime
-import secrets
-import time
+import threading
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List, Optional, Tuple
+
+from .. import _entropy, _fork, codec
+from ..clock import SYSTEM_CLOCK, Clock
+from ..stats import StatsMixin
+
+if TYPE_CHECKING:
+    import datetime
 
 # KSUID's epoch is 2015-03-09T00:00:00Z
-KSUID_EPOCH_DATETIME = datetime.datetime(2015, 3, 9, tzinfo=datetime.timezone.utc)
-KSUID_EPOCH = int(KSUID_EPOCH_DATETIME.timestamp())
+KSUID_EPOCH = 1425859200
 PAYLOAD_BYTES = 16
 TIMESTAMP_BYTES = 4
+KSUID_BYTES = TIMESTAMP_BYTES + PAYLOAD_BYTES
+# Every KSUID string has this many characters.
+KSUID_STRING_LENGTH = 27
+MAX_PAYLOAD = (1 << (PAYLOAD_BYTES * 8)) - 1
 
-BASE62_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+BASE62_ALPHABET = codec.BASE62_ALPHABET
 
 
 def base62_encode(number: int, length: int) -> str:
@@ -23,19 +32,58 @@ def base62_encode(number: int, length: int) -> str:
     Returns:
         The Base62 encoded string.
     """
-    if number == 0:
-        return BASE62_ALPHABET[0] * length
+    return codec.encode_base62(number, length)
+
+
+def base62_decode(encoded: str) -> int:
+    """
+    Decodes a Base62 string, as produced by `base62_encode`.
+
+    Args:
+        encoded: The Base62 string. Decoding is case-sensitive.
+
+    Returns:
+        The decoded integer.
+
+    Raises:
+        ValueError: If the string is empty or contains a character outside
+                    the Base62 alphabet.
+    """
+    return codec.decode_base62(encoded)
+
+
+def _decode_ksuid_string(encoded: str) -> bytes:
+    """Decodes and validates the 27-character form of a KSUID."""
+    if not isinstance(encoded, str) or len(encoded) != KSUID_STRING_LENGTH:
+        raise ValueError(
+            f"KSUID string must be {KSUID_STRING_LENGTH} Base62 characters."
+        )
+    number = codec.decode_base62(encoded)
+    if number >> (KSUID_BYTES * 8):
+        raise ValueError(f"KSUID string does not fit in {KSUID_BYTES} bytes.")
+    return number.to_bytes(KSUID_BYTES, "big")
+
 
-    encoded = ""
-    while number > 0:
-        number, remainder = divmod(number, 62)
-        encoded = BASE62_ALPHABET[remainder] + encoded
+def __getattr__(name: str) -> Any:
+    # The datetime form of the epoch is built on demand so that importing this
+    # module does not import `datetime`.
+    if name == "KSUID_EPOCH_DATETIME":
+        import datetime
 
-    return encoded.zfill(length)
+        return datetime.datetime.fromtimestamp(KSUID_EPOCH, tz=datetime.timezone.utc)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Ksuid:
-    """Represents a K-Sortable Unique ID."""
+    """
+    Represents a K-Sortable Unique ID.
+
+    Instances are immutable. The 20-byte form is stored once and the string
+    form is computed on first use, so comparing, hashing and printing the
+    same KSUID repeatedly is cheap.
+    """
+
+    __slots__ = ("_bytes", "_str")
 
     def __init__(self, timestamp: int, payload: bytes):
         """
@@ -46,45 +94,185 @@ class Ksuid:
             payload: A 16-byte random payload.
 
         Raises:
-            ValueError: If the timestamp is not a non-negative integer or if the
-                        payload is not a 16-byte string.
+            ValueError: If the timestamp is not a non-negative integer that
+                        fits in 4 bytes, or if the payload is not a 16-byte
+                        string.
         """
-        if not isinstance(timestamp, int) or timestamp < 0:
+        if (
+            not isinstance(timestamp, int)
+            or timestamp < 0
+            or timestamp >= 1 << (TIMESTAMP_BYTES * 8)
+        ):
             raise ValueError("Timestamp must be a non-negative integer.")
         if not isinstance(payload, bytes) or len(payload) != PAYLOAD_BYTES:
             raise ValueError(
                 f"Payload must be a byte string of length {PAYLOAD_BYTES}."
             )
-        self.timestamp = timestamp
-        self.payload = payload
+        self._bytes: bytes = timestamp.to_bytes(TIMESTAMP_BYTES, "big") + payload
+        self._str: Optional[str] = None
+
+    @classmethod
+    def _from_valid_bytes(cls, data: bytes) -> "Ksuid":
+        """Builds a KSUID from 20 bytes known to be valid, skipping checks."""
+        ksuid = cls.__new__(cls)
+        ksuid._bytes = data
+        ksuid._str = None
+        return ksuid
+
+    @classmethod
+    def parse(cls, encoded: str) -> "Ksuid":
+        """
+        Parses the 27-character string form of a KSUID.
+
+        Args:
+            encoded: The Base62 string, as returned by `str(ksuid)`.
+
+        Returns:
+            The parsed Ksuid object.
+
+        Raises:
+            ValueError: If the string does not have 27 characters, contains a
+                        character outside the Base62 alphabet or encodes a
+                        value that does not fit in 20 bytes.
+        """
+        ksuid = cls._from_valid_bytes(_decode_ksuid_string(encoded))
+        ksuid._str = encoded
+        return ksuid
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Ksuid":
+        """
+        Creates a KSUID from its 20-byte form.
+
+        Args:
+            data: The 4-byte big-endian timestamp followed by the payload, as
+                  returned by `to_bytes`.
+
+        Returns:
+            The Ksuid object.
+
+        Raises:
+            ValueError: If `data` is not 20 bytes long.
+        """
+        if len(data) != KSUID_BYTES:
+            raise ValueError(f"KSUID must be {KSUID_BYTES} bytes.")
+        return cls._from_valid_bytes(bytes(data))
+
+    @property
+    def timestamp(self) -> int:
+        """The seconds since the KSUID epoch."""
+        return int.from_bytes(self._bytes[:TIMESTAMP_BYTES], "big")
+
+    @property
+    def datetime(self) -> "datetime.datetime":
+        """The creation time as a timezone-aware UTC datetime."""
+        import datetime
+
+        return datetime.datetime.fromtimestamp(
+            KSUID_EPOCH + self.timestamp, tz=datetime.timezone.utc
+        )
+
+    @property
+    def payload(self) -> bytes:
+        """The 16-byte random payload."""
+        return self._bytes[TIMESTAMP_BYTES:]
 
     def __str__(self) -> str:
         """Returns the 27-character string representation of the KSUID."""
-        combined_int = int.from_bytes(self.to_bytes(), "big")
-        return base62_encode(combined_int, 27)
+        if self._str is None:
+            self._str = codec.encode_base62(
+                int.from_bytes(self._bytes, "big"), KSUID_STRING_LENGTH
+            )
+        return self._str
 
     def to_bytes(self) -> bytes:
         """Returns the 20-byte representation of the KSUID."""
-        return self.timestamp.to_bytes(TIMESTAMP_BYTES, "big") + self.payload
+        return self._bytes
 
     def __repr__(self) -> str:
         """Returns a developer-friendly representation of the KSUID."""
         return f"Ksuid(timestamp={self.timestamp}, payload={self.payload.hex()})"
 
-    def __lt__(self, other):
+    def __hash__(self) -> int:
+        """Returns a hash consistent with equality."""
+        return hash(self._bytes)
+
+    def __eq__(self, other: object) -> bool:
+        """Checks if this KSUID is equal to another."""
+        if not isinstance(other, Ksuid):
+            return NotImplemented
+        return self._bytes == other._bytes
+
+    def __lt__(self, other: "Ksuid") -> bool:
         """Compares this KSUID with another for sorting."""
         if not isinstance(other, Ksuid):
             return NotImplemented
-        return self.to_bytes() < other.to_bytes()
+        return self._bytes < other._bytes
 
-    def __eq__(self, other):
-        """Checks if this KSUID is equal to another."""
+    def __le__(self, other: "Ksuid") -> bool:
+        """Checks if this KSUID sorts before or equal to another."""
         if not isinstance(other, Ksuid):
             return NotImplemented
-        return self.to_bytes() == other.to_bytes()
+        return self._bytes <= other._bytes
+
+    def __gt__(self, other: "Ksuid") -> bool:
+        """Checks if this KSUID sorts after another."""
+        if not isinstance(other, Ksuid):
+            return NotImplemented
+        return self._bytes > other._bytes
+
+    def __ge__(self, other: "Ksuid") -> bool:
+        """Checks if this KSUID sorts after or equal to another."""
+        if not isinstance(other, Ksuid):
+            return NotImplemented
+        return self._bytes >= other._bytes
+
 
+def parse_many(items: Iterable[str]) -> List[Ksuid]:
+    """
+    Parses many KSUID strings at once.
+
+    Args:
+        items: The 27-character KSUID strings.
+
+    Returns:
+        The parsed Ksuid objects, in the order of `items`.
+
+    Raises:
+        ValueError: If a string is not a valid KSUID; see `Ksuid.parse`.
+    """
+    from_bytes = Ksuid._from_valid_bytes
+    ksuids: List[Ksuid] = []
+    for encoded in items:
+        ksuid = from_bytes(_decode_ksuid_string(encoded))
+        ksuid._str = encoded
+        ksuids.append(ksuid)
+    return ksuids
 
-class KsuidGenerator:
+
+def format_many(ksuids: Iterable[Ksuid]) -> List[str]:
+    """
+    Returns the string forms of many KSUIDs at once.
+
+    The strings are cached on the Ksuid objects, as by `str(ksuid)`.
+
+    Args:
+        ksuids: The Ksuid objects.
+
+    Returns:
+        Their 27-character strings, in order.
+    """
+    ksuids = list(ksuids)
+    encoded = codec.encode_base62_many(
+        [int.from_bytes(ksuid._bytes, "big") for ksuid in ksuids],
+        KSUID_STRING_LENGTH,
+    )
+    for ksuid, string in zip(ksuids, encoded):
+        ksuid._str = string
+    return encoded
+
+
+class KsuidGenerator(StatsMixin):
     """
     A generator for creating K-Sortable Unique IDs (KSUIDs).
 
@@ -92,12 +280,81 @@ class KsuidGenerator:
     were created. This class provides a simple interface for generating
     KSUID objects.
 
+    In monotonic mode, KSUIDs from one generator are strictly increasing,
+    like segmentio's ``ksuid.Sequence``: the first KSUID of each second gets
+    a random payload and every further one the previous payload plus one.
+
     Usage:
         >>> generator = KsuidGenerator()
         >>> ksuid = generator.generate()
         >>> print(ksuid)
     """
 
+    _stats_lock_attribute = "_lock"
+
+    def __init__(self, clock: Optional[Clock] = None, monotonic: bool = False):
+        """
+        Initializes a new KsuidGenerator.
+
+        Args:
+            clock: The clock timestamps are read from. Defaults to the
+                   system clock.
+            monotonic: Derive the payloads of each second from a random base
+                       plus a counter, so that KSUIDs of the same second sort
+                       in creation order (which keeps B-tree inserts local).
+                       The base has its top bit cleared, leaving room for
+                       2**127 KSUIDs per second; should it still run out,
+                       the sequence moves on to the next second. Defaults to
+                       False.
+        """
+        self.clock = clock if clock is not None else SYSTEM_CLOCK
+        self.monotonic = monotonic
+        # The last timestamp and payload issued in monotonic mode.
+        self._last_timestamp = -1
+        self._last_payload = 0
+        self._lock = threading.Lock()
+        _fork.track(self)
+
+    def _after_fork(self) -> None:
+        """
+        Re-initializes the monotonic state in a forked child.
+
+        Otherwise parent and child would continue the same sequence and
+        produce identical KSUIDs.
+        """
+        self._lock = threading.Lock()
+        self._instrument_lock()
+        self._last_timestamp = -1
+        self._last_payload = 0
+
+    def _claim(self, n: int) -> Tuple[int, int]:
+        """
+        Claims `n` consecutive payloads in monotonic mode.
+
+        Args:
+            n: The number of payloads to claim.
+
+        Returns:
+            The timestamp and the first payload, as integers.
+        """
+        with self._lock:
+            timestamp = self.clock.time_ns() // 1_000_000_000 - KSUID_EPOCH
+            if timestamp <= self._last_timestamp:
+                # Same second, or the clock is behind KSUIDs already issued:
+                # continue the sequence.
+                timestamp = self._last_timestamp
+                start = self._last_payload + 1
+            else:
+                start = int.from_bytes(_entropy.token_bytes(PAYLOAD_BYTES), "big") >> 1
+            if start + n - 1 > MAX_PAYLOAD:
+                timestamp += 1
+                start = int.from_bytes(_entropy.token_bytes(PAYLOAD_BYTES), "big") >> 1
+            self._last_timestamp = timestamp
+            self._last_payload = start + n - 1
+        if self.stats is not None:
+            self.stats.record_ids(n)
+        return timestamp, start
+
     def generate(self) -> Ksuid:
         """
         Generates a new KSUID object.
@@ -114,11 +371,77 @@ class KsuidGenerator:
             >>> isinstance(new_ksuid, Ksuid)
             True
         """
-        current_time = int(time.time())
-        timestamp = current_time - KSUID_EPOCH
-        payload = secrets.token_bytes(PAYLOAD_BYTES)
+        if self.monotonic:
+            timestamp, payload_int = self._claim(1)
+            return Ksuid._from_valid_bytes(
+                timestamp.to_bytes(TIMESTAMP_BYTES, "big")
+                + payload_int.to_bytes(PAYLOAD_BYTES, "big")
+            )
+        timestamp = self.clock.time_ns() // 1_000_000_000 - KSUID_EPOCH
+        payload = _entropy.token_bytes(PAYLOAD_BYTES)
+        if self.stats is not None:
+            self.stats.record_ids()
         return Ksuid(timestamp=timestamp, payload=payload)
 
+    def generate_many(self, n: int) -> List[Ksuid]:
+        """
+        Generates `n` KSUID objects in one batch.
+
+        The clock is read once and the payloads of every KSUID are drawn in
+        one request from the shared entropy pool. In monotonic mode, the
+        payloads are claimed under a single lock acquisition instead and the
+        KSUIDs are returned in increasing order.
+
+        Args:
+            n: The number of KSUIDs to generate.
+
+        Returns:
+            A list of new KSUID objects.
+
+        Raises:
+            ValueError: If `n` is negative.
+        """
+        if n < 0:
+            raise ValueError("The number of IDs must be non-negative.")
+        if self.monotonic:
+            if n == 0:
+                return []
+            timestamp, start = self._claim(n)
+            prefix = timestamp.to_bytes(TIMESTAMP_BYTES, "big")
+            from_bytes = Ksuid._from_valid_bytes
+            return [
+                from_bytes(prefix + payload.to_bytes(PAYLOAD_BYTES, "big"))
+                for payload in range(start, start + n)
+            ]
+        timestamp = self.clock.time_ns() // 1_000_000_000 - KSUID_EPOCH
+        payloads = _entropy.token_bytes(PAYLOAD_BYTES * n)
+        if self.stats is not None:
+            self.stats.record_ids(n)
+        prefix = timestamp.to_bytes(TIMESTAMP_BYTES, "big")
+        from_bytes = Ksuid._from_valid_bytes
+        return [
+            from_bytes(prefix + payloads[i : i + PAYLOAD_BYTES])
+            for i in range(0, PAYLOAD_BYTES * n, PAYLOAD_BYTES)
+        ]
+
+    def iter_ids(self, chunk_size: int = 1024) -> Iterator[Ksuid]:
+        """
+        Yields KSUIDs forever, generating them `chunk_size` at a time.
+
+        Args:
+            chunk_size: The number of KSUIDs generated per batch.
+
+        Yields:
+            A new KSUID object.
+
+        Raises:
+            ValueError: If `chunk_size` is less than 1.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        while True:
+            yield from self.generate_many(chunk_size)
+
 
 _ksuid_generator = KsuidGenerator()
 
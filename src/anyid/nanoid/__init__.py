@@ -1,3 +1,3 @@
-from .generator import NanoidGenerator, nanoid
+from .generator import CustomAlphabetGenerator, NanoidGenerator, custom_alphabet, nanoid
 
-__all__ = ["NanoidGenerator", "nanoid"]
+__all__ = ["NanoidGenerator", "nanoid", "CustomAlphabetGenerator", "custom_alphabet"]
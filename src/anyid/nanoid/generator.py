@@ -1,12 +1,117 @@
-import secrets
+from typing import Callable, Dict, Iterator, List, Optional
 
+from .. import _entropy
+from ..stats import StatsMixin
 
-class NanoidGenerator:
+DEFAULT_SIZE = 21
+DEFAULT_ALPHABET = "_~0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+class _Alphabet:
+    """
+    An alphabet prepared for the NanoID algorithm.
+
+    Random bytes are masked to the smallest power of two that covers the
+    alphabet and values beyond its end are rejected, which is exactly
+    uniform. For ASCII alphabets of up to 256 characters the masking, the
+    rejection and the lookup are a single `bytes.translate` call over a
+    whole block of random bytes; an alphabet of a power-of-two size (such as
+    the 64-character default) rejects nothing and needs one draw per ID.
+    """
+
+    __slots__ = ("alphabet", "_table", "_delete", "_mask")
+
+    def __init__(self, alphabet: str):
+        if not alphabet:
+            raise ValueError("Alphabet must not be empty.")
+        self.alphabet = alphabet
+        length = len(alphabet)
+        self._mask = (1 << (length - 1).bit_length()) - 1
+        self._table: Optional[bytes] = None
+        self._delete = b""
+        if length <= 256 and alphabet.isascii():
+            encoded = alphabet.encode("ascii")
+            mask = self._mask
+            # Rejected bytes are deleted before translation, so their
+            # entries in the table are never used.
+            self._table = bytes(
+                [
+                    encoded[byte & mask] if byte & mask < length else 0
+                    for byte in range(256)
+                ]
+            )
+            self._delete = bytes([byte for byte in range(256) if byte & mask >= length])
+
+    def chars(self, count: int, token_bytes: Callable[[int], bytes]) -> str:
+        """
+        Returns `count` random characters of the alphabet.
+
+        Args:
+            count: The number of characters.
+            token_bytes: The source of random bytes.
+
+        Returns:
+            The characters.
+        """
+        if count <= 0:
+            return ""
+        table = self._table
+        if table is None:
+            return self._chars_slow(count, token_bytes)
+        delete = self._delete
+        if not delete:
+            return token_bytes(count).translate(table).decode("ascii")
+
+        length = len(self.alphabet)
+        chars = b""
+        while len(chars) < count:
+            missing = count - len(chars)
+            # Over-draw by the expected rejection rate so one read usually
+            # suffices.
+            draw = missing * (self._mask + 1) // length + 8
+            chars += token_bytes(draw).translate(table, delete)
+        return chars[:count].decode("ascii")
+
+    def _chars_slow(self, count: int, token_bytes: Callable[[int], bytes]) -> str:
+        """`chars` for alphabets that are not ASCII or are longer than 256."""
+        alphabet, length, mask = self.alphabet, len(self.alphabet), self._mask
+        chars: List[str] = []
+        while len(chars) < count:
+            draw = (count - len(chars)) * (mask + 1) // length + 8
+            words = memoryview(token_bytes(4 * draw)).cast("I")
+            chars.extend(
+                [
+                    alphabet[value]
+                    for value in (word & mask for word in words)
+                    if value < length
+                ]
+            )
+        return "".join(chars[:count])
+
+
+# Prepared alphabets of `NanoidGenerator`, keyed by the alphabet.
+_ALPHABETS: Dict[str, _Alphabet] = {}
+_MAX_CACHED_ALPHABETS = 64
+
+
+def _prepare(alphabet: str) -> _Alphabet:
+    """Returns the prepared form of `alphabet`, cached."""
+    prepared = _ALPHABETS.get(alphabet)
+    if prepared is None:
+        prepared = _Alphabet(alphabet)
+        if len(_ALPHABETS) >= _MAX_CACHED_ALPHABETS:
+            _ALPHABETS.clear()
+        _ALPHABETS[alphabet] = prepared
+    return prepared
+
+
+class NanoidGenerator(StatsMixin):
     """
     A generator for creating cryptographically secure, URL-friendly unique IDs.
 
-    This implementation uses Python's `secrets` module to ensure that the
-    generated IDs are suitable for security-sensitive applications.
+    This implementation draws from anyid's shared pool of bytes read from
+    the operating system's CSPRNG, so the generated IDs are suitable for
+    security-sensitive applications.
 
     Usage:
         >>> generator = NanoidGenerator()
@@ -17,8 +122,8 @@ class NanoidGenerator:
 
     def generate(
         self,
-        size: int = 21,
-        alphabet: str = "_~0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ",
+        size: int = DEFAULT_SIZE,
+        alphabet: str = DEFAULT_ALPHABET,
     ) -> str:
         """
         Generates a new NanoID with a custom size and alphabet.
@@ -39,15 +144,185 @@ class NanoidGenerator:
             >>> custom_id.isdigit()
             True
         """
-        return "".join(secrets.choice(alphabet) for _ in range(size))
+        if self.stats is not None:
+            self.stats.record_ids()
+        return _prepare(alphabet).chars(size, _entropy.token_bytes)
+
+    def generate_many(
+        self,
+        n: int,
+        size: int = DEFAULT_SIZE,
+        alphabet: str = DEFAULT_ALPHABET,
+    ) -> List[str]:
+        """
+        Generates `n` NanoIDs in one batch.
+
+        The characters of every ID are drawn in one request from the shared
+        entropy pool.
+
+        Args:
+            n: The number of IDs to generate.
+            size: The desired length of each ID. Defaults to 21.
+            alphabet: The set of characters to use for generating the IDs.
+                      Defaults to a URL-friendly set.
+
+        Returns:
+            A list of new, unique NanoID strings.
+
+        Raises:
+            ValueError: If `n` is negative.
+        """
+        if n < 0:
+            raise ValueError("The number of IDs must be non-negative.")
+        if self.stats is not None:
+            self.stats.record_ids(n)
+        chars = _prepare(alphabet).chars(n * size, _entropy.token_bytes)
+        return [chars[i * size : (i + 1) * size] for i in range(n)]
+
+    def iter_ids(
+        self,
+        chunk_size: int = 1024,
+        size: int = DEFAULT_SIZE,
+        alphabet: str = DEFAULT_ALPHABET,
+    ) -> Iterator[str]:
+        """
+        Yields NanoIDs forever, generating them `chunk_size` at a time.
+
+        Args:
+            chunk_size: The number of IDs generated per batch.
+            size: The desired length of each ID. Defaults to 21.
+            alphabet: The set of characters to use for generating the IDs.
+                      Defaults to a URL-friendly set.
+
+        Yields:
+            A new, unique NanoID string.
+
+        Raises:
+            ValueError: If `chunk_size` is less than 1.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        while True:
+            yield from self.generate_many(chunk_size, size=size, alphabet=alphabet)
+
+
+class CustomAlphabetGenerator(StatsMixin):
+    """
+    A NanoID generator bound to one alphabet and size.
+
+    The mask, the block size and the lookup table are computed once, when the
+    generator is created. Create instances with `custom_alphabet`. Calling
+    the generator is the same as calling `generate`.
+
+    Usage:
+        >>> hex_id = custom_alphabet("0123456789abcdef", 12)
+        >>> len(hex_id())
+        12
+    """
+
+    def __init__(self, alphabet: str, size: int = DEFAULT_SIZE):
+        """
+        Prepares the alphabet.
+
+        Args:
+            alphabet: The set of characters to use for generating the IDs.
+            size: The default length of the IDs. Defaults to 21.
+
+        Raises:
+            ValueError: If the alphabet is empty or `size` is negative.
+        """
+        if size < 0:
+            raise ValueError("Size must be non-negative.")
+        self._alphabet = _Alphabet(alphabet)
+        self.alphabet = alphabet
+        self.size = size
+
+    def generate(self, size: Optional[int] = None) -> str:
+        """
+        Generates a new NanoID.
+
+        Args:
+            size: The length of the ID. Defaults to the generator's size.
+
+        Returns:
+            A new, unique NanoID string.
+        """
+        if self.stats is not None:
+            self.stats.record_ids()
+        return self._alphabet.chars(
+            self.size if size is None else size, _entropy.token_bytes
+        )
+
+    __call__ = generate
+
+    def generate_many(self, n: int, size: Optional[int] = None) -> List[str]:
+        """
+        Generates `n` NanoIDs in one batch, from one block of random bytes.
+
+        Args:
+            n: The number of IDs to generate.
+            size: The length of each ID. Defaults to the generator's size.
+
+        Returns:
+            A list of new, unique NanoID strings.
+
+        Raises:
+            ValueError: If `n` is negative.
+        """
+        if n < 0:
+            raise ValueError("The number of IDs must be non-negative.")
+        if size is None:
+            size = self.size
+        if self.stats is not None:
+            self.stats.record_ids(n)
+        chars = self._alphabet.chars(n * size, _entropy.token_bytes)
+        return [chars[i * size : (i + 1) * size] for i in range(n)]
+
+    def iter_ids(self, chunk_size: int = 1024) -> Iterator[str]:
+        """
+        Yields NanoIDs forever, generating them `chunk_size` at a time.
+
+        Args:
+            chunk_size: The number of IDs generated per batch.
+
+        Yields:
+            A new, unique NanoID string.
+
+        Raises:
+            ValueError: If `chunk_size` is less than 1.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        while True:
+            yield from self.generate_many(chunk_size)
+
+    def __repr__(self) -> str:
+        return f"CustomAlphabetGenerator(alphabet={self.alphabet!r}, size={self.size})"
+
+
+def custom_alphabet(alphabet: str, size: int = DEFAULT_SIZE) -> CustomAlphabetGenerator:
+    """
+    Returns a fast NanoID generator for a fixed alphabet and size.
+
+    Args:
+        alphabet: The set of characters to use for generating the IDs.
+        size: The default length of the IDs. Defaults to 21.
+
+    Returns:
+        The generator; call it to generate an ID.
+
+    Raises:
+        ValueError: If the alphabet is empty or `size` is negative.
+    """
+    return CustomAlphabetGenerator(alphabet, size)
 
 
 _nanoid_generator = NanoidGenerator()
 
 
 def nanoid(
-    size: int = 21,
-    alphabet: str = "_~0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    size: int = DEFAULT_SIZE,
+    alphabet: str = DEFAULT_ALPHABET,
 ) -> str:
     """
     Generates a new NanoID with a custom size and alphabet.
@@ -0,0 +1,161 @@
+"""
+Fast NanoIDs from a non-cryptographic random number generator.
+
+NOT FOR SECRETS. The IDs here come from `random.Random`, a Mersenne Twister
+whose output can be predicted from a few hundred observed values. Use them
+only where nobody gains anything by guessing an ID: test fixtures, synthetic
+load data, internal correlation IDs. Session tokens, API keys, password reset
+links and every other ID that grants access must come from `anyid.nanoid`.
+
+In exchange, generation skips the operating system's CSPRNG, and a seeded
+generator produces the same IDs on every run:
+
+    >>> from anyid.nanoid.non_secure import NonSecureNanoidGenerator
+    >>> fixtures = NonSecureNanoidGenerator(seed=42)
+    >>> ids = fixtures.generate_many(1000)
+
+IDs use the same alphabets, sizes and (masked, rejection-sampled) algorithm
+as `anyid.nanoid`.
+"""
+
+import random
+from typing import Any, Iterator, List, Optional
+
+from .. import _fork
+from ..stats import StatsMixin
+from .generator import DEFAULT_ALPHABET, DEFAULT_SIZE, _prepare
+
+
+class NonSecureNanoidGenerator(StatsMixin):
+    """
+    A NanoID generator backed by a seedable, non-cryptographic `random.Random`.
+
+    The IDs are predictable and must never be used as secrets; see the module
+    documentation.
+
+    Usage:
+        >>> generator = NonSecureNanoidGenerator(seed=1)
+        >>> len(generator.generate())
+        21
+    """
+
+    def __init__(self, seed: Optional[Any] = None):
+        """
+        Initializes the generator.
+
+        Args:
+            seed: The seed of the random number generator, e.g. an int.
+                  Generators with the same seed produce the same IDs.
+                  Defaults to None, which seeds from the operating system;
+                  unseeded generators are then reseeded in forked children
+                  so that parent and child do not repeat each other.
+        """
+        self.seed = seed
+        self._random = random.Random(seed)
+        _fork.track(self)
+
+    def _after_fork(self) -> None:
+        """Reseeds an unseeded generator in a forked child."""
+        if self.seed is None:
+            self._random.seed()
+
+    def _token_bytes(self, n: int) -> bytes:
+        """Returns `n` bytes from the non-cryptographic generator."""
+        return self._random.getrandbits(8 * n).to_bytes(n, "little") if n else b""
+
+    def generate(
+        self,
+        size: int = DEFAULT_SIZE,
+        alphabet: str = DEFAULT_ALPHABET,
+    ) -> str:
+        """
+        Generates a new, predictable NanoID.
+
+        Args:
+            size: The desired length of the ID. Defaults to 21.
+            alphabet: The set of characters to use for generating the ID.
+                      Defaults to a URL-friendly set.
+
+        Returns:
+            A new NanoID string.
+        """
+        if self.stats is not None:
+            self.stats.record_ids()
+        return _prepare(alphabet).chars(size, self._token_bytes)
+
+    def generate_many(
+        self,
+        n: int,
+        size: int = DEFAULT_SIZE,
+        alphabet: str = DEFAULT_ALPHABET,
+    ) -> List[str]:
+        """
+        Generates `n` predictable NanoIDs in one batch.
+
+        Args:
+            n: The number of IDs to generate.
+            size: The desired length of each ID. Defaults to 21.
+            alphabet: The set of characters to use for generating the IDs.
+                      Defaults to a URL-friendly set.
+
+        Returns:
+            A list of new NanoID strings.
+
+        Raises:
+            ValueError: If `n` is negative.
+        """
+        if n < 0:
+            raise ValueError("The number of IDs must be non-negative.")
+        if self.stats is not None:
+            self.stats.record_ids(n)
+        chars = _prepare(alphabet).chars(n * size, self._token_bytes)
+        return [chars[i * size : (i + 1) * size] for i in range(n)]
+
+    def iter_ids(
+        self,
+        chunk_size: int = 1024,
+        size: int = DEFAULT_SIZE,
+        alphabet: str = DEFAULT_ALPHABET,
+    ) -> Iterator[str]:
+        """
+        Yields predictable NanoIDs forever, `chunk_size` at a time.
+
+        Args:
+            chunk_size: The number of IDs generated per batch.
+            size: The desired length of each ID. Defaults to 21.
+            alphabet: The set of characters to use for generating the IDs.
+                      Defaults to a URL-friendly set.
+
+        Yields:
+            A new NanoID string.
+
+        Raises:
+            ValueError: If `chunk_size` is less than 1.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        while True:
+            yield from self.generate_many(chunk_size, size=size, alphabet=alphabet)
+
+
+_non_secure_generator = NonSecureNanoidGenerator()
+
+
+def non_secure_nanoid(
+    size: int = DEFAULT_SIZE,
+    alphabet: str = DEFAULT_ALPHABET,
+) -> str:
+    """
+    Generates a new, predictable NanoID. Never use it as a secret.
+
+    This function uses a module-level, unseeded `NonSecureNanoidGenerator`.
+
+    Args:
+        size: The desired length of the ID. Defaults to 21.
+        alphabet: The set of characters to use for generating the ID.
+                  Defaults to a URL-friendly set.
+
+    Returns:
+        A new NanoID string.
+    """
+    return _non_secure_generator.generate(size=size, alphabet=alphabet)
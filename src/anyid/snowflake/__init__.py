@@ -1,3 +1,27 @@
-from .generator import SnowflakeIdGenerator, setup_snowflake_id_generator, snowflake
+from .generator import (
+    ClockMovedBackwardsError,
+    Snowflake,
+    SnowflakeBlock,
+    SnowflakeFields,
+    SnowflakeIdGenerator,
+    decode_ints,
+    setup_snowflake_id_generator,
+    snowflake,
+)
+from .layout import DISCORD, INSTAGRAM, SONYFLAKE, TWITTER, SnowflakeLayout
 
-__all__ = ["snowflake", "setup_snowflake_id_generator", "SnowflakeIdGenerator"]
+__all__ = [
+    "snowflake",
+    "setup_snowflake_id_generator",
+    "SnowflakeIdGenerator",
+    "SnowflakeBlock",
+    "Snowflake",
+    "SnowflakeFields",
+    "decode_ints",
+    "ClockMovedBackwardsError",
+    "SnowflakeLayout",
+    "TWITTER",
+    "DISCORD",
+    "INSTAGRAM",
+    "SONYFLAKE",
+]
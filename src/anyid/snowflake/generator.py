@@ -1,14 +1,18 @@
+import threading
 import time
-import datetime
-from typing import Optional
+from array import array
+from typing import Any, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
-# Twitter Snowflake's epoch is 2010-11-04T01:42:54.657Z
-SNOWFLAKE_EPOCH_DATETIME = datetime.datetime(
-    2010, 11, 4, 1, 42, 54, 657000, tzinfo=datetime.timezone.utc
-)
-SNOWFLAKE_EPOCH = int(
-    SNOWFLAKE_EPOCH_DATETIME.timestamp() * 1000
-)  # Convert to milliseconds
+from .. import _fork
+from ..clock import SYSTEM_CLOCK, Clock, ClockBehind
+from ..stats import StatsMixin
+from .layout import TWITTER, TWITTER_EPOCH, SnowflakeLayout
+
+# The constants below describe the default (Twitter) layout; see
+# `SnowflakeLayout` for others.
+
+# Twitter Snowflake's epoch is 2010-11-04T01:42:54.657Z, in milliseconds
+SNOWFLAKE_EPOCH = TWITTER_EPOCH
 
 WORKER_ID_BITS = (
     5  # Number of bits allocated for the worker ID (allows 2^5 = 32 unique workers)
@@ -31,78 +35,930 @@ TIMESTAMP_SHIFT = (
 
 SEQUENCE_MASK = -1 ^ (-1 << SEQUENCE_BITS)
 
+# The largest Snowflake ID; the sign bit of the 64-bit integer is never set.
+MAX_SNOWFLAKE = (1 << 63) - 1
+
+# What a generator does when the clock moves backwards:
+# - "raise": raise `ClockMovedBackwardsError`.
+# - "wait": sleep until the clock is back at the last timestamp.
+# - "logical": carry on from the last timestamp, as a logical clock that moves
+#   to the next tick when the sequence numbers run out, until the wall clock
+#   catches up.
+CLOCK_REGRESSION_POLICIES = ("raise", "wait", "logical")
+
+# What a generator does when the sequence numbers of a tick run out:
+# - "spin": poll the clock in a busy loop until the next tick.
+# - "sleep": sleep in short slices until the next tick.
+# - "borrow": carry on in the next tick, ahead of the clock, and sleep only
+#   if that one runs out too.
+SEQUENCE_OVERFLOW_POLICIES = ("spin", "sleep", "borrow")
+
+# The largest clock regression, in seconds, the "wait" and "logical" policies
+# absorb by default. Larger ones always raise.
+DEFAULT_MAX_REGRESSION = 1.0
+
+
+class ClockMovedBackwardsError(RuntimeError):
+    """
+    Raised when the clock is behind the last timestamp a generator used.
+
+    Attributes
+    ----------
+    regression : float
+        How far the clock is behind, in seconds.
+    """
+
+    def __init__(self, regression: float):
+        super().__init__("Clock moved backwards. Refusing to generate id")
+        self.regression = regression
+
+
+def __getattr__(name: str) -> Any:
+    # The datetime form of the epoch is built on demand so that importing this
+    # module does not import `datetime`.
+    if name == "SNOWFLAKE_EPOCH_DATETIME":
+        import datetime
+
+        return datetime.datetime.fromtimestamp(
+            SNOWFLAKE_EPOCH / 1000, tz=datetime.timezone.utc
+        )
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class Snowflake:
-    """Represents a Snowflake ID."""
+    """
+    Represents a Snowflake ID.
+
+    Instances are immutable and store the 64-bit integer form of the ID and
+    its layout; the individual fields are derived from them. The string form
+    is computed on first use. Snowflakes compare and hash like their integer
+    values.
+    """
+
+    __slots__ = ("_value", "_layout", "_str")
 
     def __init__(
-        self, timestamp: int, worker_id: int, datacenter_id: int, sequence: int
+        self,
+        timestamp: int,
+        worker_id: int,
+        datacenter_id: int,
+        sequence: int,
+        layout: Optional[SnowflakeLayout] = None,
     ):
-        if not (0 <= worker_id <= MAX_WORKER_ID):
-            raise ValueError(f"Worker ID must be between 0 and {MAX_WORKER_ID}")
-        if not (0 <= datacenter_id <= MAX_DATACENTER_ID):
-            raise ValueError(f"Datacenter ID must be between 0 and {MAX_DATACENTER_ID}")
+        if layout is None:
+            layout = TWITTER
+        if not (0 <= worker_id <= layout.max_worker_id):
+            raise ValueError(f"Worker ID must be between 0 and {layout.max_worker_id}")
+        if not (0 <= datacenter_id <= layout.max_datacenter_id):
+            raise ValueError(
+                f"Datacenter ID must be between 0 and {layout.max_datacenter_id}"
+            )
+        if not (0 <= sequence <= layout.sequence_mask):
+            raise ValueError(f"Sequence must be between 0 and {layout.sequence_mask}")
+
+        ticks = timestamp // layout.time_unit - layout.epoch_ticks
+        self._value: int = (
+            (ticks << layout.timestamp_shift)
+            | (datacenter_id << layout.datacenter_id_shift)
+            | (worker_id << layout.worker_id_shift)
+            | sequence
+        )
+        self._layout = layout
+        self._str: Optional[str] = None
+
+    @classmethod
+    def _from_valid_int(
+        cls, value: int, layout: SnowflakeLayout = TWITTER
+    ) -> "Snowflake":
+        """Builds a Snowflake from an integer known to be valid."""
+        snowflake = cls.__new__(cls)
+        snowflake._value = value
+        snowflake._layout = layout
+        snowflake._str = None
+        return snowflake
+
+    @classmethod
+    def from_int(
+        cls, value: int, layout: Optional[SnowflakeLayout] = None
+    ) -> "Snowflake":
+        """
+        Creates a Snowflake from its 64-bit integer value.
+
+        Parameters
+        ----------
+        value : int
+            The integer value, as returned by `int(snowflake)` or
+            `SnowflakeIdGenerator.generate_int`.
+        layout : SnowflakeLayout, optional
+            The layout of the ID. Defaults to Twitter's layout.
+
+        Returns
+        -------
+        Snowflake
+            The Snowflake with that value.
+
+        Raises
+        ------
+        ValueError
+            If `value` is negative or does not fit in 63 bits.
+        """
+        if not (0 <= value <= MAX_SNOWFLAKE):
+            raise ValueError(f"Snowflake value must be between 0 and {MAX_SNOWFLAKE}")
+        return cls._from_valid_int(value, layout if layout is not None else TWITTER)
+
+    @property
+    def layout(self) -> SnowflakeLayout:
+        """The bit layout of the ID."""
+        return self._layout
+
+    @property
+    def timestamp(self) -> int:
+        """The Unix time in milliseconds at which the ID was generated."""
+        layout = self._layout
+        ticks = (self._value >> layout.timestamp_shift) + layout.epoch_ticks
+        return ticks * layout.time_unit
+
+    @property
+    def worker_id(self) -> int:
+        """The ID of the worker that generated the ID."""
+        layout = self._layout
+        return (self._value >> layout.worker_id_shift) & layout.max_worker_id
+
+    @property
+    def datacenter_id(self) -> int:
+        """The ID of the datacenter that generated the ID."""
+        layout = self._layout
+        return (self._value >> layout.datacenter_id_shift) & layout.max_datacenter_id
+
+    @property
+    def sequence(self) -> int:
+        """The sequence number within the timestamp tick."""
+        return self._value & self._layout.sequence_mask
+
+    def __int__(self) -> int:
+        """Returns the integer value of the Snowflake ID."""
+        return self._value
+
+    def __str__(self) -> str:
+        """Returns the string representation of the Snowflake ID."""
+        if self._str is None:
+            self._str = str(self._value)
+        return self._str
+
+    def __repr__(self) -> str:
+        """Returns a developer-friendly representation of the Snowflake ID."""
+        return (
+            f"Snowflake(timestamp={self.timestamp}, worker_id={self.worker_id}, "
+            f"datacenter_id={self.datacenter_id}, sequence={self.sequence})"
+        )
+
+    def __hash__(self) -> int:
+        """Returns a hash consistent with equality."""
+        return hash(self._value)
+
+    def __eq__(self, other: object) -> bool:
+        """Checks if this Snowflake ID is equal to another."""
+        if not isinstance(other, Snowflake):
+            return NotImplemented
+        return self._value == other._value
+
+    def __lt__(self, other: "Snowflake") -> bool:
+        """Compares this Snowflake ID with another for sorting."""
+        if not isinstance(other, Snowflake):
+            return NotImplemented
+        return self._value < other._value
+
+    def __le__(self, other: "Snowflake") -> bool:
+        """Checks if this Snowflake ID sorts before or equal to another."""
+        if not isinstance(other, Snowflake):
+            return NotImplemented
+        return self._value <= other._value
+
+    def __gt__(self, other: "Snowflake") -> bool:
+        """Checks if this Snowflake ID sorts after another."""
+        if not isinstance(other, Snowflake):
+            return NotImplemented
+        return self._value > other._value
+
+    def __ge__(self, other: "Snowflake") -> bool:
+        """Checks if this Snowflake ID sorts after or equal to another."""
+        if not isinstance(other, Snowflake):
+            return NotImplemented
+        return self._value >= other._value
+
+
+class SnowflakeFields(NamedTuple):
+    """The fields of a batch of Snowflake IDs, one array per field."""
+
+    timestamps: "array[int]"
+    datacenter_ids: "array[int]"
+    worker_ids: "array[int]"
+    sequences: "array[int]"
+
+
+def _typecode(bits: int) -> str:
+    """Returns the smallest unsigned array typecode holding `bits` bits."""
+    if bits <= 8:
+        return "B"
+    if bits <= 16:
+        return "H"
+    return "L" if bits <= 32 else "Q"
+
+
+def decode_ints(
+    values: Iterable[int], layout: Optional[SnowflakeLayout] = None
+) -> SnowflakeFields:
+    """
+    Splits Snowflake IDs in integer form into their fields.
+
+    This is the batch counterpart of the `Snowflake` properties, for IDs kept
+    as plain integers (e.g. from `SnowflakeIdGenerator.generate_many_ints` or
+    a database column) without building a `Snowflake` per ID.
+
+    Parameters
+    ----------
+    values : Iterable[int]
+        The 64-bit integer values of the IDs.
+    layout : SnowflakeLayout, optional
+        The layout of the IDs. Defaults to Twitter's layout.
+
+    Returns
+    -------
+    SnowflakeFields
+        The Unix timestamps in milliseconds (``array('q')``), datacenter and
+        worker IDs and sequence numbers (unsigned arrays of the smallest
+        type that fits the field, e.g. ``array('B')`` for 5 bits), in the
+        order of `values`.
+    """
+    if layout is None:
+        layout = TWITTER
+    if not isinstance(values, (array, list, tuple)):
+        values = list(values)
+    timestamp_shift, epoch_ticks = layout.timestamp_shift, layout.epoch_ticks
+    time_unit = layout.time_unit
+    datacenter_id_shift = layout.datacenter_id_shift
+    max_datacenter_id = layout.max_datacenter_id
+    worker_id_shift, max_worker_id = layout.worker_id_shift, layout.max_worker_id
+    sequence_mask = layout.sequence_mask
+    return SnowflakeFields(
+        timestamps=array(
+            "q",
+            [
+                ((value >> timestamp_shift) + epoch_ticks) * time_unit
+                for value in values
+            ],
+        ),
+        datacenter_ids=array(
+            _typecode(layout.datacenter_id_bits),
+            [(value >> datacenter_id_shift) & max_datacenter_id for value in values],
+        ),
+        worker_ids=array(
+            _typecode(layout.worker_id_bits),
+            [(value >> worker_id_shift) & max_worker_id for value in values],
+        ),
+        sequences=array(
+            _typecode(layout.sequence_bits),
+            [value & sequence_mask for value in values],
+        ),
+    )
+
+
+class SnowflakeBlock:
+    """
+    A contiguous run of Snowflake IDs reserved by `SnowflakeIdGenerator.reserve`.
+
+    The block is a plain, immutable description of the reserved IDs: handing
+    them out never touches the generator again. Its IDs continue from one
+    timestamp tick into the next once the sequence numbers of a tick are used
+    up.
+
+    Attributes
+    ----------
+    timestamp : int
+        The tick of the first ID, in units of the layout's `time_unit` since
+        the Unix epoch (milliseconds for the default layout).
+    start : int
+        The sequence number of the first ID.
+    count : int
+        The number of IDs in the block.
+    worker_id : int
+        The worker ID of every ID in the block.
+    datacenter_id : int
+        The datacenter ID of every ID in the block.
+    layout : SnowflakeLayout
+        The layout of the IDs.
+    """
 
+    __slots__ = (
+        "timestamp",
+        "start",
+        "count",
+        "worker_id",
+        "datacenter_id",
+        "layout",
+    )
+
+    def __init__(
+        self,
+        timestamp: int,
+        start: int,
+        count: int,
+        worker_id: int,
+        datacenter_id: int,
+        layout: Optional[SnowflakeLayout] = None,
+    ):
         self.timestamp = timestamp
+        self.start = start
+        self.count = count
         self.worker_id = worker_id
         self.datacenter_id = datacenter_id
-        self.sequence = sequence
+        self.layout = layout if layout is not None else TWITTER
 
-    def __str__(self) -> str:
-        """Returns the string representation of the Snowflake ID."""
-        snowflake_id = (
-            ((self.timestamp - SNOWFLAKE_EPOCH) << TIMESTAMP_SHIFT)
-            | (self.datacenter_id << DATACENTER_ID_SHIFT)
-            | (self.worker_id << WORKER_ID_SHIFT)
-            | self.sequence
+    def __len__(self) -> int:
+        """Returns the number of IDs in the block."""
+        return self.count
+
+    def _int_at(self, index: int) -> int:
+        """Returns the integer value of the ID at a non-negative `index`."""
+        layout = self.layout
+        position = self.start + index
+        ticks = self.timestamp + (position >> layout.sequence_bits)
+        return (
+            ((ticks - layout.epoch_ticks) << layout.timestamp_shift)
+            | (self.datacenter_id << layout.datacenter_id_shift)
+            | (self.worker_id << layout.worker_id_shift)
+            | (position & layout.sequence_mask)
+        )
+
+    def __getitem__(self, index: int) -> Snowflake:
+        """Returns the ID at `index`; negative indices count from the end."""
+        if index < 0:
+            index += self.count
+        if not (0 <= index < self.count):
+            raise IndexError("Snowflake block index out of range")
+        return Snowflake._from_valid_int(self._int_at(index), self.layout)
+
+    def __iter__(self) -> Iterator[Snowflake]:
+        """Yields the IDs of the block in increasing order."""
+        from_int = Snowflake._from_valid_int
+        layout = self.layout
+        sequence_mask, timestamp_shift = layout.sequence_mask, layout.timestamp_shift
+        node = (self.datacenter_id << layout.datacenter_id_shift) | (
+            self.worker_id << layout.worker_id_shift
+        )
+        position, end = self.start, self.start + self.count
+        ticks = self.timestamp - layout.epoch_ticks
+        while position < end:
+            # One run per tick.
+            run_end = min(end, (position | sequence_mask) + 1)
+            base = (ticks << timestamp_shift) | node
+            first = position & sequence_mask
+            for sequence in range(first, first + run_end - position):
+                yield from_int(base | sequence, layout)
+            position = run_end
+            ticks += 1
+
+    def __repr__(self) -> str:
+        """Returns a developer-friendly representation of the block."""
+        return (
+            f"SnowflakeBlock(timestamp={self.timestamp}, start={self.start}, "
+            f"count={self.count}, worker_id={self.worker_id}, "
+            f"datacenter_id={self.datacenter_id}, layout={self.layout!r})"
         )
-        return str(snowflake_id)
 
 
-class SnowflakeIdGenerator:
-    """A generator for creating Snowflake IDs."""
+class SnowflakeIdGenerator(StatsMixin):
+    """
+    A thread-safe generator for creating Snowflake IDs.
+
+    The sequence state is guarded by a lock, so one generator (such as the
+    module-level singleton behind `snowflake()`) can be shared by threads.
+    """
+
+    _stats_lock_attribute = "_lock"
+
+    def __init__(
+        self,
+        worker_id: int,
+        datacenter_id: int,
+        clock: Optional[Clock] = None,
+        layout: Optional[SnowflakeLayout] = None,
+        on_clock_regression: str = "raise",
+        max_regression: float = DEFAULT_MAX_REGRESSION,
+        on_sequence_overflow: str = "sleep",
+    ):
+        """
+        Initializes the generator.
+
+        Parameters
+        ----------
+        worker_id : int
+            The ID of the worker, between 0 and the layout's `max_worker_id`.
+        datacenter_id : int
+            The ID of the datacenter, between 0 and the layout's
+            `max_datacenter_id`.
+        clock : Clock, optional
+            The clock timestamps are read from. Defaults to the system clock.
+            A `MonotonicClock` avoids clock regression errors when the system
+            clock is stepped back.
+        layout : SnowflakeLayout, optional
+            The bit layout and epoch of the IDs. Defaults to Twitter's layout;
+            see `anyid.snowflake.layout` for presets.
+        on_clock_regression : str, optional
+            What to do when the clock moves backwards: ``"raise"`` a
+            `ClockMovedBackwardsError`, ``"wait"`` (sleeping) for the clock
+            to catch up, or continue on the last timestamp as a
+            ``"logical"`` clock. Defaults to ``"raise"``.
+        max_regression : float, optional
+            The largest regression, in seconds, that ``"wait"`` and
+            ``"logical"`` absorb; larger ones raise. Defaults to 1.
+        on_sequence_overflow : str, optional
+            What to do when the sequence numbers of a tick run out:
+            ``"spin"`` on the clock, ``"sleep"`` in short slices until the
+            next tick, or ``"borrow"`` the next tick's sequence numbers
+            ahead of the clock. Defaults to ``"sleep"``.
 
-    def __init__(self, worker_id: int, datacenter_id: int):
-        if not (0 <= worker_id <= MAX_WORKER_ID):
-            raise ValueError(f"Worker ID must be between 0 and {MAX_WORKER_ID}")
-        if not (0 <= datacenter_id <= MAX_DATACENTER_ID):
-            raise ValueError(f"Datacenter ID must be between 0 and {MAX_DATACENTER_ID}")
+        Raises
+        ------
+        ValueError
+            If `worker_id` or `datacenter_id` is out of range, a policy is
+            unknown or `max_regression` is negative.
+        """
+        if layout is None:
+            layout = TWITTER
+        if not (0 <= worker_id <= layout.max_worker_id):
+            raise ValueError(f"Worker ID must be between 0 and {layout.max_worker_id}")
+        if not (0 <= datacenter_id <= layout.max_datacenter_id):
+            raise ValueError(
+                f"Datacenter ID must be between 0 and {layout.max_datacenter_id}"
+            )
+        if on_clock_regression not in CLOCK_REGRESSION_POLICIES:
+            raise ValueError(
+                f"Clock regression policy must be one of {CLOCK_REGRESSION_POLICIES}"
+            )
+        if on_sequence_overflow not in SEQUENCE_OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Sequence overflow policy must be one of {SEQUENCE_OVERFLOW_POLICIES}"
+            )
+        if max_regression < 0:
+            raise ValueError("Maximum regression must be non-negative.")
 
+        self.clock = clock if clock is not None else SYSTEM_CLOCK
+        self.layout = layout
         self.worker_id = worker_id
         self.datacenter_id = datacenter_id
+        self.on_clock_regression = on_clock_regression
+        self.max_regression = max_regression
+        self.on_sequence_overflow = on_sequence_overflow
+        # The worker and datacenter bits, shared by every ID of this generator.
+        self._node = (datacenter_id << layout.datacenter_id_shift) | (
+            worker_id << layout.worker_id_shift
+        )
+        self._tick_ns = layout.time_unit * 1_000_000
+        # The ticks since the Unix epoch the timestamp field can represent.
+        self._first_tick = layout.epoch_ticks
+        self._last_tick = layout.epoch_ticks + layout.max_timestamp_ticks
         self.sequence = 0
         self.last_timestamp = -1
+        # The last tick handed out ahead of the clock, by `reserve`, a borrow
+        # or the logical clock.
+        self._reserved_until = -1
+        # The latest tick read from the clock. Regressions are judged against
+        # it rather than `last_timestamp`, which may run ahead of the clock.
+        self._observed_tick = -1
+        # Whether the clock is behind and the current regression was counted.
+        self._in_regression = False
+        self._lock = threading.Lock()
+        _fork.track(self)
 
-    def generate(self) -> Snowflake:
-        """Generates a new Snowflake ID."""
-        timestamp = int(time.time() * 1000)
+    def _after_fork(self) -> None:
+        """
+        Replaces the lock in a forked child.
+
+        Another thread of the parent may have held it at the time of the
+        fork. The sequence state is kept: a child must be given its own
+        worker ID to avoid emitting the same IDs as its parent.
+        """
+        self._lock = threading.Lock()
+        self._instrument_lock()
+
+    def _claim(self, n: int, span: bool = False) -> Optional[Tuple[int, int, int]]:
+        """
+        Claims up to `n` consecutive sequence numbers.
+
+        Timestamps here, like `last_timestamp`, are in ticks of the layout's
+        time unit since the Unix epoch (milliseconds for the default layout).
+
+        Parameters
+        ----------
+        n : int
+            The maximum number of sequence numbers to claim.
+        span : bool, optional
+            Claim all `n`, continuing into the following ticks (ahead of the
+            clock if need be) when the current one runs out. Defaults to
+            False.
+
+        Returns
+        -------
+        Optional[Tuple[int, int, int]]
+            The tick, the first sequence number and the number claimed, or
+            None if the current tick is used up and `span` is False. The
+            caller decides how to wait for the next tick.
+
+        Raises
+        ------
+        ClockMovedBackwardsError
+            If the clock moved backwards and the regression policy does not
+            absorb it.
+        ClockBehind
+            If the clock moved backwards and the policy is to wait for it.
+        ValueError
+            If the time is outside the range of the layout's timestamp field.
+        """
+        sequence_mask = self.layout.sequence_mask
+        with self._lock:
+            clock_tick = self.clock.time_ns() // self._tick_ns
+            if not (self._first_tick <= clock_tick <= self._last_tick):
+                raise ValueError("The time does not fit in the Snowflake layout.")
+            last_timestamp = self.last_timestamp
+
+            observed_tick = self._observed_tick
+            if last_timestamp > self._reserved_until:
+                # The last timestamp was not handed out ahead of the clock, so
+                # the clock has seen it.
+                observed_tick = max(observed_tick, last_timestamp)
+            if clock_tick < observed_tick:
+                clock_tick = self._absorb_regression(clock_tick, observed_tick)
+            # Whether the last timestamp is kept as a logical clock.
+            logical = clock_tick < observed_tick
+            if logical:
+                self._observed_tick = observed_tick
+            else:
+                self._observed_tick = clock_tick
+                self._in_regression = False
+            timestamp = clock_tick
+            if timestamp < last_timestamp:
+                # The IDs up to here were handed out ahead of the clock; carry
+                # on from where they stopped.
+                timestamp = last_timestamp
+
+            start = 0
+            if timestamp == last_timestamp:
+                start = self.sequence + 1
+                if start > sequence_mask:
+                    if logical:
+                        # The logical clock moves on to the next tick, as
+                        # long as it stays within the regression limit.
+                        lead_ns = (timestamp + 1 - clock_tick) * self._tick_ns
+                        if not span and lead_ns > self.max_regression * 1e9:
+                            return None
+                    elif not span:
+                        if (
+                            self.on_sequence_overflow != "borrow"
+                            or timestamp > clock_tick
+                        ):
+                            return None
+                        # Borrow from the next tick, at most one tick ahead
+                        # of the clock.
+                        if self.stats is not None:
+                            self.stats.record_sequence_borrow()
+                    timestamp += 1
+                    start = 0
+
+            if span:
+                count = n
+                end = start + count - 1
+                self.sequence = end & sequence_mask
+                self.last_timestamp = timestamp + (end >> self.layout.sequence_bits)
+            else:
+                count = min(n, sequence_mask + 1 - start)
+                self.sequence = start + count - 1
+                self.last_timestamp = timestamp
+            if self.last_timestamp > clock_tick:
+                self._reserved_until = self.last_timestamp
+        if self.stats is not None:
+            self.stats.record_ids(count)
+        return timestamp, start, count
+
+    def _absorb_regression(self, clock_tick: int, observed_tick: int) -> int:
+        """
+        Applies the clock regression policy. Called with the lock held.
+
+        Parameters
+        ----------
+        clock_tick : int
+            The current tick.
+        observed_tick : int
+            The latest tick the clock was seen at, which `clock_tick` is
+            behind.
+
+        Returns
+        -------
+        int
+            The unchanged tick, when the last timestamp is kept as a logical
+            clock (`_reserved_until` then covers it).
+
+        Raises
+        ------
+        ClockMovedBackwardsError
+            If the policy is "raise" or the regression is too large.
+        ClockBehind
+            If the policy is "wait", with how far the clock is behind.
+        """
+        stats = self.stats
+        counted = self._in_regression
+        if stats is not None and not counted:
+            stats.record_clock_regression()
+        tick_seconds = self._tick_ns / 1e9
+        behind = (observed_tick - clock_tick) * tick_seconds
+        if self.on_clock_regression == "raise" or behind > self.max_regression:
+            self._in_regression = False
+            raise ClockMovedBackwardsError(behind)
 
-        if timestamp < self.last_timestamp:
-            raise Exception("Clock moved backwards. Refusing to generate id")
+        self._in_regression = True
+        if self.on_clock_regression == "logical":
+            self._reserved_until = self.last_timestamp
+            if stats is not None and not counted:
+                stats.record_logical_clock_run()
+            return clock_tick
+        raise ClockBehind(behind)
 
-        if self.last_timestamp == timestamp:
-            self.sequence = (self.sequence + 1) & SEQUENCE_MASK
-            if self.sequence == 0:
-                # Sequence overflow, wait for next millisecond
-                while timestamp <= self.last_timestamp:
-                    timestamp = int(time.time() * 1000)
-        else:
-            self.sequence = 0
+    def _try_generate(self) -> Optional[Snowflake]:
+        """
+        Generates a new Snowflake ID unless the current millisecond is used up.
 
-        self.last_timestamp = timestamp
+        Returns
+        -------
+        Optional[Snowflake]
+            The new Snowflake object, or None if every sequence number of the
+            current millisecond has been handed out. The caller decides how
+            to wait for the next millisecond.
 
-        return Snowflake(
+        Raises
+        ------
+        ClockBehind
+            If the clock is behind under the "wait" policy. The caller
+            decides how to wait for it.
+        """
+        claimed = self._claim(1)
+        if claimed is None:
+            return None
+        timestamp, sequence, _ = claimed
+        layout = self.layout
+        return Snowflake._from_valid_int(
+            ((timestamp - layout.epoch_ticks) << layout.timestamp_shift)
+            | self._node
+            | sequence,
+            layout,
+        )
+
+    def _take_many(self, n: int) -> List[Snowflake]:
+        """
+        Generates up to `n` Snowflake IDs from the current millisecond.
+
+        Parameters
+        ----------
+        n : int
+            The maximum number of IDs to generate.
+
+        Returns
+        -------
+        List[Snowflake]
+            The new Snowflake objects in increasing order. The list is empty
+            if the current millisecond is used up, and shorter than `n` if
+            it runs out part way.
+
+        Raises
+        ------
+        ClockBehind
+            If the clock is behind under the "wait" policy.
+        """
+        claimed = self._claim(n)
+        if claimed is None:
+            return []
+        timestamp, start, count = claimed
+        layout = self.layout
+        base = ((timestamp - layout.epoch_ticks) << layout.timestamp_shift) | self._node
+        from_int = Snowflake._from_valid_int
+        return [
+            from_int(base | sequence, layout)
+            for sequence in range(start, start + count)
+        ]
+
+    def reserve(self, n: int) -> SnowflakeBlock:
+        """
+        Reserves `n` consecutive Snowflake IDs in one step.
+
+        The sequence numbers are claimed under a single lock acquisition and
+        never wait for the clock: when the current millisecond runs out, the
+        block continues into the following ones, ahead of the clock if need
+        be. Later IDs from this generator continue after the block, so they
+        stay unique and increasing. The block can then be handed out, e.g. to
+        a batch insert, without touching the generator again.
+
+        Parameters
+        ----------
+        n : int
+            The number of IDs to reserve.
+
+        Returns
+        -------
+        SnowflakeBlock
+            The reserved IDs.
+
+        Raises
+        ------
+        ValueError
+            If `n` is less than 1.
+        ClockMovedBackwardsError
+            If the clock moved backwards and the regression policy does not
+            absorb it.
+        """
+        if n < 1:
+            raise ValueError("The number of IDs must be at least 1.")
+        timestamp, start, count = self._claim_waiting(n, span=True)
+        return SnowflakeBlock(
             timestamp=timestamp,
+            start=start,
+            count=count,
             worker_id=self.worker_id,
             datacenter_id=self.datacenter_id,
-            sequence=self.sequence,
+            layout=self.layout,
+        )
+
+    def _claim_behind(
+        self, n: int, span: bool = False
+    ) -> Optional[Tuple[int, int, int]]:
+        """
+        Claims like `_claim`, but waits for the clock to catch up when it
+        moved backwards and the policy is "wait".
+
+        The lock is released while sleeping, so other threads are not held
+        up, and the claim is retried once the clock has moved on.
+
+        Raises
+        ------
+        ClockMovedBackwardsError
+            If the clock has not caught up within `max_regression` seconds.
+        """
+        try:
+            return self._claim(n, span)
+        except ClockBehind as error:
+            behind = error.behind
+        started = time.perf_counter()
+        deadline = started + self.max_regression
+        while True:
+            if time.perf_counter() + behind > deadline:
+                raise ClockMovedBackwardsError(behind)
+            time.sleep(behind)
+            try:
+                claimed = self._claim(n, span)
+            except ClockBehind as error:
+                behind = error.behind
+                continue
+            if self.stats is not None:
+                self.stats.record_regression_wait(time.perf_counter() - started)
+            return claimed
+
+    def _claim_waiting(self, n: int, span: bool = False) -> Tuple[int, int, int]:
+        """
+        Claims up to `n` sequence numbers, waiting for the next tick if the
+        current one is used up, or for the clock if it moved backwards. See
+        `_claim` for the arguments and the result.
+        """
+        claimed = self._claim_behind(n, span)
+        if claimed is None:
+            # Sequence overflow, wait for the next tick
+            started = time.perf_counter()
+            spin = self.on_sequence_overflow == "spin"
+            # Sleep in slices of a tenth of a tick, so the next tick is not
+            # missed by much.
+            pause = self._tick_ns / 1e10
+            while claimed is None:
+                if not spin:
+                    time.sleep(pause)
+                claimed = self._claim_behind(n, span)
+            if self.stats is not None:
+                self.stats.record_overflow()
+                self.stats.record_wait(time.perf_counter() - started)
+        return claimed
+
+    def generate(self) -> Snowflake:
+        """Generates a new Snowflake ID."""
+        return Snowflake._from_valid_int(self.generate_int(), self.layout)
+
+    def generate_int(self) -> int:
+        """
+        Generates a new Snowflake ID as a plain integer.
+
+        This is the fast path for callers that only need the 64-bit value
+        (e.g. to store it): no `Snowflake` object is built.
+
+        Returns
+        -------
+        int
+            The integer value of the new ID.
+        """
+        timestamp, sequence, _ = self._claim_waiting(1)
+        layout = self.layout
+        return (
+            ((timestamp - layout.epoch_ticks) << layout.timestamp_shift)
+            | self._node
+            | sequence
         )
 
+    def generate_many(self, n: int) -> List[Snowflake]:
+        """
+        Generates `n` Snowflake IDs in one batch.
+
+        The clock is read once per millisecond tick rather than once per ID:
+        each read hands out every sequence number still free in that
+        millisecond, and the clock is only read again when the sequence space
+        is exhausted. The result is identical to `n` calls of `generate`.
+
+        Parameters
+        ----------
+        n : int
+            The number of IDs to generate.
+
+        Returns
+        -------
+        List[Snowflake]
+            The new Snowflake objects in increasing order.
+
+        Raises
+        ------
+        ValueError
+            If `n` is negative.
+        """
+        from_int, layout = Snowflake._from_valid_int, self.layout
+        return [from_int(value, layout) for value in self.generate_many_ints(n)]
+
+    def generate_many_ints(self, n: int) -> "array[int]":
+        """
+        Generates `n` Snowflake IDs in one batch, as plain integers.
+
+        Like `generate_many`, but the IDs are returned as a compact
+        ``array('q')`` of 64-bit integers instead of `Snowflake` objects.
+
+        Parameters
+        ----------
+        n : int
+            The number of IDs to generate.
+
+        Returns
+        -------
+        array[int]
+            The integer values of the new IDs in increasing order.
+
+        Raises
+        ------
+        ValueError
+            If `n` is negative.
+        """
+        if n < 0:
+            raise ValueError("The number of IDs must be non-negative.")
+
+        epoch_ticks = self.layout.epoch_ticks
+        timestamp_shift = self.layout.timestamp_shift
+        ids = array("q")
+        while len(ids) < n:
+            timestamp, start, count = self._claim_waiting(n - len(ids))
+            first = ((timestamp - epoch_ticks) << timestamp_shift) | self._node
+            ids.extend(range(first | start, (first | start) + count))
+        return ids
+
+    def iter_ids(self, chunk_size: int = 1024) -> Iterator[Snowflake]:
+        """
+        Yields Snowflake IDs forever, generating them `chunk_size` at a time.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            The number of IDs generated per batch. Defaults to 1024.
+
+        Yields
+        ------
+        Snowflake
+            A new, unique Snowflake object.
+
+        Raises
+        ------
+        ValueError
+            If `chunk_size` is less than 1.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        while True:
+            yield from self.generate_many(chunk_size)
+
 
 _snowflake_generator: Optional[SnowflakeIdGenerator] = None
 
 
-def setup_snowflake_id_generator(worker_id: int, datacenter_id: int) -> None:
+def setup_snowflake_id_generator(
+    worker_id: int, datacenter_id: int, layout: Optional[SnowflakeLayout] = None
+) -> None:
     """
     Initializes the module-level singleton of SnowflakeIdGenerator.
 
@@ -115,10 +971,12 @@ def setup_snowflake_id_generator(worker_id: int, datacenter_id: int) -> None:
         The ID of the worker.
     datacenter_id : int
         The ID of the datacenter.
+    layout : SnowflakeLayout, optional
+        The bit layout and epoch of the IDs. Defaults to Twitter's layout.
     """
     global _snowflake_generator
     _snowflake_generator = SnowflakeIdGenerator(
-        worker_id=worker_id, datacenter_id=datacenter_id
+        worker_id=worker_id, datacenter_id=datacenter_id, layout=layout
     )
 
 
@@ -0,0 +1,224 @@
+"""
+Bit layouts of Snowflake IDs.
+
+A Snowflake ID packs, from the most significant bit down, a timestamp, a
+datacenter ID, a worker ID and a sequence number into a non-negative 64-bit
+integer. A `SnowflakeLayout` fixes the width of each field, the epoch the
+timestamp counts from and the unit it counts in, so the node count can be
+traded for per-node throughput. Presets are provided for well-known schemes.
+"""
+
+from typing import Any
+
+# Twitter Snowflake's epoch is 2010-11-04T01:42:54.657Z, in milliseconds
+TWITTER_EPOCH = 1288834974657
+# 2015-01-01T00:00:00Z
+DISCORD_EPOCH = 1420070400000
+# 2011-08-24T21:07:01.721Z
+INSTAGRAM_EPOCH = 1314220021721
+# 2014-09-01T00:00:00Z
+SONYFLAKE_EPOCH = 1409529600000
+
+
+class SnowflakeLayout:
+    """
+    The bit widths, epoch and time unit of a family of Snowflake IDs.
+
+    Layouts are immutable. The shifts and masks every generator and ID of the
+    layout need are computed once, when the layout is created.
+
+    Attributes
+    ----------
+    epoch : int
+        The Unix time in milliseconds the timestamps count from.
+    time_unit : int
+        The number of milliseconds per timestamp tick.
+    timestamp_bits : int
+        The width of the timestamp field.
+    datacenter_id_bits : int
+        The width of the datacenter ID field.
+    worker_id_bits : int
+        The width of the worker ID field.
+    sequence_bits : int
+        The width of the sequence number field.
+    max_worker_id : int
+        The largest worker ID.
+    max_datacenter_id : int
+        The largest datacenter ID.
+    sequence_mask : int
+        The largest sequence number, i.e. the number of IDs per tick minus one.
+    max_timestamp_ticks : int
+        The largest timestamp, in ticks since the epoch.
+    worker_id_shift : int
+        The offset of the worker ID field.
+    datacenter_id_shift : int
+        The offset of the datacenter ID field.
+    timestamp_shift : int
+        The offset of the timestamp field.
+    epoch_ticks : int
+        The epoch, in ticks since the Unix epoch.
+    """
+
+    __slots__ = (
+        "epoch",
+        "time_unit",
+        "timestamp_bits",
+        "datacenter_id_bits",
+        "worker_id_bits",
+        "sequence_bits",
+        "max_worker_id",
+        "max_datacenter_id",
+        "sequence_mask",
+        "max_timestamp_ticks",
+        "worker_id_shift",
+        "datacenter_id_shift",
+        "timestamp_shift",
+        "epoch_ticks",
+    )
+
+    epoch: int
+    time_unit: int
+    timestamp_bits: int
+    datacenter_id_bits: int
+    worker_id_bits: int
+    sequence_bits: int
+    max_worker_id: int
+    max_datacenter_id: int
+    sequence_mask: int
+    max_timestamp_ticks: int
+    worker_id_shift: int
+    datacenter_id_shift: int
+    timestamp_shift: int
+    epoch_ticks: int
+
+    def __init__(
+        self,
+        epoch: int = TWITTER_EPOCH,
+        time_unit: int = 1,
+        timestamp_bits: int = 41,
+        datacenter_id_bits: int = 5,
+        worker_id_bits: int = 5,
+        sequence_bits: int = 12,
+    ):
+        """
+        Initializes the layout. The defaults are Twitter's layout.
+
+        Parameters
+        ----------
+        epoch : int, optional
+            The Unix time in milliseconds the timestamps count from. It must
+            be a multiple of `time_unit`. Defaults to Twitter's epoch.
+        time_unit : int, optional
+            The number of milliseconds per timestamp tick. Defaults to 1.
+        timestamp_bits : int, optional
+            The width of the timestamp field. Defaults to 41.
+        datacenter_id_bits : int, optional
+            The width of the datacenter ID field; 0 for none. Defaults to 5.
+        worker_id_bits : int, optional
+            The width of the worker ID field; 0 for none. Defaults to 5.
+        sequence_bits : int, optional
+            The width of the sequence number field. Defaults to 12.
+
+        Raises
+        ------
+        ValueError
+            If a width or the time unit is out of range, the widths add up to
+            more than 63 bits, or the epoch is not a multiple of the time
+            unit.
+        """
+        if time_unit < 1:
+            raise ValueError("Time unit must be at least 1 millisecond.")
+        if epoch < 0 or epoch % time_unit:
+            raise ValueError("Epoch must be a non-negative multiple of the time unit.")
+        if timestamp_bits < 1 or sequence_bits < 1:
+            raise ValueError("Timestamp and sequence fields need at least 1 bit.")
+        if datacenter_id_bits < 0 or worker_id_bits < 0:
+            raise ValueError("Field widths must be non-negative.")
+        total = timestamp_bits + datacenter_id_bits + worker_id_bits + sequence_bits
+        if total > 63:
+            raise ValueError(f"Snowflake layouts have at most 63 bits, not {total}.")
+
+        set_field = object.__setattr__
+        set_field(self, "epoch", epoch)
+        set_field(self, "time_unit", time_unit)
+        set_field(self, "timestamp_bits", timestamp_bits)
+        set_field(self, "datacenter_id_bits", datacenter_id_bits)
+        set_field(self, "worker_id_bits", worker_id_bits)
+        set_field(self, "sequence_bits", sequence_bits)
+        set_field(self, "max_worker_id", (1 << worker_id_bits) - 1)
+        set_field(self, "max_datacenter_id", (1 << datacenter_id_bits) - 1)
+        set_field(self, "sequence_mask", (1 << sequence_bits) - 1)
+        set_field(self, "max_timestamp_ticks", (1 << timestamp_bits) - 1)
+        set_field(self, "worker_id_shift", sequence_bits)
+        set_field(self, "datacenter_id_shift", sequence_bits + worker_id_bits)
+        set_field(
+            self,
+            "timestamp_shift",
+            sequence_bits + worker_id_bits + datacenter_id_bits,
+        )
+        set_field(self, "epoch_ticks", epoch // time_unit)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("SnowflakeLayout is immutable")
+
+    def _key(self) -> tuple:
+        return (
+            self.epoch,
+            self.time_unit,
+            self.timestamp_bits,
+            self.datacenter_id_bits,
+            self.worker_id_bits,
+            self.sequence_bits,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SnowflakeLayout):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __reduce__(self) -> Any:
+        return (SnowflakeLayout, self._key())
+
+    def __repr__(self) -> str:
+        return (
+            f"SnowflakeLayout(epoch={self.epoch}, time_unit={self.time_unit}, "
+            f"timestamp_bits={self.timestamp_bits}, "
+            f"datacenter_id_bits={self.datacenter_id_bits}, "
+            f"worker_id_bits={self.worker_id_bits}, "
+            f"sequence_bits={self.sequence_bits})"
+        )
+
+
+# Twitter: 41-bit millisecond timestamp, 5-bit datacenter and worker IDs and
+# a 12-bit sequence. This is the default layout.
+TWITTER = SnowflakeLayout()
+
+# Discord: Twitter's layout with the 2015 epoch. Discord's internal worker and
+# process IDs map onto the datacenter and worker IDs.
+DISCORD = SnowflakeLayout(epoch=DISCORD_EPOCH)
+
+# Instagram: millisecond timestamp, 13-bit shard ID (the worker ID) and a
+# 10-bit sequence. Instagram's timestamp field is 41 bits wide and so uses
+# the sign bit; it is 40 bits here, which gives the same IDs until 2046.
+INSTAGRAM = SnowflakeLayout(
+    epoch=INSTAGRAM_EPOCH,
+    timestamp_bits=40,
+    datacenter_id_bits=0,
+    worker_id_bits=13,
+    sequence_bits=10,
+)
+
+# Sonyflake: 39-bit timestamp in 10 ms units, 16-bit machine ID (the worker
+# ID) and an 8-bit sequence. Sonyflake itself stores the sequence above the
+# machine ID; here it is the lowest field, as in every layout.
+SONYFLAKE = SnowflakeLayout(
+    epoch=SONYFLAKE_EPOCH,
+    time_unit=10,
+    timestamp_bits=39,
+    datacenter_id_bits=0,
+    worker_id_bits=16,
+    sequence_bits=8,
+)
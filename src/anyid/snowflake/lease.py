@@ -0,0 +1,263 @@
+"""
+Worker ID leases shared by the processes of a host.
+
+Instead of configuring every process with a unique worker ID by hand, each
+process leases a free one from a local directory at startup::
+
+    >>> from anyid.snowflake import setup_snowflake_id_generator
+    >>> from anyid.snowflake.lease import WorkerIdLease
+    >>> lease = WorkerIdLease.acquire("/run/anyid")
+    >>> setup_snowflake_id_generator(lease.worker_id, datacenter_id=1)
+
+Every worker ID has a lease file in the directory. A process holds a worker
+ID for as long as it holds an exclusive `flock` on its file, so the kernel
+releases the lease the moment the process dies, however it dies. A daemon
+thread writes a heartbeat into the held file, and the lease is marked as
+released on `release`, on exit of a ``with`` block or at interpreter exit.
+
+A worker ID whose holder died without releasing it is only handed out again
+once a grace period has passed since the holder's last heartbeat. Any IDs the
+dead process issued ahead of the clock (see `SnowflakeIdGenerator.reserve`)
+or under a skewed clock cannot then collide with those of its successor.
+
+Leases rely on `fcntl.flock` and are therefore only available on POSIX
+systems. The directory must be on a local file system.
+"""
+
+import atexit
+import os
+import threading
+from types import TracebackType
+from typing import Optional, Tuple, Type
+
+from .. import _fork
+from ..clock import SYSTEM_CLOCK, Clock
+from .layout import TWITTER, SnowflakeLayout
+
+DEFAULT_HEARTBEAT_INTERVAL = 1.0
+DEFAULT_GRACE_PERIOD = 10.0
+
+_HELD = "held"
+_RELEASED = "released"
+# Lease records are a short line of text; anything longer is corrupt.
+_RECORD_SIZE = 64
+
+
+def _lease_path(directory: str, worker_id: int) -> str:
+    return os.path.join(directory, f"worker-{worker_id}.lease")
+
+
+def _read_record(fd: int) -> Optional[Tuple[str, int]]:
+    """
+    Reads the state and heartbeat (Unix milliseconds) of a lease file.
+
+    Returns None for a new or unreadable file.
+    """
+    fields = os.pread(fd, _RECORD_SIZE, 0).split()
+    if len(fields) != 3:
+        return None
+    try:
+        return fields[0].decode("ascii"), int(fields[2])
+    except (UnicodeDecodeError, ValueError):
+        return None
+
+
+def _write_record(fd: int, state: str, heartbeat_ms: int) -> None:
+    record = f"{state} {os.getpid()} {heartbeat_ms}\n".encode("ascii")
+    os.pwrite(fd, record, 0)
+    os.ftruncate(fd, len(record))
+
+
+class WorkerIdLease:
+    """
+    A worker ID leased exclusively by this process.
+
+    Create leases with `WorkerIdLease.acquire`. A lease can be used as a
+    context manager that releases it on exit.
+
+    Attributes
+    ----------
+    worker_id : int
+        The leased worker ID.
+    directory : str
+        The directory holding the lease files.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        worker_id: int,
+        fd: int,
+        heartbeat_interval: float,
+        clock: Clock,
+    ):
+        """
+        Takes over a held lease file. Use `acquire` to create leases.
+        """
+        self.directory = directory
+        self.worker_id = worker_id
+        self._fd: Optional[int] = fd
+        self._heartbeat_interval = heartbeat_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._heartbeat,
+            name=f"anyid-lease-{worker_id}",
+            daemon=True,
+        )
+        self._thread.start()
+        atexit.register(self.release)
+        _fork.track(self)
+
+    @classmethod
+    def acquire(
+        cls,
+        directory: str,
+        layout: Optional[SnowflakeLayout] = None,
+        heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL,
+        grace_period: float = DEFAULT_GRACE_PERIOD,
+        clock: Optional[Clock] = None,
+    ) -> "WorkerIdLease":
+        """
+        Leases the lowest free worker ID.
+
+        Parameters
+        ----------
+        directory : str
+            The directory holding the lease files. It is created if missing
+            and must be shared by every process leasing from the same pool.
+        layout : SnowflakeLayout, optional
+            The layout whose worker IDs are leased. Defaults to Twitter's
+            layout (worker IDs 0 to 31).
+        heartbeat_interval : float, optional
+            The interval between heartbeats, in seconds. Defaults to 1.
+        grace_period : float, optional
+            How long, in seconds, a worker ID whose holder died without
+            releasing it stays unavailable after its last heartbeat.
+            Defaults to 10.
+        clock : Clock, optional
+            The clock heartbeats are read from. Defaults to the system clock.
+
+        Returns
+        -------
+        WorkerIdLease
+            The lease.
+
+        Raises
+        ------
+        RuntimeError
+            If every worker ID is leased or within its grace period, or the
+            platform lacks `fcntl`.
+        ValueError
+            If `heartbeat_interval` is not positive or `grace_period` is
+            negative.
+        """
+        try:
+            import fcntl
+        except ImportError:
+            raise RuntimeError(
+                "Worker ID leases need fcntl, which this platform lacks."
+            ) from None
+        if heartbeat_interval <= 0:
+            raise ValueError("Heartbeat interval must be positive.")
+        if grace_period < 0:
+            raise ValueError("Grace period must be non-negative.")
+        if layout is None:
+            layout = TWITTER
+        if clock is None:
+            clock = SYSTEM_CLOCK
+
+        os.makedirs(directory, exist_ok=True)
+        grace_ms = int(grace_period * 1000)
+        for worker_id in range(layout.max_worker_id + 1):
+            fd = os.open(
+                _lease_path(directory, worker_id), os.O_RDWR | os.O_CREAT, 0o644
+            )
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                # Held by a live process.
+                os.close(fd)
+                continue
+
+            now_ms = clock.time_ns() // 1_000_000
+            record = _read_record(fd)
+            if (
+                record is not None
+                and record[0] == _HELD
+                and (now_ms - record[1] < grace_ms)
+            ):
+                # The holder died recently without releasing the lease.
+                os.close(fd)
+                continue
+
+            _write_record(fd, _HELD, now_ms)
+            return cls(directory, worker_id, fd, heartbeat_interval, clock)
+
+        raise RuntimeError(f"No free worker ID in {directory}.")
+
+    @property
+    def held(self) -> bool:
+        """Whether the lease is still held."""
+        return self._fd is not None
+
+    def _heartbeat(self) -> None:
+        """Body of the heartbeat thread."""
+        while not self._stopped.wait(self._heartbeat_interval):
+            with self._lock:
+                if self._fd is None:
+                    return
+                _write_record(self._fd, _HELD, self._clock.time_ns() // 1_000_000)
+
+    def release(self) -> None:
+        """
+        Releases the lease, making the worker ID available at once.
+
+        Releasing a lease that is no longer held does nothing. Stop issuing
+        IDs with the worker ID before releasing it.
+        """
+        self._stopped.set()
+        with self._lock:
+            fd, self._fd = self._fd, None
+            if fd is None:
+                return
+            try:
+                _write_record(fd, _RELEASED, self._clock.time_ns() // 1_000_000)
+            finally:
+                # Closing the file drops the lock.
+                os.close(fd)
+        atexit.unregister(self.release)
+
+    def _after_fork(self) -> None:
+        """
+        Gives up the lease in a forked child.
+
+        The lease stays with the parent: the child closes its copy of the
+        file without touching the record, and has to acquire its own lease.
+        """
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._stopped.set()
+        fd, self._fd = self._fd, None
+        if fd is not None:
+            os.close(fd)
+        atexit.unregister(self.release)
+
+    def __enter__(self) -> "WorkerIdLease":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.release()
+
+    def __repr__(self) -> str:
+        state = "held" if self.held else "released"
+        return (
+            f"WorkerIdLease(worker_id={self.worker_id}, "
+            f"directory={self.directory!r}, {state})"
+        )
@@ -0,0 +1,359 @@
+"""
+Opt-in runtime statistics for the anyid generators.
+
+Statistics are disabled by default. Every generator has a `stats` attribute
+that is None until `enable_stats()` is called, so the hot paths only pay for
+a single attribute check. Once enabled, the generator counts the IDs it
+issues, how often it ran out of sequence or random space and how long it
+waited for the next clock tick, clock regressions, counter wrap-arounds, and
+(for generators with a lock) a histogram of the time spent acquiring it.
+
+Usage:
+    >>> from anyid.stats import to_prometheus
+    >>> from anyid.xid import XidGenerator
+    >>> generator = XidGenerator()
+    >>> stats = generator.enable_stats()
+    >>> _ = generator.generate_many(10)
+    >>> stats.ids_issued
+    10
+    >>> text = to_prometheus({"xid": stats})
+"""
+
+import bisect
+import threading
+import time
+from types import TracebackType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Type
+
+from . import _fork
+
+# Upper bounds, in seconds, of the lock wait histogram buckets. A final
+# +Inf bucket is implied.
+LOCK_WAIT_BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+
+class GeneratorStats:
+    """
+    Counters and a lock wait histogram for one generator.
+
+    All recording methods are thread-safe.
+
+    Attributes
+    ----------
+    ids_issued : int
+        The number of IDs handed out.
+    sequence_overflows : int
+        How often the generator ran out of sequence numbers (Snowflake) or
+        random space (ULID) and had to wait for the next millisecond.
+    wait_seconds : float
+        The total time spent spinning or sleeping for the next millisecond.
+    clock_regressions : int
+        How often the clock was observed moving backwards.
+    regression_waits : int
+        How many of those regressions were waited out (Snowflake's ``"wait"``
+        policy). The time waited is included in `wait_seconds`.
+    logical_clock_runs : int
+        How many of those regressions were bridged by carrying on from the
+        last timestamp (Snowflake's ``"logical"`` policy).
+    sequence_borrows : int
+        How often a generator borrowed sequence numbers from the next tick
+        instead of waiting for it (Snowflake's ``"borrow"`` policy).
+    counter_wraps : int
+        How often a wrapping counter (XID, CUID) went back to zero.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LOCK_WAIT_BUCKETS):
+        """
+        Initializes empty statistics.
+
+        Parameters
+        ----------
+        buckets : Sequence[float], optional
+            Upper bounds of the lock wait histogram buckets, in seconds.
+            Defaults to `LOCK_WAIT_BUCKETS`.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._clear()
+        _fork.track(self)
+
+    def _clear(self) -> None:
+        self.ids_issued = 0
+        self.sequence_overflows = 0
+        self.wait_seconds = 0.0
+        self.clock_regressions = 0
+        self.regression_waits = 0
+        self.logical_clock_runs = 0
+        self.sequence_borrows = 0
+        self.counter_wraps = 0
+        self._lock_wait_counts = [0] * (len(self.buckets) + 1)
+        self._lock_wait_sum = 0.0
+
+    def _after_fork(self) -> None:
+        # A forked child is a separate process with its own statistics.
+        self._lock = threading.Lock()
+        self._clear()
+
+    def record_ids(self, count: int = 1) -> None:
+        """Records that `count` IDs were issued."""
+        with self._lock:
+            self.ids_issued += count
+
+    def record_overflow(self) -> None:
+        """Records that the sequence or random space of a tick ran out."""
+        with self._lock:
+            self.sequence_overflows += 1
+
+    def record_wait(self, seconds: float) -> None:
+        """Records time spent waiting for the next clock tick."""
+        with self._lock:
+            self.wait_seconds += seconds
+
+    def record_clock_regression(self) -> None:
+        """Records that the clock was seen moving backwards."""
+        with self._lock:
+            self.clock_regressions += 1
+
+    def record_regression_wait(self, seconds: float) -> None:
+        """Records that a clock regression was waited out in `seconds`."""
+        with self._lock:
+            self.regression_waits += 1
+            self.wait_seconds += seconds
+
+    def record_logical_clock_run(self) -> None:
+        """Records that a clock regression was bridged by a logical clock."""
+        with self._lock:
+            self.logical_clock_runs += 1
+
+    def record_sequence_borrow(self) -> None:
+        """Records that sequence numbers were borrowed from the next tick."""
+        with self._lock:
+            self.sequence_borrows += 1
+
+    def record_counter_wraps(self, count: int = 1) -> None:
+        """Records that a wrapping counter went back to zero `count` times."""
+        with self._lock:
+            self.counter_wraps += count
+
+    def record_lock_wait(self, seconds: float) -> None:
+        """Records the time one acquisition of the generator's lock took."""
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self._lock_wait_counts[index] += 1
+            self._lock_wait_sum += seconds
+
+    def snapshot(self, reset: bool = False) -> Dict[str, Any]:
+        """
+        Returns a consistent copy of the statistics.
+
+        Parameters
+        ----------
+        reset : bool, optional
+            Clear the statistics in the same step, so no event is lost or
+            counted twice between consecutive snapshots. Defaults to False.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The counters, plus a ``lock_wait_seconds`` entry holding the
+            cumulative histogram buckets (keyed by upper bound, the last one
+            being ``"+Inf"``), the sum and the count.
+        """
+        with self._lock:
+            counts = list(self._lock_wait_counts)
+            result: Dict[str, Any] = {
+                "ids_issued": self.ids_issued,
+                "sequence_overflows": self.sequence_overflows,
+                "wait_seconds": self.wait_seconds,
+                "clock_regressions": self.clock_regressions,
+                "regression_waits": self.regression_waits,
+                "logical_clock_runs": self.logical_clock_runs,
+                "sequence_borrows": self.sequence_borrows,
+                "counter_wraps": self.counter_wraps,
+                "lock_wait_seconds": {"sum": self._lock_wait_sum},
+            }
+            if reset:
+                self._clear()
+
+        cumulative: Dict[str, int] = {}
+        running = 0
+        for bound, count in zip(list(map(repr, self.buckets)) + ["+Inf"], counts):
+            running += count
+            cumulative[bound] = running
+        result["lock_wait_seconds"]["buckets"] = cumulative
+        result["lock_wait_seconds"]["count"] = running
+        return result
+
+    def reset(self) -> None:
+        """Clears all statistics."""
+        with self._lock:
+            self._clear()
+
+
+class _TimedLock:
+    """
+    Wraps a generator's lock to record how long each acquisition waits.
+
+    The wrapped lock is shared, so swapping the wrapper in or out while
+    other threads use the generator never breaks mutual exclusion.
+    """
+
+    def __init__(self, inner: Any, stats: GeneratorStats):
+        self.inner = inner
+        self._stats = stats
+
+    def __enter__(self) -> bool:
+        if self.inner.acquire(False):
+            self._stats.record_lock_wait(0.0)
+            return True
+        start = time.perf_counter()
+        self.inner.acquire()
+        self._stats.record_lock_wait(time.perf_counter() - start)
+        return True
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.inner.release()
+
+
+class StatsMixin:
+    """
+    Adds the opt-in statistics surface to a generator class.
+
+    Classes with a lock name it in `_stats_lock_attribute` so that lock waits
+    can be timed.
+    """
+
+    stats: Optional[GeneratorStats] = None
+    _stats_lock_attribute: Optional[str] = None
+
+    def enable_stats(self, stats: Optional[GeneratorStats] = None) -> GeneratorStats:
+        """
+        Starts collecting statistics for this generator.
+
+        Parameters
+        ----------
+        stats : GeneratorStats, optional
+            The object to record into, e.g. to share one across generators.
+            Defaults to the currently enabled one, or a new one.
+
+        Returns
+        -------
+        GeneratorStats
+            The statistics being recorded into.
+        """
+        if stats is None:
+            stats = self.stats if self.stats is not None else GeneratorStats()
+        self.stats = stats
+        self._instrument_lock()
+        return stats
+
+    def disable_stats(self) -> Optional[GeneratorStats]:
+        """
+        Stops collecting statistics for this generator.
+
+        Returns
+        -------
+        Optional[GeneratorStats]
+            The statistics collected so far, or None if none were enabled.
+        """
+        stats, self.stats = self.stats, None
+        attribute = self._stats_lock_attribute
+        if attribute is not None:
+            lock = getattr(self, attribute)
+            if isinstance(lock, _TimedLock):
+                setattr(self, attribute, lock.inner)
+        return stats
+
+    def _instrument_lock(self) -> None:
+        """Wraps the generator's lock if statistics are enabled."""
+        attribute = self._stats_lock_attribute
+        if attribute is None or self.stats is None:
+            return
+        lock = getattr(self, attribute)
+        if isinstance(lock, _TimedLock):
+            lock = lock.inner
+        setattr(self, attribute, _TimedLock(lock, self.stats))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def to_prometheus(stats: Mapping[str, GeneratorStats], prefix: str = "anyid") -> str:
+    """
+    Renders statistics in the Prometheus text exposition format.
+
+    Parameters
+    ----------
+    stats : Mapping[str, GeneratorStats]
+        The statistics to export, keyed by the value of the ``generator``
+        label, e.g. ``{"ulid": ulid_generator.stats}``.
+    prefix : str, optional
+        The prefix of every metric name. Defaults to ``"anyid"``.
+
+    Returns
+    -------
+    str
+        The metrics, one sample per line, ending with a newline.
+    """
+    snapshots = {name: item.snapshot() for name, item in stats.items()}
+    counters = (
+        ("ids_issued", "ids_issued_total", "IDs issued."),
+        (
+            "sequence_overflows",
+            "sequence_overflows_total",
+            "Times the sequence or random space of a clock tick ran out.",
+        ),
+        (
+            "wait_seconds",
+            "wait_seconds_total",
+            "Time spent waiting for the next clock tick.",
+        ),
+        (
+            "clock_regressions",
+            "clock_regressions_total",
+            "Times the clock was seen moving backwards.",
+        ),
+        (
+            "regression_waits",
+            "regression_waits_total",
+            "Clock regressions waited out.",
+        ),
+        (
+            "logical_clock_runs",
+            "logical_clock_runs_total",
+            "Clock regressions bridged by continuing on the last timestamp.",
+        ),
+        (
+            "sequence_borrows",
+            "sequence_borrows_total",
+            "Times sequence numbers were borrowed from the next clock tick.",
+        ),
+        ("counter_wraps", "counter_wraps_total", "Times a counter wrapped to zero."),
+    )
+
+    lines: List[str] = []
+    for key, metric, description in counters:
+        name = f"{prefix}_{metric}"
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} counter")
+        for generator, snapshot in snapshots.items():
+            lines.append(f'{name}{{generator="{_escape(generator)}"}} {snapshot[key]}')
+
+    name = f"{prefix}_lock_wait_seconds"
+    lines.append(f"# HELP {name} Time spent acquiring the generator lock.")
+    lines.append(f"# TYPE {name} histogram")
+    for generator, snapshot in snapshots.items():
+        label = f'generator="{_escape(generator)}"'
+        histogram = snapshot["lock_wait_seconds"]
+        for bound, count in histogram["buckets"].items():
+            lines.append(f'{name}_bucket{{{label},le="{bound}"}} {count}')
+        lines.append(f"{name}_sum{{{label}}} {histogram['sum']}")
+        lines.append(f"{name}_count{{{label}}} {histogram['count']}")
+
+    return "\n".join(lines) + "\n"
@@ -1,3 +1,3 @@
-from .generator import ulid, ULIDGenerator as generator
+from .generator import ulid, parse_many, Ulid, UlidBlock, ULIDGenerator as generator
 
-__all__ = ["ulid", "generator"]
+__all__ = ["ulid", "generator", "Ulid", "UlidBlock", "parse_many"]
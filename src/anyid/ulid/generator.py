@@ -1,11 +1,405 @@
+import contextvars
 import time
-import secrets
 import threading
+from typing import (
+    TYPE_CHECKING,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
+
+from .. import _entropy, _fork, codec
+from ..clock import SYSTEM_CLOCK, Clock
+from ..stats import StatsMixin
+
+if TYPE_CHECKING:
+    import datetime
+    import uuid
+
+CROCKFORD_ALPHABET = codec.CROCKFORD_ALPHABET
+MAX_RANDOM = (1 << 80) - 1
+MAX_ULID = (1 << 128) - 1
+
+
+class Ulid:
+    """
+    Represents a parsed ULID.
+
+    Instances are immutable. The 16-byte form is stored once and the string
+    form is computed on first use. ULIDs compare and hash like their bytes,
+    so they sort in time order.
+    """
+
+    __slots__ = ("_bytes", "_str")
+
+    def __init__(self, data: bytes):
+        """
+        Initializes a ULID from its 16 bytes.
+
+        Parameters
+        ----------
+        data : bytes
+            The 48-bit big-endian timestamp followed by the 80 random bits.
+
+        Raises
+        ------
+        ValueError
+            If `data` is not 16 bytes long.
+        """
+        if len(data) != 16:
+            raise ValueError("ULID must be 16 bytes long")
+        self._bytes: bytes = bytes(data)
+        self._str: Optional[str] = None
+
+    @classmethod
+    def _from_valid_int(cls, value: int, encoded: Optional[str] = None) -> "Ulid":
+        """Builds a ULID from an integer known to fit in 128 bits."""
+        ulid = cls.__new__(cls)
+        ulid._bytes = value.to_bytes(16, "big")
+        ulid._str = encoded
+        return ulid
+
+    @classmethod
+    def from_str(cls, encoded: str) -> "Ulid":
+        """
+        Parses the 26-character string form of a ULID.
+
+        Parsing is case-insensitive.
+
+        Parameters
+        ----------
+        encoded : str
+            The Crockford base32 string.
+
+        Returns
+        -------
+        Ulid
+            The parsed ULID.
+
+        Raises
+        ------
+        ValueError
+            If `encoded` is not 26 characters long, contains an invalid
+            character or does not fit in 128 bits.
+        """
+        if len(encoded) != 26:
+            raise ValueError("ULID string must be 26 characters long")
+        value = codec.decode_base32_int(encoded)
+        if value > MAX_ULID:
+            raise ValueError("ULID string does not fit in 128 bits")
+        return cls._from_valid_int(value, encoded.upper())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Ulid":
+        """
+        Creates a ULID from its 16 bytes. See `Ulid`.
+        """
+        return cls(data)
+
+    @classmethod
+    def from_int(cls, value: int) -> "Ulid":
+        """
+        Creates a ULID from its 128-bit integer value.
+
+        Parameters
+        ----------
+        value : int
+            The integer value, as returned by `int(ulid)`.
+
+        Returns
+        -------
+        Ulid
+            The ULID with that value.
+
+        Raises
+        ------
+        ValueError
+            If `value` is negative or does not fit in 128 bits.
+        """
+        if not (0 <= value <= MAX_ULID):
+            raise ValueError("ULID value must be between 0 and 2**128 - 1")
+        return cls._from_valid_int(value)
+
+    @classmethod
+    def from_uuid(cls, value: "uuid.UUID") -> "Ulid":
+        """
+        Creates a ULID from a UUID holding the same 128 bits, e.g. one read
+        back from a database ``uuid`` column.
+
+        Parameters
+        ----------
+        value : uuid.UUID
+            The UUID.
+
+        Returns
+        -------
+        Ulid
+            The ULID with the same bytes.
+        """
+        return cls._from_valid_int(value.int)
+
+    @property
+    def timestamp_ms(self) -> int:
+        """The Unix time in milliseconds the ULID was created at."""
+        return int.from_bytes(self._bytes[:6], "big")
+
+    @property
+    def datetime(self) -> "datetime.datetime":
+        """The creation time as a timezone-aware UTC datetime."""
+        import datetime
+
+        return datetime.datetime.fromtimestamp(
+            self.timestamp_ms / 1000, tz=datetime.timezone.utc
+        )
+
+    @property
+    def random(self) -> int:
+        """The 80-bit random component."""
+        return int.from_bytes(self._bytes[6:], "big")
+
+    def to_bytes(self) -> bytes:
+        """Returns the 16-byte representation of the ULID."""
+        return self._bytes
+
+    def to_uuid(self) -> "uuid.UUID":
+        """
+        Returns the ULID as a UUID with the same 128 bits.
+
+        The UUID keeps the order of the ULID, but its version and variant
+        fields hold random bits.
+        """
+        from uuid import UUID
 
-CROCKFORD_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+        return UUID(bytes=self._bytes)
 
+    def __int__(self) -> int:
+        return int.from_bytes(self._bytes, "big")
 
-class ULIDGenerator:
+    def __str__(self) -> str:
+        """Returns the 26-character Crockford base32 string of the ULID."""
+        if self._str is None:
+            self._str = codec.encode_base32(self._bytes)
+        return self._str
+
+    def __repr__(self) -> str:
+        """Returns a developer-friendly representation of the ULID."""
+        return f"Ulid({str(self)!r})"
+
+    def __hash__(self) -> int:
+        return hash(self._bytes)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Ulid):
+            return NotImplemented
+        return self._bytes == other._bytes
+
+    def __lt__(self, other: "Ulid") -> bool:
+        if not isinstance(other, Ulid):
+            return NotImplemented
+        return self._bytes < other._bytes
+
+    def __le__(self, other: "Ulid") -> bool:
+        if not isinstance(other, Ulid):
+            return NotImplemented
+        return self._bytes <= other._bytes
+
+    def __gt__(self, other: "Ulid") -> bool:
+        if not isinstance(other, Ulid):
+            return NotImplemented
+        return self._bytes > other._bytes
+
+    def __ge__(self, other: "Ulid") -> bool:
+        if not isinstance(other, Ulid):
+            return NotImplemented
+        return self._bytes >= other._bytes
+
+
+def parse_many(items: Iterable[str]) -> List[Ulid]:
+    """
+    Parses many ULID strings at once.
+
+    The strings are decoded together in a single pass (see
+    `codec.decode_base32_int_many`), which is several times faster than
+    calling `Ulid.from_str` for each.
+
+    Parameters
+    ----------
+    items : Iterable[str]
+        The 26-character ULID strings.
+
+    Returns
+    -------
+    List[Ulid]
+        The parsed ULIDs, in the order of `items`.
+
+    Raises
+    ------
+    ValueError
+        If a string is not a valid ULID.
+    """
+    items = list(items)
+    values = codec.decode_base32_int_many(items, 26)
+    from_int = Ulid._from_valid_int
+    ulids: List[Ulid] = []
+    for value, encoded in zip(values, items):
+        if value > MAX_ULID:
+            raise ValueError("ULID string does not fit in 128 bits")
+        ulids.append(from_int(value, encoded.upper()))
+    return ulids
+
+
+class UlidBlock:
+    """
+    A block of consecutive ULIDs reserved with `ULIDGenerator.reserve`.
+
+    All ULIDs of a block share one millisecond and have consecutive random
+    components, so they are contiguous and strictly increasing. The block is
+    a lazy sequence of ULID strings: nothing is encoded until an item is
+    accessed. Slicing with a step of 1 returns a sub-block; other slices
+    return a list of strings.
+
+    Attributes
+    ----------
+    timestamp_ms : int
+        The Unix time in milliseconds of every ULID in the block.
+    start : int
+        The random component of the first ULID.
+    count : int
+        The number of ULIDs.
+    """
+
+    __slots__ = ("timestamp_ms", "start", "count")
+
+    def __init__(self, timestamp_ms: int, start: int, count: int):
+        self.timestamp_ms = timestamp_ms
+        self.start = start
+        self.count = count
+
+    def ints(self) -> range:
+        """Returns the 128-bit integer values of the ULIDs, as a range."""
+        first = (self.timestamp_ms << 80) | self.start
+        return range(first, first + self.count)
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the 16-byte forms of all ULIDs, concatenated.
+
+        ULID ``i`` of the block is at ``[16 * i:16 * i + 16]``.
+        """
+        return b"".join([value.to_bytes(16, "big") for value in self.ints()])
+
+    def __len__(self) -> int:
+        return self.count
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Union["UlidBlock", List[str]]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[str, "UlidBlock", List[str]]:
+        if isinstance(index, slice):
+            indices = range(self.count)[index]
+            if indices.step == 1:
+                return UlidBlock(
+                    self.timestamp_ms, self.start + indices.start, len(indices)
+                )
+            return [self[i] for i in indices]
+        if index < 0:
+            index += self.count
+        if not (0 <= index < self.count):
+            raise IndexError("UlidBlock index out of range")
+        return codec.encode_base32_int(
+            (self.timestamp_ms << 80) | (self.start + index), 26
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        encode = codec.encode_base32_int
+        for value in self.ints():
+            yield encode(value, 26)
+
+    def __repr__(self) -> str:
+        """Returns a developer-friendly representation of the block."""
+        return (
+            f"UlidBlock(timestamp_ms={self.timestamp_ms}, start={self.start}, "
+            f"count={self.count})"
+        )
+
+
+def _block_start(
+    ms_time: int, last_ms: int, last_random: int, n: int
+) -> Tuple[int, int]:
+    """
+    Places a block of `n` ULIDs after the last one issued.
+
+    Returns the millisecond and first random value of the block: right after
+    the last ULID if the clock has not moved past it, otherwise a fresh
+    random value in the current millisecond. If the block would overflow the
+    random component, it moves to the following millisecond, with a fresh
+    random value low enough for the block to fit.
+    """
+    if ms_time <= last_ms:
+        ms_time, start = last_ms, last_random + 1
+    else:
+        start = int.from_bytes(_entropy.token_bytes(10), "big")
+    if start + n - 1 > MAX_RANDOM:
+        ms_time += 1
+        start = int.from_bytes(_entropy.token_bytes(10), "big") % (MAX_RANDOM + 2 - n)
+    return ms_time, start
+
+
+class _Stream:
+    """The monotonic state of one stream in sharded mode."""
+
+    __slots__ = ("last_ms", "last_random", "thread")
+
+    def __init__(self) -> None:
+        self.last_ms = 0
+        self.last_random = 0
+        # The thread the stream belongs to.
+        self.thread = threading.get_ident()
+
+
+class _ThreadStreams(threading.local):
+    """One stream per thread."""
+
+    def __init__(self) -> None:
+        self.stream = _Stream()
+
+    def get(self) -> _Stream:
+        return self.stream
+
+
+class _TaskStreams:
+    """
+    One stream per context, i.e. per asyncio task.
+
+    A task inherits the stream of the context it was created in, if that
+    context already had one. A stream is never used from two threads: a
+    context copied into another thread (e.g. by `asyncio.to_thread`) gets a
+    new one.
+    """
+
+    def __init__(self) -> None:
+        self._var: "contextvars.ContextVar[_Stream]" = contextvars.ContextVar(
+            "anyid_ulid_stream"
+        )
+
+    def get(self) -> _Stream:
+        stream = self._var.get(None)
+        if stream is None or stream.thread != threading.get_ident():
+            stream = _Stream()
+            self._var.set(stream)
+        return stream
+
+
+class ULIDGenerator(StatsMixin):
     """
     Generates Universally Unique Lexicographically Sortable Identifiers (ULIDs).
 
@@ -14,16 +408,215 @@ class ULIDGenerator:
     the same millisecond.
     """
 
-    def __init__(self):
+    _stats_lock_attribute = "_lock"
+
+    def __init__(
+        self, sharded: Union[bool, str] = False, clock: Optional[Clock] = None
+    ):
         """
         Initializes the ULIDGenerator.
 
         Sets up the internal state to track the last generated timestamp
         and random bytes for monotonic ULID generation.
+
+        Parameters
+        ----------
+        sharded : bool or str, optional
+            Give every thread (True or ``"thread"``) or every asyncio task
+            (``"task"``) its own monotonic stream with its own random base,
+            so no lock is shared between them. ULIDs stay strictly increasing
+            within each stream and unique across streams, but are no longer
+            monotonic across streams within one millisecond. Defaults to
+            False.
+        clock : Clock, optional
+            The clock timestamps are read from. Defaults to the system clock.
+
+        Raises
+        ------
+        ValueError
+            If `sharded` is not a bool, ``"thread"`` or ``"task"``.
         """
+        if sharded not in (False, True, "thread", "task"):
+            raise ValueError('Sharded must be a bool, "thread" or "task".')
+        self.clock = clock if clock is not None else SYSTEM_CLOCK
         self._last_ms = 0
-        self._last_random_bytes = b""
+        self._last_random = 0
+        self._lock = threading.Lock()
+        self._sharded = sharded
+        self._streams = self._new_streams()
+        _fork.track(self)
+
+    def _new_streams(self) -> Union[_ThreadStreams, _TaskStreams, None]:
+        """Creates the streams of sharded mode, or None if not sharded."""
+        if self._sharded == "task":
+            return _TaskStreams()
+        if self._sharded:
+            return _ThreadStreams()
+        return None
+
+    def _after_fork(self) -> None:
+        """
+        Re-initializes the monotonic state in a forked child.
+
+        Otherwise parent and child would both increment the same random
+        component within the same millisecond and produce identical ULIDs.
+        """
         self._lock = threading.Lock()
+        self._instrument_lock()
+        self._last_ms = 0
+        self._last_random = 0
+        self._streams = self._new_streams()
+
+    def _reserve(self, n: int) -> Optional[Tuple[int, int, int]]:
+        """
+        Reserves up to `n` consecutive ULIDs in the current millisecond.
+
+        Parameters
+        ----------
+        n : int
+            The maximum number of ULIDs to reserve.
+
+        Returns
+        -------
+        Optional[Tuple[int, int, int]]
+            The millisecond, the first random value and the number of ULIDs
+            reserved, or None if the random component of the current
+            millisecond is exhausted. The caller decides how to wait for the
+            next millisecond.
+        """
+        streams = self._streams
+        if streams is not None:
+            return self._reserve_in_stream(streams.get(), n)
+
+        with self._lock:
+            ms_time = self.clock.time_ns() // 1_000_000
+
+            if ms_time <= self._last_ms:
+                # Same millisecond, or the clock is behind IDs already
+                # issued: continue from the last ULID.
+                ms_time = self._last_ms
+                start = self._last_random + 1
+                if start > MAX_RANDOM:
+                    return None
+            else:
+                start = int.from_bytes(_entropy.token_bytes(10), "big")
+
+            count = min(n, MAX_RANDOM + 1 - start)
+            self._last_ms = ms_time
+            self._last_random = start + count - 1
+        if self.stats is not None:
+            self.stats.record_ids(count)
+        return ms_time, start, count
+
+    def _reserve_in_stream(
+        self, stream: _Stream, n: int
+    ) -> Optional[Tuple[int, int, int]]:
+        """Like `_reserve`, but from the calling thread's own stream."""
+        ms_time = self.clock.time_ns() // 1_000_000
+
+        if ms_time <= stream.last_ms:
+            ms_time = stream.last_ms
+            start = stream.last_random + 1
+            if start > MAX_RANDOM:
+                return None
+        else:
+            start = int.from_bytes(_entropy.token_bytes(10), "big")
+
+        count = min(n, MAX_RANDOM + 1 - start)
+        stream.last_ms = ms_time
+        stream.last_random = start + count - 1
+        if self.stats is not None:
+            self.stats.record_ids(count)
+        return ms_time, start, count
+
+    def reserve(self, n: int) -> UlidBlock:
+        """
+        Reserves `n` contiguous ULIDs in one step.
+
+        The random component is advanced by `n` under a single lock
+        acquisition, so the block holds strictly increasing ULIDs of one
+        millisecond with consecutive random components. Only if the block
+        would overflow the random component does it move to the next
+        millisecond (ahead of the clock) with fresh randomness. Later ULIDs
+        from this generator continue after the block.
+
+        Parameters
+        ----------
+        n : int
+            The number of ULIDs to reserve.
+
+        Returns
+        -------
+        UlidBlock
+            The reserved ULIDs.
+
+        Raises
+        ------
+        ValueError
+            If `n` is less than 1 or larger than the random space (2**80).
+        """
+        if not (1 <= n <= MAX_RANDOM + 1):
+            raise ValueError("The number of IDs must be between 1 and 2**80.")
+        streams = self._streams
+        if streams is not None:
+            stream = streams.get()
+            ms_time, start = _block_start(
+                self.clock.time_ns() // 1_000_000,
+                stream.last_ms,
+                stream.last_random,
+                n,
+            )
+            stream.last_ms = ms_time
+            stream.last_random = start + n - 1
+        else:
+            with self._lock:
+                ms_time, start = _block_start(
+                    self.clock.time_ns() // 1_000_000,
+                    self._last_ms,
+                    self._last_random,
+                    n,
+                )
+                self._last_ms = ms_time
+                self._last_random = start + n - 1
+        if self.stats is not None:
+            self.stats.record_ids(n)
+        return UlidBlock(ms_time, start, n)
+
+    def _try_generate(self) -> Optional[str]:
+        """
+        Generates a new ULID unless the current millisecond is used up.
+
+        Returns
+        -------
+        Optional[str]
+            The new ULID, or None if the random component of the current
+            millisecond is exhausted.
+        """
+        reserved = self._reserve(1)
+        if reserved is None:
+            return None
+        ms_time, random_int, _ = reserved
+        return codec.encode_base32_int((ms_time << 80) | random_int, 26)
+
+    def _take_many(self, n: int) -> List[str]:
+        """
+        Generates up to `n` ULIDs from the current millisecond.
+
+        Parameters
+        ----------
+        n : int
+            The maximum number of ULIDs to generate.
+
+        Returns
+        -------
+        List[str]
+            The new ULIDs in increasing order. The list is empty if the random
+            component of the current millisecond is exhausted.
+        """
+        reserved = self._reserve(n)
+        if reserved is None:
+            return []
+        return self._encode_runs([reserved])
 
     def generate(self) -> str:
         """
@@ -38,33 +631,217 @@ class ULIDGenerator:
         str
             A 26-character Crockford's Base32 encoded ULID string.
         """
-        with self._lock:
-            ms_time = int(time.time() * 1000)
-
-            if ms_time == self._last_ms:
-                last_random_int = int.from_bytes(self._last_random_bytes, "big")
-
-                if last_random_int >= (1 << 80) - 1:
-                    # Random part is at its max, wait for the next millisecond
-                    while int(time.time() * 1000) == ms_time:
-                        time.sleep(0.0001)  # Sleep for 0.1ms
-
-                    ms_time = int(time.time() * 1000)
-                    random_bytes = secrets.token_bytes(10)
-                else:
-                    # Increment the random part
-                    new_random_int = last_random_int + 1
-                    random_bytes = new_random_int.to_bytes(10, "big")
-            else:
-                random_bytes = secrets.token_bytes(10)
+        ms_time, random_int, _ = self._reserve_waiting(1)
+        return codec.encode_base32_int((ms_time << 80) | random_int, 26)
 
-            self._last_ms = ms_time
-            self._last_random_bytes = random_bytes
+    def generate_int(self) -> int:
+        """
+        Generates a new ULID as a 128-bit integer.
 
-        timestamp_bytes = ms_time.to_bytes(6, "big")
-        ulid_bytes = timestamp_bytes + random_bytes
+        Returns
+        -------
+        int
+            The integer value of the new ULID.
+        """
+        ms_time, random_int, _ = self._reserve_waiting(1)
+        return (ms_time << 80) | random_int
+
+    def generate_bytes(self) -> bytes:
+        """
+        Generates a new ULID in its 16-byte binary form.
+
+        This is the form to store in a ``BLOB(16)`` or ``BINARY(16)`` column;
+        no string is built.
+
+        Returns
+        -------
+        bytes
+            The 16 big-endian bytes of the new ULID.
+        """
+        return self.generate_int().to_bytes(16, "big")
 
-        return self.encode_base32(ulid_bytes)
+    def generate_uuid(self) -> "uuid.UUID":
+        """
+        Generates a new ULID as a `uuid.UUID`, for ``uuid`` columns.
+
+        Returns
+        -------
+        uuid.UUID
+            A UUID holding the 128 bits of the new ULID. See `Ulid.to_uuid`.
+        """
+        from uuid import UUID
+
+        return UUID(int=self.generate_int())
+
+    def _reserve_waiting(self, n: int) -> Tuple[int, int, int]:
+        """
+        Reserves up to `n` ULIDs, waiting for the next millisecond if the
+        random component of the current one is exhausted. See `_reserve` for
+        the result.
+        """
+        reserved = self._reserve(n)
+        if reserved is None:
+            started = time.perf_counter()
+            while reserved is None:
+                # Random part is at its max, wait for the next millisecond
+                time.sleep(0.0001)  # Sleep for 0.1ms
+                reserved = self._reserve(n)
+            if self.stats is not None:
+                self.stats.record_overflow()
+                self.stats.record_wait(time.perf_counter() - started)
+        return reserved
+
+    def _reserve_runs(self, n: int) -> List[Tuple[int, int, int]]:
+        """
+        Reserves exactly `n` ULIDs as runs of (millisecond, first random
+        value, count), waiting for the clock if need be.
+        """
+        if n < 0:
+            raise ValueError("The number of IDs must be non-negative.")
+        runs: List[Tuple[int, int, int]] = []
+        remaining = n
+        while remaining:
+            reserved = self._reserve_waiting(remaining)
+            runs.append(reserved)
+            remaining -= reserved[2]
+        return runs
+
+    def generate_many(self, n: int) -> List[str]:
+        """
+        Generates `n` ULIDs in one batch.
+
+        The lock is normally taken once and the clock read once: the random
+        component is drawn a single time for the tick and then incremented
+        for every further ULID, exactly as repeated calls of `generate`
+        within the same millisecond would. Only if the random component
+        would overflow does the batch move on to the next millisecond.
+        Encoding happens after the lock is released.
+
+        Parameters
+        ----------
+        n : int
+            The number of ULIDs to generate.
+
+        Returns
+        -------
+        List[str]
+            The new ULIDs in strictly increasing order.
+
+        Raises
+        ------
+        ValueError
+            If `n` is negative.
+        """
+        return self._encode_runs(self._reserve_runs(n))
+
+    def generate_many_ints(self, n: int) -> List[int]:
+        """
+        Generates `n` ULIDs in one batch, as 128-bit integers.
+
+        Like `generate_many`, but nothing is encoded.
+
+        Parameters
+        ----------
+        n : int
+            The number of ULIDs to generate.
+
+        Returns
+        -------
+        List[int]
+            The integer values of the new ULIDs in strictly increasing order.
+
+        Raises
+        ------
+        ValueError
+            If `n` is negative.
+        """
+        ints: List[int] = []
+        for ms_time, start, count in self._reserve_runs(n):
+            first = (ms_time << 80) | start
+            ints.extend(range(first, first + count))
+        return ints
+
+    def generate_many_bytes(self, n: int) -> List[bytes]:
+        """
+        Generates `n` ULIDs in one batch, in their 16-byte binary form.
+
+        Parameters
+        ----------
+        n : int
+            The number of ULIDs to generate.
+
+        Returns
+        -------
+        List[bytes]
+            The new ULIDs in strictly increasing order.
+
+        Raises
+        ------
+        ValueError
+            If `n` is negative.
+        """
+        return [value.to_bytes(16, "big") for value in self.generate_many_ints(n)]
+
+    def generate_many_uuids(self, n: int) -> List["uuid.UUID"]:
+        """
+        Generates `n` ULIDs in one batch, as `uuid.UUID` objects.
+
+        Parameters
+        ----------
+        n : int
+            The number of ULIDs to generate.
+
+        Returns
+        -------
+        List[uuid.UUID]
+            The new ULIDs in strictly increasing order.
+
+        Raises
+        ------
+        ValueError
+            If `n` is negative.
+        """
+        from uuid import UUID
+
+        return [UUID(int=value) for value in self.generate_many_ints(n)]
+
+    def _encode_runs(self, runs: List[Tuple[int, int, int]]) -> List[str]:
+        """Encodes runs of consecutive ULIDs returned by `_reserve`."""
+        encode = codec.encode_base32_int
+        ulids: List[str] = []
+        for ms_time, start, count in runs:
+            base = ms_time << 80
+            ulids.extend(
+                [
+                    encode(base | random_int, 26)
+                    for random_int in range(start, start + count)
+                ]
+            )
+        return ulids
+
+    def iter_ids(self, chunk_size: int = 1024) -> Iterator[str]:
+        """
+        Yields ULIDs forever, generating them `chunk_size` at a time.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            The number of ULIDs generated per batch. Defaults to 1024.
+
+        Yields
+        ------
+        str
+            A 26-character Crockford's Base32 encoded ULID string.
+
+        Raises
+        ------
+        ValueError
+            If `chunk_size` is less than 1.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        while True:
+            yield from self.generate_many(chunk_size)
 
     def encode_base32(self, data: bytes) -> str:
         """
@@ -87,13 +864,7 @@ class ULIDGenerator:
         """
         if len(data) != 16:
             raise ValueError("Data must be 16 bytes long")
-
-        num = int.from_bytes(data, "big")
-        encoded = ""
-        for _ in range(26):
-            num, remainder = divmod(num, 32)
-            encoded = CROCKFORD_ALPHABET[remainder] + encoded
-        return encoded
+        return codec.encode_base32(data)
 
     def decode_base32(self, encoded: str) -> bytes:
         """
@@ -117,20 +888,7 @@ class ULIDGenerator:
         """
         if len(encoded) != 26:
             raise ValueError("ULID string must be 26 characters long")
-
-        num = 0
-        for char in encoded:
-            try:
-                value = CROCKFORD_ALPHABET.index(char.upper())
-                num = num * 32 + value
-            except ValueError:
-                raise ValueError(f"Invalid character '{char}' in ULID string")
-
-        # Check if the number is too large for 128 bits
-        if num >= (1 << 128):
-            raise ValueError("Invalid ULID string: larger than 128 bits")
-
-        return num.to_bytes(16, "big")
+        return codec.decode_base32(encoded, 16)
 
 
 _generator = ULIDGenerator()
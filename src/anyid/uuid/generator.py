@@ -1,12 +1,16 @@
 import uuid as _uuid
+from typing import Iterator, List
 
+from .. import _entropy
+from ..stats import StatsMixin
 
-class UuidGenerator:
+
+class UuidGenerator(StatsMixin):
     """
     A generator for creating Version 4 UUIDs (Universally Unique Identifiers).
 
-    This class uses Python's built-in `uuid` module to generate random,
-    RFC 4122 compliant UUIDs.
+    This class uses Python's built-in `uuid` module to build random,
+    RFC 4122 compliant UUIDs from anyid's shared entropy pool.
 
     Usage:
         >>> generator = UuidGenerator()
@@ -29,7 +33,52 @@ class UuidGenerator:
             >>> new_uuid.version
             4
         """
-        return _uuid.uuid4()
+        if self.stats is not None:
+            self.stats.record_ids()
+        return _uuid.UUID(bytes=_entropy.token_bytes(16), version=4)
+
+    def generate_many(self, n: int) -> List[_uuid.UUID]:
+        """
+        Generates `n` random Version 4 UUIDs in one batch.
+
+        The random bits of every UUID come from a single draw of the shared
+        entropy pool instead of one draw per UUID.
+
+        Args:
+            n: The number of UUIDs to generate.
+
+        Returns:
+            A list of new UUID objects.
+
+        Raises:
+            ValueError: If `n` is negative.
+        """
+        if n < 0:
+            raise ValueError("The number of IDs must be non-negative.")
+        if self.stats is not None:
+            self.stats.record_ids(n)
+        data = _entropy.token_bytes(16 * n)
+        return [
+            _uuid.UUID(bytes=data[i : i + 16], version=4) for i in range(0, 16 * n, 16)
+        ]
+
+    def iter_ids(self, chunk_size: int = 1024) -> Iterator[_uuid.UUID]:
+        """
+        Yields random Version 4 UUIDs forever, `chunk_size` at a time.
+
+        Args:
+            chunk_size: The number of UUIDs generated per batch.
+
+        Yields:
+            A new UUID object.
+
+        Raises:
+            ValueError: If `chunk_size` is less than 1.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        while True:
+            yield from self.generate_many(chunk_size)
 
 
 _uuid_generator = UuidGenerator()
@@ -1,9 +1,14 @@
-import datetime
-import hashlib
 import os
 import threading
-import time
+from typing import TYPE_CHECKING, Iterator, List, Optional
 
+from .. import _entropy, _fork, codec
+from .._sharding import CounterBlocks
+from ..clock import SYSTEM_CLOCK, Clock
+from ..stats import StatsMixin
+
+if TYPE_CHECKING:
+    import datetime
 
 # XID constants
 TIMESTAMP_BYTES = 4
@@ -12,6 +17,9 @@ PROCESS_ID_BYTES = 2
 COUNTER_BYTES = 3
 XID_BYTES = TIMESTAMP_BYTES + MACHINE_ID_BYTES + PROCESS_ID_BYTES + COUNTER_BYTES
 
+_PROCESS_ID_OFFSET = TIMESTAMP_BYTES + MACHINE_ID_BYTES
+_COUNTER_OFFSET = _PROCESS_ID_OFFSET + PROCESS_ID_BYTES
+
 
 def _generate_machine_id() -> bytes:
     """
@@ -20,6 +28,8 @@ def _generate_machine_id() -> bytes:
     Returns:
         A 3-byte machine identifier.
     """
+    import hashlib
+
     hostname = os.uname().nodename
     hash_bytes = hashlib.sha256(hostname.encode()).digest()
     return hash_bytes[:MACHINE_ID_BYTES]
@@ -37,7 +47,15 @@ def _generate_process_id() -> bytes:
 
 
 class Xid:
-    """Represents a globally unique, time-sortable XID."""
+    """
+    Represents a globally unique, time-sortable XID.
+
+    Instances are immutable. The 12-byte form is stored once and the string
+    form is computed on first use, so comparing, hashing and printing the
+    same XID repeatedly is cheap.
+    """
+
+    __slots__ = ("_bytes", "_str")
 
     def __init__(
         self, timestamp: int, machine_id: bytes, process_id: bytes, counter: int
@@ -54,7 +72,11 @@ class Xid:
         Raises:
             ValueError: If any component has invalid length or value.
         """
-        if not isinstance(timestamp, int) or timestamp < 0:
+        if (
+            not isinstance(timestamp, int)
+            or timestamp < 0
+            or timestamp >= 1 << (TIMESTAMP_BYTES * 8)
+        ):
             raise ValueError("Timestamp must be a non-negative integer.")
         if not isinstance(machine_id, bytes) or len(machine_id) != MACHINE_ID_BYTES:
             raise ValueError(f"Machine ID must be {MACHINE_ID_BYTES} bytes.")
@@ -69,20 +91,51 @@ class Xid:
                 f"Counter must be between 0 and {(1 << (COUNTER_BYTES * 8)) - 1}."
             )
 
-        self.timestamp = timestamp
-        self.machine_id = machine_id
-        self.process_id = process_id
-        self.counter = counter
+        self._bytes: bytes = (
+            timestamp.to_bytes(TIMESTAMP_BYTES, "big")
+            + machine_id
+            + process_id
+            + counter.to_bytes(COUNTER_BYTES, "big")
+        )
+        self._str: Optional[str] = None
+
+    @classmethod
+    def _from_valid_bytes(cls, data: bytes) -> "Xid":
+        """Builds an XID from 12 bytes known to be valid, skipping checks."""
+        xid = cls.__new__(cls)
+        xid._bytes = data
+        xid._str = None
+        return xid
+
+    @property
+    def timestamp(self) -> int:
+        """Unix timestamp in seconds."""
+        return int.from_bytes(self._bytes[:TIMESTAMP_BYTES], "big")
+
+    @property
+    def machine_id(self) -> bytes:
+        """3-byte machine identifier."""
+        return self._bytes[TIMESTAMP_BYTES:_PROCESS_ID_OFFSET]
+
+    @property
+    def process_id(self) -> bytes:
+        """2-byte process identifier."""
+        return self._bytes[_PROCESS_ID_OFFSET:_COUNTER_OFFSET]
+
+    @property
+    def counter(self) -> int:
+        """3-byte counter value."""
+        return int.from_bytes(self._bytes[_COUNTER_OFFSET:], "big")
 
     def __str__(self) -> str:
         """Returns the 24-character hexadecimal string representation of the XID."""
-        return self.to_bytes().hex()
+        if self._str is None:
+            self._str = codec.encode_hex(self._bytes)
+        return self._str
 
     def to_bytes(self) -> bytes:
         """Returns the 12-byte representation of the XID."""
-        timestamp_bytes = self.timestamp.to_bytes(TIMESTAMP_BYTES, "big")
-        counter_bytes = self.counter.to_bytes(COUNTER_BYTES, "big")
-        return timestamp_bytes + self.machine_id + self.process_id + counter_bytes
+        return self._bytes
 
     def __repr__(self) -> str:
         """Returns a developer-friendly representation of the XID."""
@@ -93,31 +146,49 @@ class Xid:
             f"counter={self.counter})"
         )
 
-    def __lt__(self, other):
-        """Compares this XID with another for sorting."""
+    def __hash__(self) -> int:
+        """Returns a hash consistent with equality."""
+        return hash(self._bytes)
+
+    def __eq__(self, other: object) -> bool:
+        """Checks if this XID is equal to another."""
         if not isinstance(other, Xid):
             return NotImplemented
-        return self.to_bytes() < other.to_bytes()
+        return self._bytes == other._bytes
 
-    def __eq__(self, other):
-        """Checks if this XID is equal to another."""
+    def __lt__(self, other: "Xid") -> bool:
+        """Compares this XID with another for sorting."""
         if not isinstance(other, Xid):
             return NotImplemented
-        return self.to_bytes() == other.to_bytes()
+        return self._bytes < other._bytes
 
-    def __le__(self, other):
+    def __le__(self, other: "Xid") -> bool:
         """Checks if this XID is less than or equal to another."""
         if not isinstance(other, Xid):
             return NotImplemented
-        return self.to_bytes() <= other.to_bytes()
+        return self._bytes <= other._bytes
+
+    def __gt__(self, other: "Xid") -> bool:
+        """Checks if this XID is greater than another."""
+        if not isinstance(other, Xid):
+            return NotImplemented
+        return self._bytes > other._bytes
 
-    def get_timestamp(self) -> datetime.datetime:
+    def __ge__(self, other: "Xid") -> bool:
+        """Checks if this XID is greater than or equal to another."""
+        if not isinstance(other, Xid):
+            return NotImplemented
+        return self._bytes >= other._bytes
+
+    def get_timestamp(self) -> "datetime.datetime":
         """
         Returns the timestamp as a UTC datetime object.
 
         Returns:
             The timestamp as a timezone-aware datetime in UTC.
         """
+        import datetime
+
         return datetime.datetime.fromtimestamp(self.timestamp, tz=datetime.timezone.utc)
 
     @classmethod
@@ -140,7 +211,7 @@ class Xid:
             )
 
         try:
-            xid_bytes = bytes.fromhex(xid_str)
+            xid_bytes = codec.decode_hex(xid_str)
         except ValueError:
             raise ValueError("XID string must contain valid hexadecimal characters.")
 
@@ -163,27 +234,10 @@ class Xid:
         if len(xid_bytes) != XID_BYTES:
             raise ValueError(f"XID must be {XID_BYTES} bytes.")
 
-        timestamp = int.from_bytes(xid_bytes[:TIMESTAMP_BYTES], "big")
-        machine_id = xid_bytes[TIMESTAMP_BYTES : TIMESTAMP_BYTES + MACHINE_ID_BYTES]
-        process_id = xid_bytes[
-            TIMESTAMP_BYTES
-            + MACHINE_ID_BYTES : TIMESTAMP_BYTES
-            + MACHINE_ID_BYTES
-            + PROCESS_ID_BYTES
-        ]
-        counter = int.from_bytes(
-            xid_bytes[TIMESTAMP_BYTES + MACHINE_ID_BYTES + PROCESS_ID_BYTES :], "big"
-        )
+        return cls._from_valid_bytes(bytes(xid_bytes))
 
-        return cls(
-            timestamp=timestamp,
-            machine_id=machine_id,
-            process_id=process_id,
-            counter=counter,
-        )
 
-
-class XidGenerator:
+class XidGenerator(StatsMixin):
     """
     A thread-safe generator for creating globally unique XIDs.
 
@@ -197,18 +251,64 @@ class XidGenerator:
         >>> print(xid)
     """
 
-    def __init__(self):
+    _stats_lock_attribute = "_lock"
+
+    def __init__(self, sharded: bool = False, clock: Optional[Clock] = None):
         """
         Initializes a new XidGenerator.
 
         The machine ID and process ID are generated once and reused for all XIDs.
         The counter starts at a random value for better distribution.
+
+        Args:
+            sharded: Give every thread its own block of counter values, so
+                     `generate` only takes the lock once per block. This lets
+                     generation scale across cores on free-threaded builds,
+                     but XIDs from different threads are no longer issued in
+                     counter order.
+            clock: The clock timestamps are read from. Defaults to the
+                   system clock.
         """
+        self.clock = clock if clock is not None else SYSTEM_CLOCK
         self._machine_id = _generate_machine_id()
         self._process_id = _generate_process_id()
-        self._counter = int.from_bytes(os.urandom(COUNTER_BYTES), "big")
+        self._counter = int.from_bytes(_entropy.token_bytes(COUNTER_BYTES), "big")
         self._counter_max = (1 << (COUNTER_BYTES * 8)) - 1
         self._lock = threading.Lock()
+        self._blocks: Optional[CounterBlocks] = CounterBlocks() if sharded else None
+        _fork.track(self)
+
+    def _after_fork(self) -> None:
+        """
+        Re-initializes per-process state in a forked child.
+
+        The child gets its own process ID and a fresh random counter, so its
+        XIDs cannot overlap with those of the parent.
+        """
+        self._lock = threading.Lock()
+        self._instrument_lock()
+        self._process_id = _generate_process_id()
+        self._counter = int.from_bytes(_entropy.token_bytes(COUNTER_BYTES), "big")
+        if self._blocks is not None:
+            self._blocks.reset()
+
+    def _reserve_counters(self, n: int) -> int:
+        """
+        Reserves `n` consecutive counter values.
+
+        Args:
+            n: The number of counter values.
+
+        Returns:
+            The first reserved value. The others follow it modulo the
+            counter's range.
+        """
+        with self._lock:
+            start = self._counter
+            self._counter = (start + n) % (self._counter_max + 1)
+        if self.stats is not None:
+            self.stats.record_counter_wraps((start + n) // (self._counter_max + 1))
+        return start
 
     def generate(self) -> Xid:
         """
@@ -226,10 +326,26 @@ class XidGenerator:
             >>> isinstance(new_xid, Xid)
             True
         """
+        if self._blocks is not None:
+            counter = self._blocks.next(self._reserve_counters) & self._counter_max
+            timestamp = self.clock.time_ns() // 1_000_000_000
+            if self.stats is not None:
+                self.stats.record_ids()
+            return Xid(
+                timestamp=timestamp,
+                machine_id=self._machine_id,
+                process_id=self._process_id,
+                counter=counter,
+            )
+
         with self._lock:
-            timestamp = int(time.time())
+            timestamp = self.clock.time_ns() // 1_000_000_000
             counter = self._counter
             self._counter = (self._counter + 1) % (self._counter_max + 1)
+        if self.stats is not None:
+            self.stats.record_ids()
+            if counter == self._counter_max:
+                self.stats.record_counter_wraps()
 
         return Xid(
             timestamp=timestamp,
@@ -238,19 +354,91 @@ class XidGenerator:
             counter=counter,
         )
 
+    def generate_many(self, n: int) -> List[Xid]:
+        """
+        Generates `n` XID objects in one batch.
+
+        A block of `n` consecutive counter values is reserved with a single
+        lock acquisition and the clock is read once, so the batch matches
+        `n` back-to-back `generate` calls within one second.
+
+        Args:
+            n: The number of XIDs to generate.
+
+        Returns:
+            A list of new Xid objects in counter order.
+
+        Raises:
+            ValueError: If `n` is negative.
+        """
+        if n < 0:
+            raise ValueError("The number of IDs must be non-negative.")
+        start = self._reserve_counters(n)
+        timestamp = self.clock.time_ns() // 1_000_000_000
+        if self.stats is not None:
+            self.stats.record_ids(n)
+
+        counter_max = self._counter_max
+        prefix = (
+            timestamp.to_bytes(TIMESTAMP_BYTES, "big")
+            + self._machine_id
+            + self._process_id
+        )
+        from_bytes = Xid._from_valid_bytes
+        return [
+            from_bytes(
+                prefix + ((start + i) & counter_max).to_bytes(COUNTER_BYTES, "big")
+            )
+            for i in range(n)
+        ]
+
+    def iter_ids(self, chunk_size: int = 1024) -> Iterator[Xid]:
+        """
+        Yields XIDs forever, generating them `chunk_size` at a time.
+
+        Args:
+            chunk_size: The number of XIDs generated per batch.
+
+        Yields:
+            A new Xid object.
+
+        Raises:
+            ValueError: If `chunk_size` is less than 1.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        while True:
+            yield from self.generate_many(chunk_size)
+
+
+# Module-level singleton instance of XidGenerator (lazy, thread-safe initialization)
+_xid_generator: Optional[XidGenerator] = None
+_xid_generator_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    global _xid_generator_lock
+    _xid_generator_lock = threading.Lock()
+
 
-_xid_generator = XidGenerator()
+_fork.register(_reset_after_fork)
 
 
 def xid() -> Xid:
     """
     Generates a new XID.
 
-    This function uses a module-level singleton instance of `XidGenerator`.
+    This function uses a module-level singleton instance of `XidGenerator`,
+    which is created (and the machine ID hashed) on first use.
 
     Returns
     -------
     Xid
         A new, unique XID object.
     """
+    global _xid_generator
+    if _xid_generator is None:
+        with _xid_generator_lock:
+            if _xid_generator is None:
+                _xid_generator = XidGenerator()
     return _xid_generator.generate()
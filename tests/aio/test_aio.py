@@ -0,0 +1,185 @@
+"""
+Tests for the asyncio ID generation API.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from anyid import aio
+from anyid.cuid2 import Cuid2Generator
+from anyid.nanoid import NanoidGenerator
+from anyid.snowflake.generator import SEQUENCE_MASK, SnowflakeIdGenerator
+from anyid.ulid.generator import MAX_RANDOM, ULIDGenerator
+from anyid.xid import Xid, XidGenerator
+
+FIXED_TIME_MS = 1678886400000
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """A thread pool that counts the calls submitted to it."""
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def run_while_clock_advances(coroutine_factory, now):
+    """
+    Runs a coroutine alongside a task that advances the mocked clock by one
+    millisecond. The coroutine can only finish if it yields to the loop.
+    """
+
+    async def advance():
+        await asyncio.sleep(0.001)
+        now[0] += 1
+
+    async def main():
+        task = asyncio.ensure_future(advance())
+        result = await coroutine_factory()
+        await task
+        return result
+
+    return asyncio.run(main())
+
+
+def test_agenerate_simple_generators():
+    """
+    Tests that generators that never wait are supported, including options.
+    """
+    assert isinstance(asyncio.run(aio.agenerate(XidGenerator())), Xid)
+    nanoid = asyncio.run(aio.agenerate(NanoidGenerator(), size=7))
+    assert len(nanoid) == 7
+
+
+def test_agenerate_yields_while_snowflake_sequence_exhausted():
+    """
+    Tests that agenerate waits for the next millisecond without blocking
+    the event loop.
+    """
+    generator = SnowflakeIdGenerator(worker_id=1, datacenter_id=1)
+    now = [FIXED_TIME_MS]
+    with patch("time.time_ns", side_effect=lambda: now[0] * 1_000_000):
+        generator.generate_many(SEQUENCE_MASK + 1)
+        snowflake = run_while_clock_advances(lambda: aio.agenerate(generator), now)
+    assert snowflake.timestamp == FIXED_TIME_MS + 1
+    assert snowflake.sequence == 0
+
+
+def test_agenerate_yields_while_snowflake_clock_behind():
+    """
+    Tests that agenerate waits for a clock that moved backwards without
+    blocking the event loop under the "wait" policy.
+    """
+    generator = SnowflakeIdGenerator(
+        worker_id=1, datacenter_id=1, on_clock_regression="wait"
+    )
+    stats = generator.enable_stats()
+    now = [FIXED_TIME_MS]
+    with patch("time.time_ns", side_effect=lambda: now[0] * 1_000_000):
+        generator.generate()
+        now[0] -= 1
+        snowflake = run_while_clock_advances(lambda: aio.agenerate(generator), now)
+    assert snowflake.timestamp == FIXED_TIME_MS
+    assert snowflake.sequence == 1
+    # The wait counts as a regression wait, as on the synchronous path.
+    assert stats.regression_waits == 1
+    assert stats.sequence_overflows == 0
+    assert stats.wait_seconds > 0
+
+    # Waits for the next millisecond still count as sequence overflows.
+    with patch("time.time_ns", side_effect=lambda: now[0] * 1_000_000):
+        generator.generate_many(SEQUENCE_MASK - 1)
+        ids = run_while_clock_advances(lambda: aio.agenerate_many(generator, 2), now)
+    assert [s.timestamp for s in ids] == [FIXED_TIME_MS + 1] * 2
+    assert stats.regression_waits == 1
+    assert stats.sequence_overflows == 1
+
+
+def test_agenerate_yields_while_ulid_random_exhausted():
+    """
+    Tests that agenerate waits for the next millisecond when the ULID random
+    component is at its maximum.
+    """
+    generator = ULIDGenerator()
+    now = [FIXED_TIME_MS]
+    with patch("time.time_ns", side_effect=lambda: now[0] * 1_000_000):
+        generator._last_ms = FIXED_TIME_MS
+        generator._last_random = MAX_RANDOM
+        ulid = run_while_clock_advances(lambda: aio.agenerate(generator), now)
+    assert int.from_bytes(generator.decode_base32(ulid)[:6], "big") == (
+        FIXED_TIME_MS + 1
+    )
+
+
+def test_agenerate_many_spans_milliseconds_on_the_loop():
+    """
+    Tests that a small batch crossing a millisecond boundary is completed by
+    yielding to the loop rather than spinning.
+    """
+    generator = SnowflakeIdGenerator(worker_id=1, datacenter_id=1)
+    now = [FIXED_TIME_MS]
+    with patch("time.time_ns", side_effect=lambda: now[0] * 1_000_000):
+        generator.generate_many(SEQUENCE_MASK - 1)
+        ids = run_while_clock_advances(lambda: aio.agenerate_many(generator, 10), now)
+    assert len(ids) == 10
+    assert [s.timestamp for s in ids[:2]] == [FIXED_TIME_MS, FIXED_TIME_MS]
+    assert ids[2].timestamp == FIXED_TIME_MS + 1
+    values = [int(str(s)) for s in ids]
+    assert values == sorted(values)
+
+
+def test_agenerate_many_offloads_large_batches():
+    """
+    Tests that batches at or above the threshold run in the executor.
+    """
+    executor = CountingExecutor()
+    with executor:
+        ids = asyncio.run(
+            aio.agenerate_many(
+                Cuid2Generator(),
+                20,
+                executor=executor,
+                offload_threshold=20,
+                length=10,
+            )
+        )
+        assert executor.submitted == 1
+        assert len(set(ids)) == 20
+        assert all(len(value) == 10 for value in ids)
+
+        asyncio.run(
+            aio.agenerate_many(
+                Cuid2Generator(), 19, executor=executor, offload_threshold=20
+            )
+        )
+        assert executor.submitted == 1
+
+
+def test_agenerate_many_rejects_negative():
+    with pytest.raises(ValueError):
+        asyncio.run(aio.agenerate_many(XidGenerator(), -1))
+
+
+def test_aiter_ids():
+    """
+    Tests that aiter_ids streams IDs across chunk boundaries.
+    """
+
+    async def collect():
+        ids = []
+        async for value in aio.aiter_ids(ULIDGenerator(), chunk_size=3):
+            ids.append(value)
+            if len(ids) == 10:
+                break
+        return ids
+
+    ids = asyncio.run(collect())
+    assert len(set(ids)) == 10
+    assert ids == sorted(ids)
@@ -0,0 +1,98 @@
+"""
+Tests for the benchmark suite.
+"""
+
+import json
+
+from anyid.bench import compare_results, format_report, run_benchmarks
+from anyid.bench.__main__ import main
+
+
+def test_run_benchmarks_sections():
+    """
+    Tests that a small run produces every section with the expected metrics.
+    """
+    results = run_benchmarks(
+        iterations=50,
+        latency_samples=50,
+        alloc_iterations=10,
+        thread_counts=(1, 2),
+        thread_iterations=20,
+        import_repeat=1,
+        only=["ulid", "ulid.decode_base32"],
+    )
+    assert set(results["generators"]) == {"ulid"}
+    assert set(results["codecs"]) == {"ulid.decode_base32"}
+    assert set(results["threads"]["ulid"]) == {"1", "2"}
+    assert set(results["import"]) == {"anyid", "anyid.ulid"}
+
+    metrics = results["generators"]["ulid"]
+    for key in (
+        "ops_per_sec",
+        "p50_ns",
+        "p99_ns",
+        "p999_ns",
+        "alloc_bytes_per_op",
+        "alloc_blocks_per_op",
+    ):
+        assert key in metrics
+    assert metrics["p50_ns"] <= metrics["p99_ns"] <= metrics["p999_ns"]
+    json.dumps(results)
+
+
+def test_compare_results_detects_regressions():
+    """
+    Tests that comparisons respect the direction of each metric.
+    """
+    baseline = {
+        "generators": {"ulid": {"ops_per_sec": 1000.0, "p99_ns": 100}},
+        "threads": {"ulid": {"2": 1000.0}},
+        "import": {"anyid": {"cold_import_ms": 10.0}},
+    }
+    current = {
+        "generators": {"ulid": {"ops_per_sec": 800.0, "p99_ns": 90}},
+        "threads": {"ulid": {"2": 1200.0}},
+        "import": {"anyid": {"cold_import_ms": 20.0}},
+    }
+    changes = {c.name: c for c in compare_results(current, baseline, 0.10)}
+
+    assert changes["generators.ulid.ops_per_sec"].regressed
+    assert not changes["generators.ulid.p99_ns"].regressed
+    assert not changes["threads.ulid.2"].regressed
+    assert changes["import.anyid.cold_import_ms"].regressed
+    assert "REGRESSION" in format_report(list(changes.values()))
+
+
+def test_main_writes_results_and_compares(tmp_path):
+    """
+    Tests the command line entry point end to end.
+    """
+    output = tmp_path / "results.json"
+    argv = ["--quick", "--only", "xid", "--threads", "1", "--import-repeat", "0"]
+    assert main(argv + ["-o", str(output)]) == 0
+    results = json.loads(output.read_text())
+    assert "xid" in results["generators"]
+
+    # Against an impossibly fast baseline every throughput figure regresses.
+    results["generators"]["xid"]["ops_per_sec"] *= 1000
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(results))
+    assert main(argv + ["-o", str(output), "-b", str(baseline)]) == 1
+
+
+def test_sharded_thread_cases():
+    """
+    Tests that the sharded generators are measured under thread contention.
+    """
+    results = run_benchmarks(
+        iterations=10,
+        latency_samples=10,
+        alloc_iterations=1,
+        thread_counts=(2,),
+        thread_iterations=50,
+        import_repeat=0,
+        only=["cuid.sharded", "ulid.sharded", "xid.sharded"],
+    )
+    assert set(results["threads"]) == {"cuid.sharded", "ulid.sharded", "xid.sharded"}
+    assert results["threads"]["xid.sharded"]["2"] > 0
+    assert isinstance(results["meta"]["gil_enabled"], bool)
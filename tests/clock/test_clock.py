@@ -0,0 +1,85 @@
+"""
+Tests for the clocks generators read their timestamps from.
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from anyid.clock import SYSTEM_CLOCK, CoarseClock, MonotonicClock, SystemClock
+from anyid.cuid import CuidGenerator
+from anyid.cuid2 import Cuid2Generator
+from anyid.ksuid import KsuidGenerator
+from anyid.snowflake import SnowflakeIdGenerator
+from anyid.ulid.generator import ULIDGenerator
+from anyid.xid import XidGenerator
+from tests.clocks import FixedClock
+
+FIXED_TIME_NS = 1678886400123456789
+
+
+def test_system_clock_reads_time_ns():
+    before = time.time_ns()
+    now = SystemClock().time_ns()
+    assert isinstance(now, int)
+    assert before <= now <= time.time_ns()
+    with patch("time.time_ns", return_value=FIXED_TIME_NS):
+        assert SYSTEM_CLOCK.time_ns() == FIXED_TIME_NS
+
+
+def test_monotonic_clock_ignores_wall_clock_steps():
+    source = FixedClock(FIXED_TIME_NS)
+    clock = MonotonicClock(source)
+    first = clock.time_ns()
+    assert 0 <= first - FIXED_TIME_NS < 10**9
+
+    # Stepping the source back does not affect the clock until a resync.
+    source.now_ns = FIXED_TIME_NS - 10**12
+    second = clock.time_ns()
+    assert second >= first
+    clock.resync()
+    assert clock.time_ns() < first
+
+
+def test_coarse_clock_caches_between_ticks():
+    source = FixedClock(FIXED_TIME_NS)
+    clock = CoarseClock(source, resolution=0.001)
+    try:
+        assert clock.time_ns() == FIXED_TIME_NS
+        reads = source.reads
+        source.now_ns = FIXED_TIME_NS + 1
+        deadline = time.monotonic() + 5
+        while clock.time_ns() != FIXED_TIME_NS + 1:
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+        assert source.reads > reads
+    finally:
+        clock.stop()
+
+    # A stopped clock restarts on next use.
+    source.now_ns = FIXED_TIME_NS + 2
+    assert clock.time_ns() == FIXED_TIME_NS + 2
+    clock.stop()
+    with pytest.raises(ValueError):
+        CoarseClock(resolution=0)
+
+
+def test_generators_read_their_clock():
+    clock = FixedClock(FIXED_TIME_NS)
+    fixed_ms = FIXED_TIME_NS // 1_000_000
+    fixed_s = FIXED_TIME_NS // 1_000_000_000
+
+    snowflake = SnowflakeIdGenerator(worker_id=1, datacenter_id=1, clock=clock)
+    assert snowflake.generate().timestamp == fixed_ms
+    ulid = ULIDGenerator(clock=clock).generate()
+    assert ULIDGenerator().decode_base32(ulid)[:6] == fixed_ms.to_bytes(6, "big")
+    assert KsuidGenerator(clock=clock).generate().timestamp == fixed_s - 1425859200
+    assert XidGenerator(clock=clock).generate().timestamp == fixed_s
+    for xid in XidGenerator(sharded=True, clock=clock).generate_many(2):
+        assert xid.timestamp == fixed_s
+
+    reads = clock.reads
+    CuidGenerator(clock=clock).generate()
+    Cuid2Generator(clock=clock).generate()
+    assert clock.reads == reads + 2
@@ -0,0 +1,20 @@
+"""
+A fake clock shared by the test suites.
+"""
+
+from anyid.clock import Clock
+
+
+class FixedClock(Clock):
+    """
+    A clock that stays at `now_ns` until a test sets it, and counts how often
+    it is read.
+    """
+
+    def __init__(self, now_ns: int):
+        self.now_ns = now_ns
+        self.reads = 0
+
+    def time_ns(self) -> int:
+        self.reads += 1
+        return self.now_ns
@@ -0,0 +1,124 @@
+"""
+Tests for the shared codec module.
+"""
+
+import pytest
+from hypothesis import given, strategies as st
+
+from anyid import codec
+
+
+def reference_encode(number, alphabet, width=0):
+    """The digit-at-a-time encoder the generators used before the codec."""
+    encoded = ""
+    while number > 0:
+        number, remainder = divmod(number, len(alphabet))
+        encoded = alphabet[remainder] + encoded
+    return (encoded or alphabet[0]).rjust(width, alphabet[0])
+
+
+@given(st.binary(min_size=1, max_size=40))
+def test_base32_roundtrip(data):
+    encoded = codec.encode_base32(data)
+    assert len(encoded) == (len(data) * 8 + 4) // 5
+    assert encoded == reference_encode(
+        int.from_bytes(data, "big"), codec.CROCKFORD_ALPHABET, len(encoded)
+    )
+    assert codec.decode_base32(encoded, len(data)) == data
+    assert codec.decode_base32(encoded.lower(), len(data)) == data
+
+
+@given(st.integers(min_value=0, max_value=2**128 - 1))
+def test_base32_int_roundtrip(number):
+    encoded = codec.encode_base32_int(number, 26)
+    assert len(encoded) == 26
+    assert codec.decode_base32_int(encoded) == number
+
+
+@given(st.integers(min_value=0, max_value=2**600), st.integers(0, 30))
+def test_base36_and_base62_match_reference(number, width):
+    assert codec.encode_base36(number, width) == reference_encode(
+        number, codec.BASE36_ALPHABET, width
+    )
+    assert codec.encode_base62(number, width) == reference_encode(
+        number, codec.BASE62_ALPHABET, width
+    )
+    assert codec.decode_base36(codec.encode_base36(number)) == number
+    assert codec.decode_base62(codec.encode_base62(number)) == number
+
+
+def test_zero_and_padding():
+    assert codec.encode_base36(0) == "0"
+    assert codec.encode_base62(0, 27) == "0" * 27
+    assert codec.encode_base36(35, 4) == "000z"
+    # Padding never truncates.
+    assert codec.encode_base36(36**5, 4) == "100000"
+    assert codec.encode_base32(b"") == ""
+    assert codec.decode_base32("") == b""
+
+
+@pytest.mark.parametrize("invalid", ["I", "L", "O", "U", "i", "-", " ", "_", "é"])
+def test_base32_rejects_invalid_characters(invalid):
+    encoded = "0" * 25 + invalid
+    with pytest.raises(ValueError, match="Invalid character"):
+        codec.decode_base32(encoded)
+
+
+def test_range_errors():
+    with pytest.raises(ValueError):
+        codec.encode_base32_int(1 << 130, 26)
+    with pytest.raises(ValueError):
+        codec.encode_base36(-1)
+    with pytest.raises(ValueError):
+        codec.encode_base62(-1)
+    with pytest.raises(ValueError, match="does not fit"):
+        codec.decode_base32("8" + "0" * 25, 16)
+
+
+@pytest.mark.parametrize("invalid", ["", "+1", "a_b", "1 2", "ab!", "٣"])
+def test_base36_and_base62_reject_invalid_strings(invalid):
+    with pytest.raises(ValueError):
+        codec.decode_base36(invalid)
+    with pytest.raises(ValueError):
+        codec.decode_base62(invalid)
+
+
+def test_base62_is_case_sensitive():
+    assert codec.decode_base62("a") == 36
+    assert codec.decode_base62("A") == 10
+
+
+@pytest.mark.parametrize("invalid", ["0", "0g", "00 0", " 00", "00\n"])
+def test_hex_is_strict(invalid):
+    with pytest.raises(ValueError):
+        codec.decode_hex(invalid)
+
+
+def test_hex_roundtrip():
+    assert codec.encode_hex(b"\x00\xff") == "00ff"
+    assert codec.decode_hex("00FF") == b"\x00\xff"
+
+
+def test_batch_helpers():
+    items = [bytes([i]) * 16 for i in range(5)]
+    encoded = codec.encode_base32_many(items)
+    assert encoded == [codec.encode_base32(item) for item in items]
+    assert codec.decode_base32_many(encoded, 16) == items
+    assert codec.decode_hex_many(codec.encode_hex_many(items)) == items
+    numbers = [0, 1, 62**26, 2**160 - 1]
+    assert codec.decode_base62_many(codec.encode_base62_many(numbers, 27)) == numbers
+    assert codec.encode_base32_many([]) == []
+
+
+def test_decode_base32_int_many():
+    numbers = [0, 1, 2**128 - 1, 12345678901234567890]
+    encoded = [codec.encode_base32_int(number, 26) for number in numbers]
+    assert codec.decode_base32_int_many(encoded, 26) == numbers
+    assert codec.decode_base32_int_many([item.lower() for item in encoded], 26) == (
+        numbers
+    )
+    assert codec.decode_base32_int_many([], 26) == []
+    with pytest.raises(ValueError, match="must be 26 characters long"):
+        codec.decode_base32_int_many(encoded + ["0" * 25], 26)
+    with pytest.raises(ValueError, match="Invalid character 'U'"):
+        codec.decode_base32_int_many(encoded + ["U" * 26], 26)
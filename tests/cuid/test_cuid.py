@@ -2,7 +2,15 @@
 Tests for the CUID generator.
 """
 
-from anyid.cuid import CuidGenerator, cuid
+import threading
+
+import pytest
+
+from anyid import codec
+from anyid.cuid import CuidGenerator, cuid, slug
+from tests.clocks import FixedClock
+
+FIXED_TIME_MS = 1678886400123
 
 
 def test_cuid_generator():
@@ -32,3 +40,86 @@ def test_cuid_length():
     # This is a loose check.
     generated_cuid = cuid()
     assert len(generated_cuid) > 10
+
+
+def test_cuid_generate_many():
+    """
+    Tests that a batch of CUIDs uses consecutive counter values and is unique.
+    """
+    generator = CuidGenerator()
+    start = generator.counter
+    ids = generator.generate_many(500)
+    assert len(ids) == len(set(ids)) == 500
+    assert generator.counter == (start + 500) % generator.discrete_values
+    assert all(new_id.startswith("c") for new_id in ids)
+    assert generator.generate_many(0) == []
+
+
+def test_cuid_iter_ids():
+    """
+    Tests that iter_ids yields unique CUIDs across chunk boundaries.
+    """
+    iterator = CuidGenerator().iter_ids(chunk_size=7)
+    ids = [next(iterator) for _ in range(30)]
+    assert len(set(ids)) == 30
+
+
+def test_cuid_sharded_uniqueness_concurrent():
+    """
+    Tests that sharded CUIDs are unique across threads.
+    """
+    generator = CuidGenerator(sharded=True)
+    results = []
+    lock = threading.Lock()
+
+    def generate_cuids():
+        ids = [generator.generate() for _ in range(1000)]
+        with lock:
+            results.extend(ids)
+
+    threads = [threading.Thread(target=generate_cuids) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == len(set(results)) == 8000
+
+
+def test_cuid_format():
+    """
+    Tests the layout of a CUID: prefix, timestamp, counter, fingerprint and
+    two random blocks, all in base36.
+    """
+    generator = CuidGenerator(clock=FixedClock(FIXED_TIME_MS * 1_000_000))
+    generator.counter = 36**4 - 1
+    timestamp = codec.encode_base36(FIXED_TIME_MS)
+    for new_id, counter in zip(
+        generator.generate_many(2) + [generator.generate()], ["zzzz", "0000", "0001"]
+    ):
+        assert new_id[: 1 + len(timestamp)] == "c" + timestamp
+        rest = new_id[1 + len(timestamp) :]
+        assert len(rest) == 16
+        assert rest[:4] == counter
+        assert rest[4:8] == generator.fingerprint
+        assert all(char in codec.BASE36_ALPHABET for char in rest[8:])
+
+
+def test_cuid_slug():
+    """
+    Tests the layout and uniqueness of CUID slugs.
+    """
+    generator = CuidGenerator(clock=FixedClock(FIXED_TIME_MS * 1_000_000))
+    generator.counter = 36**2
+    fingerprint = generator.fingerprint
+    first = generator.slug()
+    assert first[:2] == codec.encode_base36(FIXED_TIME_MS)[-2:]
+    assert first[2:5] == "100"
+    assert first[5:7] == fingerprint[0] + fingerprint[-1]
+    assert len(first) == 9
+
+    slugs = generator.slug_many(1000)
+    assert len(set(slugs + [first])) == 1001
+    assert all(7 <= len(new_slug) <= 10 for new_slug in slugs)
+    assert 7 <= len(slug()) <= 10
+    with pytest.raises(ValueError):
+        generator.slug_many(-1)
@@ -2,6 +2,9 @@ from anyid.cuid2 import cuid2
 from anyid.cuid2 import Cuid2Generator, DEFAULT_LENGTH, MAXIMUM_LENGTH
 import pytest
 import re
+import threading
+
+from anyid.cuid2.utils import create_counter
 
 
 def test_cuid2_generation():
@@ -51,3 +54,39 @@ def test_cuid2_starts_with_letter():
     for _ in range(100):
         new_id = cuid2()
         assert new_id[0].isalpha() and new_id[0].islower()
+
+
+def test_cuid2_generate_many():
+    cuid_gen = Cuid2Generator()
+    ids = cuid_gen.generate_many(200)
+    assert len(set(ids)) == 200
+    assert all(len(new_id) == DEFAULT_LENGTH for new_id in ids)
+    assert all(new_id[0].isalpha() and new_id[0].islower() for new_id in ids)
+    assert all(len(new_id) == 10 for new_id in cuid_gen.generate_many(5, length=10))
+    with pytest.raises(ValueError):
+        cuid_gen.generate_many(-1)
+
+
+def test_cuid2_iter_ids():
+    iterator = Cuid2Generator().iter_ids(chunk_size=3, length=12)
+    ids = [next(iterator) for _ in range(10)]
+    assert len(set(ids)) == 10
+    assert all(len(new_id) == 12 for new_id in ids)
+
+
+def test_cuid2_counter_is_thread_safe():
+    counter = create_counter(0)
+    values = []
+    lock = threading.Lock()
+
+    def count():
+        local = [counter() for _ in range(5000)]
+        with lock:
+            values.extend(local)
+
+    threads = [threading.Thread(target=count) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(values) == list(range(1, 40001))
@@ -0,0 +1,114 @@
+"""
+Tests for the shared entropy pool.
+"""
+
+import os
+import threading
+from collections import Counter
+
+import pytest
+
+from anyid import _entropy
+from anyid._entropy import EntropyPool
+
+
+def test_token_bytes_lengths():
+    """
+    Tests that draws of every size return the requested number of bytes,
+    including draws that bypass the buffer.
+    """
+    pool = EntropyPool(buffer_size=64)
+    for size in (0, 1, 10, 32, 33, 1000):
+        assert len(pool.token_bytes(size)) == size
+
+
+def test_token_bytes_never_repeat():
+    """
+    Tests that consecutive slices of the buffer are distinct, including across
+    refills.
+    """
+    pool = EntropyPool(buffer_size=64)
+    chunks = [pool.token_bytes(16) for _ in range(100)]
+    assert len(set(chunks)) == 100
+
+
+def test_randbelow_range_and_validation():
+    """
+    Tests that randbelow stays in range and rejects invalid bounds.
+    """
+    pool = EntropyPool()
+    for bound in (1, 2, 36, 255, 256, 257, 1 << 80):
+        assert all(0 <= pool.randbelow(bound) < bound for _ in range(50))
+    with pytest.raises(ValueError, match="Upper bound must be positive."):
+        pool.randbelow(0)
+
+
+def test_randbelow_many_range_and_coverage():
+    """
+    Tests that randbelow_many covers the whole range for both the byte and
+    word code paths.
+    """
+    pool = EntropyPool()
+    for bound in (3, 36, 64, 256, 1679616):
+        values = pool.randbelow_many(bound, 5000)
+        assert len(values) == 5000
+        assert all(0 <= value < bound for value in values)
+    counts = Counter(pool.randbelow_many(36, 36000))
+    assert set(counts) == set(range(36))
+    assert pool.randbelow_many(10, 0) == []
+    with pytest.raises(ValueError):
+        pool.randbelow_many(0, 1)
+    with pytest.raises(ValueError):
+        pool.randbelow_many((1 << 32) + 1, 1)
+
+
+def test_choice():
+    """
+    Tests that choice picks elements of the sequence and rejects empty ones.
+    """
+    pool = EntropyPool()
+    assert pool.choice("abc") in "abc"
+    with pytest.raises(IndexError):
+        pool.choice("")
+
+
+def test_concurrent_draws_are_unique():
+    """
+    Tests that concurrent draws never hand out the same slice twice.
+    """
+    pool = EntropyPool(buffer_size=256)
+    chunks = []
+    lock = threading.Lock()
+
+    def draw():
+        local = [pool.token_bytes(16) for _ in range(500)]
+        with lock:
+            chunks.extend(local)
+
+    threads = [threading.Thread(target=draw) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(chunks)) == len(chunks) == 4000
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_pool_discarded_in_forked_child():
+    """
+    Tests that a forked child does not hand out the parent's buffered bytes.
+    """
+    _entropy.token_bytes(1)  # Make sure the buffer is filled before forking.
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        os.write(write_fd, _entropy.token_bytes(32))
+        os._exit(0)
+    os.close(write_fd)
+    parent_bytes = _entropy.token_bytes(32)
+    with os.fdopen(read_fd, "rb") as reader:
+        child_bytes = reader.read()
+    os.waitpid(pid, 0)
+    assert len(child_bytes) == 32
+    assert child_bytes != parent_bytes
@@ -0,0 +1,98 @@
+"""
+Multi-process uniqueness stress tests for generators shared across fork().
+"""
+
+import multiprocessing
+import os
+
+import pytest
+
+from anyid.cuid import cuid
+from anyid.cuid import generator as cuid_generator
+from anyid.cuid2 import cuid2
+from anyid.cuid2 import utils as cuid2_utils
+from anyid.ksuid import ksuid
+from anyid.nanoid import nanoid
+from anyid.ulid import ulid
+from anyid.uuid import uuid
+from anyid.xid import xid
+from anyid.xid.generator import Xid
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "register_at_fork")
+    or "fork" not in multiprocessing.get_all_start_methods(),
+    reason="requires the fork start method",
+)
+
+PROCESSES = 4
+IDS_PER_PROCESS = 2000
+
+
+def _generate_ids(_):
+    return {
+        "cuid": [cuid() for _ in range(IDS_PER_PROCESS)],
+        "cuid2": [cuid2() for _ in range(IDS_PER_PROCESS // 10)],
+        "ksuid": [str(ksuid()) for _ in range(IDS_PER_PROCESS)],
+        "nanoid": [nanoid() for _ in range(IDS_PER_PROCESS)],
+        "ulid": [ulid() for _ in range(IDS_PER_PROCESS)],
+        "uuid": [str(uuid()) for _ in range(IDS_PER_PROCESS)],
+        "xid": [str(xid()) for _ in range(IDS_PER_PROCESS)],
+        "cuid_fingerprint": cuid_generator._cuid_generator.fingerprint,
+        "cuid2_fingerprint": cuid2_utils.create_fingerprint(),
+    }
+
+
+def test_ids_unique_across_forked_processes():
+    """
+    Tests that a parent and its forked children never emit the same ID, even
+    though the children inherit the parent's warmed-up generators.
+    """
+    # Warm up every singleton so the children inherit live state.
+    parent = _generate_ids(None)
+
+    context = multiprocessing.get_context("fork")
+    with context.Pool(PROCESSES) as pool:
+        children = pool.map(_generate_ids, range(PROCESSES))
+    results = [parent] + children + [_generate_ids(None)]
+
+    for kind in ("cuid", "cuid2", "ksuid", "nanoid", "ulid", "uuid", "xid"):
+        ids = [value for result in results for value in result[kind]]
+        assert len(ids) == len(set(ids)), kind
+
+    for kind in ("cuid_fingerprint", "cuid2_fingerprint"):
+        fingerprints = {result[kind] for result in results[:-1]}
+        assert len(fingerprints) == PROCESSES + 1, kind
+
+    process_ids = {Xid.from_string(result["xid"][0]).process_id for result in results}
+    assert len(process_ids) == PROCESSES + 1
+
+
+def test_forked_child_resets_monotonic_state():
+    """
+    Tests that a forked child starts fresh ULID and XID state instead of
+    continuing the parent's stream.
+    """
+    from anyid.ulid.generator import ULIDGenerator
+    from anyid.xid.generator import XidGenerator
+
+    ulid_generator = ULIDGenerator()
+    ulid_generator.generate()
+    xid_generator = XidGenerator()
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        state = (
+            ulid_generator._last_ms == 0
+            and ulid_generator._last_random == 0
+            and xid_generator._process_id
+            == (os.getpid() % (1 << 16)).to_bytes(2, "big")
+        )
+        os.write(write_fd, b"1" if state else b"0")
+        os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as reader:
+        result = reader.read()
+    os.waitpid(pid, 0)
+    assert result == b"1"
+    assert ulid_generator._last_ms != 0
@@ -1,5 +1,8 @@
+import pickle
 import secrets
 
+import pytest
+
 from anyid.ksuid.generator import BASE62_ALPHABET, Ksuid, KsuidGenerator
 
 
@@ -39,3 +42,133 @@ def test_ksuid_sorting():
     ksuid3 = Ksuid(timestamp=1000, payload=b"\x00" * 16)
     ksuid4 = Ksuid(timestamp=1000, payload=b"\xff" * 16)
     assert ksuid3 < ksuid4
+
+
+def test_ksuid_generate_many():
+    """
+    Tests that a batch of KSUIDs is unique and shares the batch timestamp.
+    """
+    ksuids = KsuidGenerator().generate_many(100)
+    assert len(ksuids) == 100
+    assert len({k.to_bytes() for k in ksuids}) == 100
+    assert len({k.timestamp for k in ksuids}) == 1
+
+
+def test_ksuid_iter_ids():
+    """
+    Tests that iter_ids keeps yielding valid KSUIDs across chunks.
+    """
+    iterator = KsuidGenerator().iter_ids(chunk_size=4)
+    ksuids = [next(iterator) for _ in range(10)]
+    assert all(isinstance(k, Ksuid) for k in ksuids)
+
+
+def test_ksuid_value_semantics():
+    """
+    Tests that KSUIDs are hashable, totally ordered, immutable and compact.
+    """
+    payload = secrets.token_bytes(16)
+    first = Ksuid(timestamp=1000, payload=payload)
+    same = Ksuid(timestamp=1000, payload=payload)
+    later = Ksuid(timestamp=1001, payload=payload)
+
+    assert first == same and hash(first) == hash(same)
+    assert len({first, same, later}) == 2
+    assert first <= same < later and later > first and later >= same
+    assert sorted([later, first]) == [first, later]
+    assert first != "not a ksuid"
+
+    # The base62 form is encoded on first use and cached.
+    assert first._str is None
+    a = str(first)
+    b = str(first)
+    assert a is b and first._str is a
+    assert not hasattr(first, "__dict__")
+    with pytest.raises(AttributeError):
+        first.timestamp = 5
+    assert pickle.loads(pickle.dumps(first)) == first
+
+
+def test_ksuid_timestamp_out_of_range():
+    with pytest.raises(ValueError):
+        Ksuid(timestamp=1 << 32, payload=bytes(16))
+
+
+def test_ksuid_parsing():
+    """
+    Tests parsing KSUIDs from strings and bytes, in bulk and against a
+    reference value.
+    """
+    import datetime
+
+    from anyid.ksuid import format_many, parse_many
+    from anyid.ksuid.generator import KSUID_EPOCH, base62_decode, base62_encode
+
+    known = Ksuid.parse("0ujtsYcgvSTl8PAuAdqWYSMnLOv")
+    assert known.timestamp == 107608047
+    assert known.payload.hex().upper() == "B5A1CD34B5F99D1154FB6853345C9735"
+    assert known.datetime == datetime.datetime.fromtimestamp(
+        KSUID_EPOCH + 107608047, tz=datetime.timezone.utc
+    )
+    assert str(Ksuid.parse("aWgEPTl1tmebfsQzFP4bxwgy80V")) == (
+        "aWgEPTl1tmebfsQzFP4bxwgy80V"
+    )
+
+    ksuids = KsuidGenerator().generate_many(50)
+    strings = [str(ksuid) for ksuid in ksuids]
+    assert [Ksuid.parse(string) for string in strings] == ksuids
+    assert parse_many(strings) == ksuids
+    assert format_many(parse_many(strings)) == strings
+    assert format_many(Ksuid.from_bytes(k.to_bytes()) for k in ksuids) == strings
+    assert base62_decode(base62_encode(12345, 27)) == 12345
+
+    for invalid in ("0" * 26, "aWgEPTl1tmebfsQzFP4bxwgy80W", "0" * 26 + "-"):
+        with pytest.raises(ValueError):
+            Ksuid.parse(invalid)
+        with pytest.raises(ValueError):
+            parse_many(strings[:1] + [invalid])
+    with pytest.raises(ValueError):
+        Ksuid.from_bytes(bytes(19))
+
+
+def test_ksuid_monotonic():
+    """
+    Tests that monotonic KSUIDs of the same second are strictly increasing,
+    also across threads and when the payload space runs out.
+    """
+    import threading
+    from unittest.mock import patch
+
+    from anyid.ksuid.generator import KSUID_EPOCH, MAX_PAYLOAD
+
+    generator = KsuidGenerator(monotonic=True)
+    now = (KSUID_EPOCH + 100_000_000) * 1_000_000_000
+    with patch("time.time_ns", return_value=now):
+        ksuids = [generator.generate() for _ in range(100)] + generator.generate_many(
+            100
+        )
+        assert all(a < b for a, b in zip(ksuids, ksuids[1:]))
+        assert {k.timestamp for k in ksuids} == {100_000_000}
+        payloads = [int.from_bytes(k.payload, "big") for k in ksuids]
+        assert payloads == list(range(payloads[0], payloads[0] + 200))
+        assert str(ksuids[0]) < str(ksuids[-1])
+
+        # Running out of payloads moves the sequence on to the next second.
+        generator._last_payload = MAX_PAYLOAD - 1
+        rolled = generator.generate_many(3)
+        assert [k.timestamp for k in rolled] == [100_000_001] * 3
+        assert rolled[0] > ksuids[-1]
+        assert generator.generate() > rolled[-1]
+
+    results = []
+
+    def generate():
+        results.extend(generator.generate_many(50))
+
+    threads = [threading.Thread(target=generate) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(results)) == 200
+    assert generator.generate_many(0) == []
@@ -57,3 +57,84 @@ def test_nanoid_properties(size, alphabet):
     assert len(generated_nanoid) == size
     for char in generated_nanoid:
         assert char in alphabet
+
+
+def test_nanoid_generate_many():
+    """
+    Tests that generate_many honours size and alphabet for every ID.
+    """
+    generator = NanoidGenerator()
+    ids = generator.generate_many(50, size=12, alphabet=string.digits)
+    assert len(ids) == 50
+    for generated_nanoid in ids:
+        assert len(generated_nanoid) == 12
+        assert generated_nanoid.isdigit()
+    assert generator.generate_many(3, size=0) == ["", "", ""]
+
+
+def test_nanoid_iter_ids():
+    """
+    Tests that iter_ids yields NanoIDs of the default size.
+    """
+    iterator = NanoidGenerator().iter_ids(chunk_size=5)
+    ids = [next(iterator) for _ in range(12)]
+    assert all(len(generated_nanoid) == 21 for generated_nanoid in ids)
+    assert len(set(ids)) == 12
+
+
+def test_custom_alphabet():
+    """
+    Tests the prepared custom-alphabet generators, including the rejection
+    and non-ASCII paths.
+    """
+    from collections import Counter
+
+    import pytest
+
+    from anyid.nanoid import CustomAlphabetGenerator, custom_alphabet
+
+    digits = custom_alphabet(string.digits, 12)
+    assert isinstance(digits, CustomAlphabetGenerator)
+    assert len(digits()) == 12 and digits().isdigit()
+    assert len(digits.generate(size=30)) == 30
+    batch = digits.generate_many(100)
+    assert len(batch) == 100 and all(len(i) == 12 and i.isdigit() for i in batch)
+    assert digits.generate_many(3, size=0) == ["", "", ""]
+
+    # Every character is equally likely; the rejection leaves no bias.
+    counts = Counter(custom_alphabet("abcdefghij", 100_000)())
+    assert set(counts) == set("abcdefghij")
+    assert max(counts.values()) < 11_000 and min(counts.values()) > 9_000
+
+    greek = custom_alphabet("αβγδε", 50)()
+    assert len(greek) == 50 and set(greek) <= set("αβγδε")
+    assert len(custom_alphabet(string.ascii_letters * 6)()) == 21
+    assert set(custom_alphabet("x", 5)()) == {"x"}
+
+    with pytest.raises(ValueError):
+        custom_alphabet("")
+    with pytest.raises(ValueError):
+        custom_alphabet("abc", -1)
+
+
+def test_non_secure_nanoid():
+    """
+    Tests that the non-secure generator is reproducible when seeded and
+    keeps the size and alphabet options.
+    """
+    import pytest
+
+    from anyid.nanoid.non_secure import NonSecureNanoidGenerator, non_secure_nanoid
+
+    first = NonSecureNanoidGenerator(seed=42).generate_many(100)
+    assert NonSecureNanoidGenerator(seed=42).generate_many(100) == first
+    assert NonSecureNanoidGenerator(seed=43).generate_many(100) != first
+    assert len(set(first)) == 100 and all(len(i) == 21 for i in first)
+
+    generator = NonSecureNanoidGenerator()
+    digits = generator.generate(size=30, alphabet=string.digits)
+    assert len(digits) == 30 and digits.isdigit()
+    assert len(non_secure_nanoid()) == 21
+    assert set(non_secure_nanoid(50, "αβγ")) <= set("αβγ")
+    with pytest.raises(ValueError):
+        generator.generate_many(-1)
@@ -0,0 +1,92 @@
+"""
+Import-time regression tests for the top-level package.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+
+def run_isolated(code):
+    """
+    Runs `code` in a fresh interpreter and returns the JSON it prints.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        check=True,
+        capture_output=True,
+        env=env,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def test_import_anyid_loads_no_submodules():
+    """
+    Tests that `import anyid` does not import any generator module, nor the
+    heavier standard library modules they rely on.
+    """
+    result = run_isolated("""
+        import json, sys
+        import anyid
+        print(json.dumps(sorted(m for m in sys.modules if m.startswith("anyid"))))
+        """)
+    assert result == ["anyid"]
+
+
+def test_submodules_resolve_on_first_use():
+    """
+    Tests that public names resolve lazily and only import what they need.
+    """
+    result = run_isolated("""
+        import json, sys
+        import anyid
+        value = anyid.xid()
+        print(json.dumps({
+            "xid": len(str(value)),
+            "loaded": sorted(m for m in sys.modules if m.startswith("anyid.")),
+            "all": sorted(name for name in anyid.__all__ if name in dir(anyid)),
+        }))
+        """)
+    assert result["xid"] == 24
+    assert "anyid.xid.generator" in result["loaded"]
+    assert not any(m.startswith("anyid.cuid2") for m in result["loaded"])
+    assert len(result["all"]) == 9
+
+
+def test_no_work_at_submodule_import():
+    """
+    Tests that importing generator modules neither builds their singletons
+    nor imports `datetime`.
+    """
+    result = run_isolated("""
+        import json, sys
+        from anyid.cuid2 import generator as cuid2_generator, utils
+        from anyid.xid import generator as xid_generator
+        import anyid.ksuid, anyid.snowflake
+        print(json.dumps([
+            cuid2_generator._cuid2_generator is None,
+            utils._process_fingerprint is None,
+            xid_generator._xid_generator is None,
+            "datetime" in sys.modules,
+        ]))
+        """)
+    assert result == [True, True, True, False]
+
+
+def test_public_names_survive_direct_submodule_import():
+    """
+    Tests that importing a submodule directly does not shadow the function of
+    the same name on the package.
+    """
+    result = run_isolated("""
+        import json
+        import anyid.cuid.generator
+        import anyid.ulid
+        from anyid import cuid, ulid
+        print(json.dumps([callable(anyid.cuid), cuid()[0], len(ulid())]))
+        """)
+    assert result == [True, "c", 26]
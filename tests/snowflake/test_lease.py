@@ -0,0 +1,112 @@
+"""
+Tests for worker ID leases.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from anyid.snowflake import SnowflakeLayout
+from anyid.snowflake.lease import WorkerIdLease
+
+pytest.importorskip("fcntl")
+
+TWO_WORKERS = SnowflakeLayout(worker_id_bits=1)
+
+
+def write_lease(directory, worker_id, record):
+    with open(os.path.join(directory, f"worker-{worker_id}.lease"), "w") as handle:
+        handle.write(record)
+
+
+def test_leases_are_exclusive_and_reusable(tmp_path):
+    directory = str(tmp_path / "leases")
+    first = WorkerIdLease.acquire(directory, layout=TWO_WORKERS)
+    second = WorkerIdLease.acquire(directory, layout=TWO_WORKERS)
+    assert (first.worker_id, second.worker_id) == (0, 1)
+    with pytest.raises(RuntimeError, match="No free worker ID"):
+        WorkerIdLease.acquire(directory, layout=TWO_WORKERS)
+
+    first.release()
+    first.release()
+    assert not first.held and second.held
+    with WorkerIdLease.acquire(directory, layout=TWO_WORKERS) as third:
+        assert third.worker_id == 0
+    assert not third.held
+    second.release()
+
+
+def test_crashed_holders_are_reclaimed_after_the_grace_period(tmp_path):
+    directory = str(tmp_path)
+    now_ms = time.time_ns() // 1_000_000
+    write_lease(directory, 0, f"held 1 {now_ms}\n")
+    write_lease(directory, 1, f"held 1 {now_ms - 60_000}\n")
+
+    lease = WorkerIdLease.acquire(directory, layout=TWO_WORKERS)
+    assert lease.worker_id == 1
+    lease.release()
+
+    write_lease(directory, 1, f"held 1 {now_ms}\n")
+    with pytest.raises(RuntimeError):
+        WorkerIdLease.acquire(directory, layout=TWO_WORKERS)
+    lease = WorkerIdLease.acquire(directory, layout=TWO_WORKERS, grace_period=0)
+    assert lease.worker_id == 0
+    lease.release()
+
+
+def test_heartbeat_renews_the_lease(tmp_path):
+    lease = WorkerIdLease.acquire(str(tmp_path), heartbeat_interval=0.01)
+    path = os.path.join(str(tmp_path), "worker-0.lease")
+
+    def read_fields():
+        with open(path) as lease_file:
+            return lease_file.read().split()
+
+    state, pid, first = read_fields()
+    assert (state, int(pid)) == ("held", os.getpid())
+    deadline = time.monotonic() + 5
+    while int(read_fields()[2]) == int(first):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    lease.release()
+    assert read_fields()[0] == "released"
+
+
+def test_lease_of_a_dead_process(tmp_path):
+    """
+    Tests that a process killed while holding a lease does not keep it
+    locked, but that its ID stays unavailable for the grace period.
+    """
+    code = (
+        "import os, sys\n"
+        "from anyid.snowflake.lease import WorkerIdLease\n"
+        "lease = WorkerIdLease.acquire(sys.argv[1])\n"
+        "print(lease.worker_id, flush=True)\n"
+        "os._exit(0)\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run(
+        [sys.executable, "-c", code, str(tmp_path)],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    assert output.strip() == "0"
+
+    lease = WorkerIdLease.acquire(str(tmp_path))
+    assert lease.worker_id == 1
+    lease.release()
+    lease = WorkerIdLease.acquire(str(tmp_path), grace_period=0)
+    assert lease.worker_id == 0
+    lease.release()
+
+
+def test_invalid_arguments(tmp_path):
+    with pytest.raises(ValueError):
+        WorkerIdLease.acquire(str(tmp_path), heartbeat_interval=0)
+    with pytest.raises(ValueError):
+        WorkerIdLease.acquire(str(tmp_path), grace_period=-1)
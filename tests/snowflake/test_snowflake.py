@@ -1,3 +1,6 @@
+import pickle
+import threading
+
 import pytest
 from anyid.snowflake.generator import (
     SnowflakeIdGenerator,
@@ -10,6 +13,7 @@ import time
 from unittest.mock import patch
 from anyid.snowflake import generator
 from anyid.snowflake import snowflake, setup_snowflake_id_generator
+from tests.clocks import FixedClock
 
 
 @pytest.fixture(autouse=True)
@@ -117,11 +121,11 @@ def test_snowflake_sequence_overflow():
     """
     generator = SnowflakeIdGenerator(worker_id=1, datacenter_id=1)
 
-    # Mock time.time() to control the timestamp
-    with patch("time.time") as mock_time:
+    # Mock time.time_ns() to control the timestamp
+    with patch("time.time_ns") as mock_time:
         # Set initial fixed time
         fixed_current_time_ms = 1678886400000  # A fixed timestamp in milliseconds
-        mock_time.return_value = fixed_current_time_ms / 1000.0
+        mock_time.return_value = fixed_current_time_ms * 1_000_000
 
         # Generate SEQUENCE_MASK IDs. After these calls, generator.sequence should be SEQUENCE_MASK - 1.
         for _ in range(SEQUENCE_MASK):
@@ -134,7 +138,7 @@ def test_snowflake_sequence_overflow():
 
         # Generate one more ID. This will cause the sequence to overflow, and generator.sequence should become 0.
         # The while loop should be triggered, and mock_time needs to be advanced to simulate the next millisecond.
-        mock_time.return_value = (fixed_current_time_ms + 1) / 1000.0
+        mock_time.return_value = (fixed_current_time_ms + 1) * 1_000_000
         snowflake_id = generator.generate()
 
         # After overflow, the sequence should be 0 and the generator should have waited for the next millisecond
@@ -171,3 +175,423 @@ def test_snowflake_class_datacenter_id_validation():
         ValueError, match=f"Datacenter ID must be between 0 and {MAX_DATACENTER_ID}"
     ):
         Snowflake(timestamp=1, worker_id=1, datacenter_id=-1, sequence=0)
+
+
+def test_snowflake_generate_many():
+    """
+    Tests that a batch of Snowflake IDs is unique and strictly increasing.
+    """
+    generator = SnowflakeIdGenerator(worker_id=1, datacenter_id=1)
+    ids = [int(str(s)) for s in generator.generate_many(10000)]
+    assert len(set(ids)) == 10000
+    assert ids == sorted(ids)
+    assert int(str(generator.generate())) > ids[-1]
+
+
+def test_snowflake_generate_many_sequence_overflow():
+    """
+    Tests that a batch waits for the next millisecond when the sequence
+    space of the current one is used up.
+    """
+    generator = SnowflakeIdGenerator(worker_id=1, datacenter_id=1)
+    fixed_current_time_ms = 1678886400000
+    ticks = iter([fixed_current_time_ms, fixed_current_time_ms + 1])
+    with patch("time.time_ns") as mock_time:
+        mock_time.side_effect = lambda: next(ticks) * 1_000_000
+        ids = generator.generate_many(SEQUENCE_MASK + 3)
+
+    assert [s.timestamp for s in ids[SEQUENCE_MASK : SEQUENCE_MASK + 2]] == [
+        fixed_current_time_ms,
+        fixed_current_time_ms + 1,
+    ]
+    assert generator.sequence == 1
+    assert generator.last_timestamp == fixed_current_time_ms + 1
+
+
+def test_snowflake_iter_ids():
+    """
+    Tests that iter_ids yields unique Snowflake IDs across chunk boundaries.
+    """
+    iterator = SnowflakeIdGenerator(worker_id=1, datacenter_id=1).iter_ids(chunk_size=5)
+    ids = [str(next(iterator)) for _ in range(12)]
+    assert len(set(ids)) == 12
+
+
+def test_snowflake_value_semantics():
+    """
+    Tests that Snowflakes are hashable, totally ordered and convert to int.
+    """
+    first = Snowflake(timestamp=1700000000000, worker_id=3, datacenter_id=4, sequence=5)
+    same = Snowflake(timestamp=1700000000000, worker_id=3, datacenter_id=4, sequence=5)
+    later = Snowflake(timestamp=1700000000000, worker_id=3, datacenter_id=4, sequence=6)
+
+    assert first == same and hash(first) == hash(same)
+    assert len({first, same, later}) == 2
+    assert first <= same < later and later > first and later >= same
+    assert int(first) == int(str(first))
+    assert (first.timestamp, first.worker_id, first.datacenter_id, first.sequence) == (
+        1700000000000,
+        3,
+        4,
+        5,
+    )
+    assert "sequence=5" in repr(first)
+    # The decimal form was cached by the `int(str(first))` above.
+    a = str(first)
+    b = str(first)
+    assert a is b and first._str is a and a == str(int(first))
+    assert not hasattr(first, "__dict__")
+    with pytest.raises(AttributeError):
+        first.sequence = 7
+    assert pickle.loads(pickle.dumps(first)) == first
+
+    with pytest.raises(ValueError, match="Sequence must be between"):
+        Snowflake(timestamp=1, worker_id=1, datacenter_id=1, sequence=SEQUENCE_MASK + 1)
+
+
+def test_snowflake_generate_many_matches_fields():
+    generator = SnowflakeIdGenerator(worker_id=7, datacenter_id=9)
+    ids = generator.generate_many(10)
+    assert ids == sorted(ids)
+    assert all((s.worker_id, s.datacenter_id) == (7, 9) for s in ids)
+
+
+def test_snowflake_generator_is_thread_safe():
+    """
+    Tests that threads sharing one generator never receive the same ID.
+    """
+    generator = SnowflakeIdGenerator(worker_id=1, datacenter_id=1)
+    results = [[] for _ in range(8)]
+
+    def worker(out):
+        for _ in range(500):
+            out.append(int(generator.generate()))
+        out.extend(int(s) for s in generator.generate_many(500))
+        out.extend(int(s) for s in generator.reserve(500))
+
+    threads = [threading.Thread(target=worker, args=(out,)) for out in results]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    ids = [value for out in results for value in out]
+    assert len(ids) == len(set(ids)) == 8 * 1500
+
+
+def test_snowflake_reserve_spans_milliseconds():
+    """
+    Tests that a reservation continues into the next milliseconds, ahead of
+    the clock, and that later IDs follow it.
+    """
+    generator = SnowflakeIdGenerator(worker_id=2, datacenter_id=3)
+    fixed_current_time_ms = 1678886400000
+    with patch("time.time_ns") as mock_time:
+        mock_time.return_value = fixed_current_time_ms * 1_000_000
+        first = generator.generate()
+        block = generator.reserve(2 * (SEQUENCE_MASK + 1))
+        ids = list(block)
+        # The clock has not moved, but the generator is ahead of it.
+        after = generator.generate()
+
+    assert len(block) == len(ids) == 2 * (SEQUENCE_MASK + 1)
+    assert [block[0], block[-1]] == [ids[0], ids[-1]]
+    assert [block[i] for i in range(len(block))] == ids
+    assert first < ids[0] and ids == sorted(ids) and ids[-1] < after
+    assert len(set(ids)) == len(ids)
+    assert ids[0].sequence == 1 and ids[-1].sequence == 0
+    assert ids[-1].timestamp == fixed_current_time_ms + 2
+    assert after.timestamp == fixed_current_time_ms + 2
+    assert all((s.worker_id, s.datacenter_id) == (2, 3) for s in ids)
+    with pytest.raises(IndexError):
+        block[len(block)]
+    with pytest.raises(ValueError):
+        generator.reserve(0)
+
+
+def test_snowflake_reserve_still_detects_clock_regression():
+    """
+    Tests that a clock moving backwards is reported while a reservation runs
+    ahead of the clock.
+    """
+    from anyid.snowflake import ClockMovedBackwardsError
+
+    now_ms = 1678886400000
+    clock = FixedClock(now_ms * 1_000_000)
+    generator = SnowflakeIdGenerator(worker_id=1, datacenter_id=1, clock=clock)
+    generator.reserve(10000)
+    assert generator.last_timestamp > now_ms
+    clock.now_ns -= 30_000_000_000
+    with pytest.raises(ClockMovedBackwardsError) as raised:
+        generator.generate()
+    assert raised.value.regression == pytest.approx(30)
+
+
+def test_snowflake_int_fast_path():
+    """
+    Tests that the integer forms match the Snowflake objects and round-trip
+    through Snowflake.from_int and decode_ints.
+    """
+    from array import array
+
+    from anyid.snowflake import decode_ints
+
+    generator = SnowflakeIdGenerator(worker_id=7, datacenter_id=9)
+    first = generator.generate_int()
+    values = generator.generate_many_ints(3 * (SEQUENCE_MASK + 1))
+    last = generator.generate_int()
+
+    assert isinstance(values, array) and values.typecode == "q"
+    assert first < values[0] and list(values) == sorted(set(values))
+    assert values[-1] < last
+    assert generator.generate_many_ints(0) == array("q")
+    with pytest.raises(ValueError):
+        generator.generate_many_ints(-1)
+
+    snowflakes = [Snowflake.from_int(value) for value in values]
+    fields = decode_ints(values)
+    assert list(fields.timestamps) == [s.timestamp for s in snowflakes]
+    assert set(fields.datacenter_ids) == {9}
+    assert set(fields.worker_ids) == {7}
+    assert list(fields.sequences) == [s.sequence for s in snowflakes]
+    assert decode_ints(iter([first])).sequences[0] == Snowflake.from_int(first).sequence
+
+    snowflake_id = Snowflake(
+        timestamp=1700000000000, worker_id=3, datacenter_id=4, sequence=5
+    )
+    assert Snowflake.from_int(int(snowflake_id)) == snowflake_id
+    with pytest.raises(ValueError):
+        Snowflake.from_int(-1)
+    with pytest.raises(ValueError):
+        Snowflake.from_int(1 << 63)
+
+
+def test_snowflake_layout_presets():
+    """
+    Tests the preset layouts against known IDs and their field widths.
+    """
+    from anyid.snowflake import (
+        DISCORD,
+        INSTAGRAM,
+        SONYFLAKE,
+        TWITTER,
+        SnowflakeLayout,
+    )
+
+    # The example from Discord's API documentation.
+    discord = Snowflake.from_int(175928847299117063, DISCORD)
+    assert discord.timestamp == 1462015105796
+    assert (discord.datacenter_id, discord.worker_id, discord.sequence) == (1, 0, 7)
+    assert discord.layout is DISCORD
+
+    assert TWITTER == SnowflakeLayout() and hash(TWITTER) == hash(SnowflakeLayout())
+    assert TWITTER != DISCORD
+    assert (INSTAGRAM.max_worker_id, INSTAGRAM.sequence_mask) == (8191, 1023)
+    assert (SONYFLAKE.max_worker_id, SONYFLAKE.sequence_mask) == (65535, 255)
+    assert SONYFLAKE.max_datacenter_id == 0
+    assert pickle.loads(pickle.dumps(SONYFLAKE)) == SONYFLAKE
+    with pytest.raises(AttributeError):
+        TWITTER.sequence_bits = 13
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"time_unit": 0},
+        {"epoch": 5, "time_unit": 10},
+        {"sequence_bits": 0},
+        {"worker_id_bits": -1},
+        {"timestamp_bits": 42},
+    ],
+)
+def test_snowflake_layout_validation(kwargs):
+    from anyid.snowflake import SnowflakeLayout
+
+    with pytest.raises(ValueError):
+        SnowflakeLayout(**kwargs)
+
+
+def test_snowflake_generator_with_layout():
+    """
+    Tests a generator with a 10 ms time unit, a wide worker ID and a narrow
+    sequence.
+    """
+    from anyid.snowflake import SONYFLAKE, decode_ints
+
+    now_ms = 1678886400123
+    clock = FixedClock(now_ms * 1_000_000)
+    generator = SnowflakeIdGenerator(
+        worker_id=40000, datacenter_id=0, clock=clock, layout=SONYFLAKE
+    )
+    with pytest.raises(ValueError, match="Worker ID must be between 0 and 65535"):
+        SnowflakeIdGenerator(worker_id=70000, datacenter_id=0, layout=SONYFLAKE)
+    with pytest.raises(ValueError, match="Datacenter ID must be between 0 and 0"):
+        SnowflakeIdGenerator(worker_id=1, datacenter_id=1, layout=SONYFLAKE)
+
+    first = generator.generate()
+    assert first.layout is SONYFLAKE
+    assert first.timestamp == now_ms - now_ms % 10
+    assert (first.worker_id, first.datacenter_id, first.sequence) == (40000, 0, 0)
+
+    # A reservation spans ticks after 256 sequence numbers.
+    block = list(generator.reserve(300))
+    assert [s.sequence for s in block[254:256]] == [255, 0]
+    assert block[255].timestamp == first.timestamp + 10
+    assert [int(s) for s in block] == sorted(set(int(s) for s in block))
+
+    values = generator.generate_many_ints(3)
+    fields = decode_ints(values, SONYFLAKE)
+    assert fields.worker_ids.typecode == "H"
+    assert list(fields.worker_ids) == [40000] * 3
+    assert list(fields.timestamps) == [first.timestamp + 10] * 3
+    same = Snowflake(
+        timestamp=first.timestamp + 10,
+        worker_id=40000,
+        datacenter_id=0,
+        sequence=fields.sequences[0],
+        layout=SONYFLAKE,
+    )
+    assert int(same) == values[0]
+
+    # Times before the epoch do not fit the layout.
+    clock.now_ns = 0
+    with pytest.raises(ValueError, match="does not fit"):
+        generator.generate()
+
+
+def test_snowflake_clock_regression_policies():
+    """
+    Tests the raise, logical and wait policies for a clock moving backwards.
+    """
+    from anyid.snowflake import ClockMovedBackwardsError
+
+    now_ms = 1678886400000
+    clock = FixedClock(now_ms * 1_000_000)
+
+    generator = SnowflakeIdGenerator(worker_id=1, datacenter_id=1, clock=clock)
+    generator.generate()
+    clock.now_ns -= 5_000_000
+    with pytest.raises(ClockMovedBackwardsError) as raised:
+        generator.generate()
+    assert raised.value.regression == pytest.approx(0.005)
+
+    clock.now_ns = now_ms * 1_000_000
+    generator = SnowflakeIdGenerator(
+        worker_id=1, datacenter_id=1, clock=clock, on_clock_regression="logical"
+    )
+    stats = generator.enable_stats()
+    first = generator.generate()
+    clock.now_ns -= 5_000_000
+    ids = [generator.generate() for _ in range(3)]
+    assert [s.timestamp for s in ids] == [now_ms] * 3
+    assert [s.sequence for s in ids] == [1, 2, 3]
+    assert first < ids[0]
+    assert stats.clock_regressions == 1
+    assert stats.logical_clock_runs == 1
+    # The logical clock moves on when a tick runs out, without waiting.
+    ids = generator.generate_many_ints(2 * (SEQUENCE_MASK + 1))
+    assert list(ids) == sorted(set(ids))
+    assert generator.last_timestamp == now_ms + 2
+    # Regressions beyond the limit are still refused.
+    generator.max_regression = 0.001
+    with pytest.raises(ClockMovedBackwardsError):
+        generator.generate()
+
+    # A large regression after a small one is refused too.
+    clock.now_ns = now_ms * 1_000_000
+    generator = SnowflakeIdGenerator(
+        worker_id=1, datacenter_id=1, clock=clock, on_clock_regression="logical"
+    )
+    generator.generate()
+    clock.now_ns -= 5_000_000
+    generator.generate()
+    clock.now_ns -= 30_000_000_000
+    with pytest.raises(ClockMovedBackwardsError) as raised:
+        generator.generate()
+    assert raised.value.regression == pytest.approx(30.005)
+
+    generator = SnowflakeIdGenerator(
+        worker_id=1, datacenter_id=1, on_clock_regression="wait"
+    )
+    stats = generator.enable_stats()
+    generator.generate()
+    generator.last_timestamp += 3
+    waited = generator.generate()
+    assert waited.timestamp >= generator.last_timestamp
+    assert stats.regression_waits == 1
+    assert stats.wait_seconds > 0
+    generator.last_timestamp += 5000
+    with pytest.raises(ClockMovedBackwardsError):
+        generator.generate()
+
+
+def test_snowflake_wait_policy_releases_lock():
+    """
+    Tests that the "wait" policy does not hold the lock while it waits for
+    the clock to catch up.
+    """
+    now_ms = 1678886400000
+    clock = FixedClock(now_ms * 1_000_000)
+    generator = SnowflakeIdGenerator(
+        worker_id=1, datacenter_id=1, clock=clock, on_clock_regression="wait"
+    )
+    generator.generate()
+    clock.now_ns -= 100_000_000
+
+    # The waiting thread signals when it starts to sleep, and sleeps until
+    # the test has checked the lock.
+    sleeping, resume = threading.Event(), threading.Event()
+
+    def sleep(seconds):
+        sleeping.set()
+        resume.wait()
+
+    waited = []
+    with patch("time.sleep", side_effect=sleep):
+        thread = threading.Thread(target=lambda: waited.append(generator.generate()))
+        thread.start()
+        sleeping.wait()
+        assert generator._lock.acquire(blocking=False)
+        generator._lock.release()
+        clock.now_ns += 100_000_000
+        resume.set()
+        thread.join()
+    assert waited[0].timestamp == now_ms
+    assert waited[0].sequence == 1
+
+
+def test_snowflake_sequence_overflow_policies():
+    """
+    Tests that the borrow policy runs at most one tick ahead of the clock.
+    """
+    now_ms = 1678886400000
+    clock = FixedClock(now_ms * 1_000_000)
+    generator = SnowflakeIdGenerator(
+        worker_id=1, datacenter_id=1, clock=clock, on_sequence_overflow="borrow"
+    )
+    stats = generator.enable_stats()
+    ids = generator.generate_many_ints(SEQUENCE_MASK + 3)
+    assert list(ids) == sorted(set(ids))
+    assert generator.last_timestamp == now_ms + 1
+    assert stats.sequence_borrows == 1
+    assert stats.sequence_overflows == 0
+
+    # The borrowed tick is used up too: wait for the clock.
+    generator.sequence = SEQUENCE_MASK
+    assert generator._claim(1) is None
+    clock.now_ns += 2_000_000
+    assert generator.generate().timestamp == now_ms + 2
+
+    for policy in ("spin", "sleep"):
+        generator = SnowflakeIdGenerator(
+            worker_id=1, datacenter_id=1, on_sequence_overflow=policy
+        )
+        assert len(set(generator.generate_many_ints(3 * SEQUENCE_MASK))) == (
+            3 * SEQUENCE_MASK
+        )
+
+    with pytest.raises(ValueError, match="Clock regression policy"):
+        SnowflakeIdGenerator(worker_id=1, datacenter_id=1, on_clock_regression="x")
+    with pytest.raises(ValueError, match="Sequence overflow policy"):
+        SnowflakeIdGenerator(worker_id=1, datacenter_id=1, on_sequence_overflow="x")
+    with pytest.raises(ValueError, match="Maximum regression"):
+        SnowflakeIdGenerator(worker_id=1, datacenter_id=1, max_regression=-1)
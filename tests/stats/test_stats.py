@@ -0,0 +1,215 @@
+"""
+Tests for the opt-in generator statistics.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from anyid.cuid import CuidGenerator
+from anyid.cuid2 import Cuid2Generator
+from anyid.ksuid import KsuidGenerator
+from anyid.nanoid import NanoidGenerator
+from anyid.snowflake.generator import SEQUENCE_MASK, SnowflakeIdGenerator
+from anyid.stats import LOCK_WAIT_BUCKETS, GeneratorStats, to_prometheus
+from anyid.ulid.generator import MAX_RANDOM, ULIDGenerator
+from anyid.uuid import UuidGenerator
+from anyid.xid import XidGenerator
+
+FIXED_TIME_MS = 1678886400000
+
+GENERATOR_FACTORIES = [
+    CuidGenerator,
+    Cuid2Generator,
+    KsuidGenerator,
+    NanoidGenerator,
+    lambda: SnowflakeIdGenerator(worker_id=1, datacenter_id=1),
+    ULIDGenerator,
+    UuidGenerator,
+    XidGenerator,
+]
+
+
+@pytest.mark.parametrize("factory", GENERATOR_FACTORIES)
+def test_stats_are_disabled_by_default(factory):
+    generator = factory()
+    assert generator.stats is None
+    generator.generate()
+    assert generator.stats is None
+
+
+@pytest.mark.parametrize("factory", GENERATOR_FACTORIES)
+def test_ids_issued_are_counted(factory):
+    generator = factory()
+    stats = generator.enable_stats()
+    generator.generate()
+    generator.generate_many(9)
+    assert generator.stats is stats
+    assert stats.ids_issued == 10
+
+
+@pytest.mark.parametrize("factory", [CuidGenerator, ULIDGenerator, XidGenerator])
+def test_lock_waits_are_recorded(factory):
+    generator = factory()
+    stats = generator.enable_stats()
+    generator.generate()
+    generator.generate_many(5)
+    histogram = stats.snapshot()["lock_wait_seconds"]
+    assert histogram["count"] == 2
+    assert histogram["buckets"]["+Inf"] == 2
+
+
+def test_disable_stats_restores_the_lock():
+    generator = XidGenerator()
+    lock = generator._lock
+    stats = generator.enable_stats()
+    assert generator._lock is not lock
+    assert generator.disable_stats() is stats
+    assert generator._lock is lock
+    assert generator.stats is None
+    generator.generate()
+    assert stats.ids_issued == 0
+
+
+def test_enable_stats_is_idempotent_and_accepts_shared_stats():
+    shared = GeneratorStats()
+    first, second = XidGenerator(), CuidGenerator()
+    assert first.enable_stats(shared) is shared
+    assert first.enable_stats() is shared
+    assert second.enable_stats(shared) is shared
+    first.generate()
+    second.generate()
+    assert shared.ids_issued == 2
+    assert shared.snapshot()["lock_wait_seconds"]["count"] == 2
+
+
+def test_snowflake_sequence_overflow_and_wait():
+    generator = SnowflakeIdGenerator(worker_id=1, datacenter_id=1)
+    stats = generator.enable_stats()
+    ticks = iter([FIXED_TIME_MS, FIXED_TIME_MS, FIXED_TIME_MS + 1])
+    with patch("time.time_ns") as mock_time:
+        mock_time.side_effect = lambda: next(ticks) * 1_000_000
+        generator.last_timestamp = FIXED_TIME_MS
+        generator.sequence = SEQUENCE_MASK - 1
+        generator.generate()
+        generator.generate()
+    assert stats.ids_issued == 2
+    assert stats.sequence_overflows == 1
+    assert stats.wait_seconds >= 0
+
+
+def test_snowflake_clock_regression():
+    generator = SnowflakeIdGenerator(worker_id=1, datacenter_id=1)
+    stats = generator.enable_stats()
+    generator.last_timestamp = 2**62
+    with pytest.raises(Exception, match="Clock moved backwards"):
+        generator.generate()
+    with pytest.raises(Exception, match="Clock moved backwards"):
+        generator.generate_many(3)
+    assert stats.clock_regressions == 2
+    assert stats.ids_issued == 0
+
+
+def test_ulid_random_overflow_and_wait():
+    generator = ULIDGenerator()
+    stats = generator.enable_stats()
+    ticks = iter([FIXED_TIME_MS, FIXED_TIME_MS + 1])
+    with patch("time.time_ns") as mock_time:
+        mock_time.side_effect = lambda: next(ticks) * 1_000_000
+        generator._last_ms = FIXED_TIME_MS
+        generator._last_random = MAX_RANDOM
+        generator.generate()
+    assert stats.sequence_overflows == 1
+    assert stats.ids_issued == 1
+
+
+def test_xid_counter_wraps():
+    generator = XidGenerator()
+    stats = generator.enable_stats()
+    generator._counter = generator._counter_max
+    generator.generate()
+    assert stats.counter_wraps == 1
+    generator._counter = generator._counter_max - 1
+    generator.generate_many(3)
+    assert stats.counter_wraps == 2
+
+
+def test_cuid_counter_wraps():
+    generator = CuidGenerator()
+    stats = generator.enable_stats()
+    generator.counter = generator.discrete_values - 2
+    generator.generate_many(2 * generator.discrete_values)
+    assert stats.counter_wraps == 2
+
+
+def test_snapshot_and_reset():
+    stats = GeneratorStats()
+    stats.record_ids(3)
+    stats.record_counter_wraps()
+    stats.record_lock_wait(0.0)
+    stats.record_lock_wait(5e-4)
+    stats.record_lock_wait(60.0)
+
+    snapshot = stats.snapshot(reset=True)
+    assert snapshot["ids_issued"] == 3
+    assert snapshot["counter_wraps"] == 1
+    histogram = snapshot["lock_wait_seconds"]
+    assert list(histogram["buckets"]) == [repr(b) for b in LOCK_WAIT_BUCKETS] + ["+Inf"]
+    assert histogram["buckets"][repr(1e-6)] == 1
+    assert histogram["buckets"][repr(1e-3)] == 2
+    assert histogram["buckets"]["+Inf"] == 3
+    assert histogram["count"] == 3
+    assert histogram["sum"] == pytest.approx(60.0005)
+
+    assert stats.snapshot()["ids_issued"] == 0
+    stats.record_ids()
+    stats.reset()
+    assert stats.ids_issued == 0
+
+
+def test_concurrent_recording_is_exact():
+    generator = XidGenerator()
+    stats = generator.enable_stats()
+
+    def worker():
+        for _ in range(1000):
+            generator.generate()
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert stats.ids_issued == 8000
+    assert stats.snapshot()["lock_wait_seconds"]["count"] == 8000
+
+
+def test_to_prometheus():
+    stats = GeneratorStats()
+    stats.record_ids(7)
+    stats.record_lock_wait(2e-6)
+    text = to_prometheus({"ulid": stats, 'we"ird': GeneratorStats()})
+
+    lines = text.splitlines()
+    assert text.endswith("\n")
+    assert "# TYPE anyid_ids_issued_total counter" in lines
+    assert 'anyid_ids_issued_total{generator="ulid"} 7' in lines
+    assert 'anyid_ids_issued_total{generator="we\\"ird"} 0' in lines
+    assert "# TYPE anyid_lock_wait_seconds histogram" in lines
+    assert 'anyid_lock_wait_seconds_bucket{generator="ulid",le="1e-06"} 0' in lines
+    assert 'anyid_lock_wait_seconds_bucket{generator="ulid",le="1e-05"} 1' in lines
+    assert 'anyid_lock_wait_seconds_bucket{generator="ulid",le="+Inf"} 1' in lines
+    assert 'anyid_lock_wait_seconds_count{generator="ulid"} 1' in lines
+    for metric in (
+        "sequence_overflows_total",
+        "wait_seconds_total",
+        "clock_regressions_total",
+        "regression_waits_total",
+        "logical_clock_runs_total",
+        "sequence_borrows_total",
+        "counter_wraps_total",
+    ):
+        assert f"# TYPE anyid_{metric} counter" in lines
+
+    assert to_prometheus({"x": stats}, prefix="ids").startswith("# HELP ids_")
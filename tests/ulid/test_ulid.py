@@ -1,6 +1,7 @@
+import threading
 import time
 from anyid.ulid import ulid, generator
-from anyid.ulid.generator import CROCKFORD_ALPHABET
+from anyid.ulid.generator import CROCKFORD_ALPHABET, MAX_RANDOM
 from hypothesis import given, strategies as st
 
 
@@ -41,24 +42,24 @@ def test_ulid_monotonicity():
     """
     gen = generator()
 
-    # Mock time.time() to control the timestamp
-    original_time = time.time
+    # Mock time.time_ns() to control the timestamp
+    original_time = time.time_ns
 
     try:
-        current_ms = int(original_time() * 1000)
+        current_ms = original_time() // 1_000_000
 
         # First call
-        time.time = lambda: current_ms / 1000
+        time.time_ns = lambda: current_ms * 1_000_000
         ulid1 = gen.generate()
 
         # Second call in the same millisecond
-        time.time = lambda: current_ms / 1000
+        time.time_ns = lambda: current_ms * 1_000_000
         ulid2 = gen.generate()
 
         assert ulid1 < ulid2
 
     finally:
-        time.time = original_time
+        time.time_ns = original_time
 
 
 def test_ulid_first_char():
@@ -96,3 +97,233 @@ def test_ulid_first_char_property(generated_ulid):
     Tests that the first character of a ULID is always within the valid range.
     """
     assert generated_ulid[0] <= "7"
+
+
+def test_ulid_generate_many_monotonic():
+    """
+    Tests that a batch is strictly increasing and continues monotonically.
+    """
+    gen = generator()
+    ulids = gen.generate_many(1000)
+    assert len(ulids) == 1000
+    assert all(a < b for a, b in zip(ulids, ulids[1:]))
+    assert ulids[-1] < gen.generate()
+
+
+def test_ulid_generate_many_random_overflow():
+    """
+    Tests that a batch rolls over to the next millisecond instead of
+    overflowing the random component.
+    """
+    gen = generator()
+    original_time = time.time_ns
+    ticks = iter([1000000, 1000000, 1000001, 1000001])
+    try:
+        time.time_ns = lambda: next(ticks) * 1_000_000
+        gen._last_ms = 1000000
+        gen._last_random = MAX_RANDOM - 1
+        ulids = gen.generate_many(3)
+    finally:
+        time.time_ns = original_time
+
+    decoded = [gen.decode_base32(u) for u in ulids]
+    assert int.from_bytes(decoded[0][6:], "big") == MAX_RANDOM
+    assert int.from_bytes(decoded[1][:6], "big") == 1000001
+    assert ulids == sorted(ulids)
+
+
+def test_ulid_iter_ids():
+    """
+    Tests that iter_ids yields monotonic ULIDs across chunk boundaries.
+    """
+    iterator = generator().iter_ids(chunk_size=8)
+    ulids = [next(iterator) for _ in range(20)]
+    assert ulids == sorted(ulids)
+    assert len(set(ulids)) == 20
+
+
+def test_ulid_sharded_streams():
+    """
+    Tests that in sharded mode every thread gets a strictly increasing stream
+    and that ULIDs are unique across threads.
+    """
+    gen = generator(sharded=True)
+    results = {}
+
+    def generate_ulids(index):
+        results[index] = [gen.generate() for _ in range(500)] + gen.generate_many(500)
+
+    threads = [threading.Thread(target=generate_ulids, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for ulids in results.values():
+        assert all(a < b for a, b in zip(ulids, ulids[1:]))
+    everything = [u for ulids in results.values() for u in ulids]
+    assert len(everything) == len(set(everything)) == 8000
+    # The shared state is never touched in sharded mode.
+    assert gen._last_ms == 0
+
+
+def test_ulid_value_type():
+    """
+    Tests parsing, conversions, ordering and the accessors of `Ulid`.
+    """
+    import datetime
+
+    import pytest
+
+    from anyid.ulid import Ulid, parse_many
+
+    gen = generator()
+    encoded = gen.generate_many(3)
+    parsed = [Ulid.from_str(item) for item in encoded]
+    assert [str(item) for item in parsed] == encoded
+    assert parsed == sorted(parsed) and len(set(parsed)) == 3
+    assert parse_many(encoded) == parsed
+    assert Ulid.from_str(encoded[0].lower()) == parsed[0]
+    assert str(Ulid.from_str(encoded[0].lower())) == encoded[0]
+
+    ulid_ = parsed[0]
+    assert Ulid.from_bytes(ulid_.to_bytes()) == ulid_
+    assert Ulid.from_int(int(ulid_)) == ulid_
+    assert str(Ulid.from_int(int(ulid_))) == encoded[0]
+    assert ulid_.to_bytes() == gen.decode_base32(encoded[0])
+    assert int(ulid_) == (ulid_.timestamp_ms << 80) | ulid_.random
+    assert ulid_.datetime == datetime.datetime.fromtimestamp(
+        ulid_.timestamp_ms / 1000, tz=datetime.timezone.utc
+    )
+    assert repr(ulid_) == f"Ulid('{encoded[0]}')"
+
+    known = Ulid.from_str("01ARZ3NDEKTSV4RRFFQ69G5FAV")
+    assert known.timestamp_ms == 1469922850259
+
+    for invalid in ("0" * 25, "8" + "0" * 25, "U" * 26):
+        with pytest.raises(ValueError):
+            Ulid.from_str(invalid)
+        with pytest.raises(ValueError):
+            parse_many([encoded[0], invalid])
+    with pytest.raises(ValueError):
+        Ulid.from_bytes(b"\x00" * 15)
+    with pytest.raises(ValueError):
+        Ulid.from_int(1 << 128)
+
+
+def test_ulid_task_streams():
+    """
+    Tests that in task mode every asyncio task gets its own increasing stream.
+    """
+    import asyncio
+
+    import pytest
+
+    gen = generator(sharded="task")
+
+    async def generate_ulids():
+        ulids = []
+        for _ in range(200):
+            ulids.append(gen.generate())
+            await asyncio.sleep(0)
+        return ulids, gen._streams.get()
+
+    async def main():
+        return await asyncio.gather(*(generate_ulids() for _ in range(4)))
+
+    results = asyncio.run(main())
+    for ulids, _ in results:
+        assert all(a < b for a, b in zip(ulids, ulids[1:]))
+    assert len({id(stream) for _, stream in results}) == 4
+    assert len({u for ulids, _ in results for u in ulids}) == 800
+    assert gen._last_ms == 0
+
+    with pytest.raises(ValueError, match="Sharded must be"):
+        generator(sharded="process")
+
+
+def test_ulid_binary_outputs():
+    """
+    Tests the integer, bytes and UUID outputs and their conversions.
+    """
+    import uuid
+
+    import pytest
+
+    from anyid.ulid import Ulid
+
+    gen = generator()
+    value = gen.generate_int()
+    data = gen.generate_bytes()
+    as_uuid = gen.generate_uuid()
+    assert isinstance(as_uuid, uuid.UUID)
+    assert value < int.from_bytes(data, "big") < as_uuid.int
+
+    ulid_ = Ulid.from_bytes(data)
+    assert Ulid.from_uuid(ulid_.to_uuid()) == ulid_
+    assert ulid_.to_uuid().bytes == data
+    assert Ulid.from_str(str(Ulid.from_uuid(as_uuid))).to_uuid() == as_uuid
+
+    for method, kind in (
+        (gen.generate_many_ints, int),
+        (gen.generate_many_bytes, bytes),
+        (gen.generate_many_uuids, uuid.UUID),
+    ):
+        batch = method(100)
+        assert len(batch) == 100
+        assert all(isinstance(item, kind) for item in batch)
+        assert batch == sorted(batch)
+        assert len(set(batch)) == 100
+        with pytest.raises(ValueError):
+            method(-1)
+    assert gen.generate_many_ints(0) == []
+
+
+def test_ulid_reserve():
+    """
+    Tests that reserved blocks are contiguous, lazy and followed by later
+    ULIDs, and that they roll over to the next millisecond when needed.
+    """
+    from unittest.mock import patch
+
+    import pytest
+
+    from anyid.ulid import Ulid, UlidBlock
+
+    gen = generator()
+    now_ms = 1678886400000
+    with patch("time.time_ns", return_value=now_ms * 1_000_000):
+        before = gen.generate()
+        block = gen.reserve(1000)
+        after = gen.generate()
+
+        assert isinstance(block, UlidBlock)
+        assert len(block) == 1000
+        ulids = list(block)
+        assert before < ulids[0] and ulids[-1] < after
+        assert [int(Ulid.from_str(u)) for u in ulids] == list(block.ints())
+        assert block[0] == ulids[0] and block[-1] == ulids[-1]
+        data = block.to_bytes()
+        assert len(data) == 16000
+        assert Ulid.from_bytes(data[16:32]) == Ulid.from_str(ulids[1])
+        with pytest.raises(IndexError):
+            block[1000]
+        # Contiguous slices are sub-blocks, other slices lists of strings.
+        part = block[1:3]
+        assert isinstance(part, UlidBlock)
+        assert list(part) == ulids[1:3]
+        assert list(block[-2:]) == ulids[-2:]
+        assert len(block[5:5]) == 0
+        assert block[::250] == ulids[::250]
+        assert block[::-1] == ulids[::-1]
+
+        # A block that does not fit in the random space moves on to the next
+        # millisecond, and later ULIDs follow it.
+        gen._last_random = MAX_RANDOM - 10
+        block = gen.reserve(100)
+        assert block.timestamp_ms == now_ms + 1
+        assert block.start + 99 <= MAX_RANDOM
+        assert gen.generate() > block[-1]
+
+    with pytest.raises(ValueError):
+        gen.reserve(0)
@@ -10,3 +10,23 @@ def test_uuid_generator():
     generator = UuidGenerator()
     generated_uuid = generator.generate()
     assert isinstance(generated_uuid, uuid.UUID)
+
+
+def test_uuid_generate_many():
+    """
+    Tests that a batch of UUIDs is unique and every UUID is a valid version 4.
+    """
+    uuids = UuidGenerator().generate_many(100)
+    assert len(set(uuids)) == 100
+    for generated_uuid in uuids:
+        assert generated_uuid.version == 4
+        assert generated_uuid.variant == uuid.RFC_4122
+
+
+def test_uuid_iter_ids():
+    """
+    Tests that iter_ids yields UUIDs across chunk boundaries.
+    """
+    iterator = UuidGenerator().iter_ids(chunk_size=3)
+    uuids = [next(iterator) for _ in range(10)]
+    assert len(set(uuids)) == 10
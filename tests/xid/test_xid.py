@@ -1,4 +1,5 @@
 import datetime
+import pickle
 import threading
 import time
 
@@ -389,3 +390,86 @@ def test_xid_counter_wrapping():
 
     xid2 = generator.generate()
     assert xid2.counter == 0
+
+
+def test_xid_generate_many():
+    """
+    Tests that a batch reserves consecutive counter values.
+    """
+    generator = XidGenerator()
+    start = generator._counter
+    xids = generator.generate_many(100)
+    assert [x.counter for x in xids] == [
+        (start + i) % (1 << (COUNTER_BYTES * 8)) for i in range(100)
+    ]
+    assert generator.generate().counter == (start + 100) % (1 << (COUNTER_BYTES * 8))
+    assert len({str(x) for x in xids}) == 100
+
+
+def test_xid_generate_many_counter_wrapping():
+    """
+    Tests that a batch wraps the counter just like repeated generate calls.
+    """
+    generator = XidGenerator()
+    counter_max = (1 << (COUNTER_BYTES * 8)) - 1
+    generator._counter = counter_max - 1
+    xids = generator.generate_many(3)
+    assert [x.counter for x in xids] == [counter_max - 1, counter_max, 0]
+
+
+def test_xid_iter_ids():
+    """
+    Tests that iter_ids yields unique XIDs across chunk boundaries.
+    """
+    iterator = XidGenerator().iter_ids(chunk_size=4)
+    xids = [next(iterator) for _ in range(10)]
+    assert len({str(x) for x in xids}) == 10
+
+
+def test_xid_sharded_uniqueness_concurrent():
+    """
+    Tests that sharded XIDs are unique across threads and that each thread
+    takes its counters from its own block.
+    """
+    generator = XidGenerator(sharded=True)
+    results = {}
+
+    def generate_xids(index):
+        results[index] = [generator.generate() for _ in range(600)]
+
+    threads = [threading.Thread(target=generate_xids, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    xid_strings = [str(xid) for xids in results.values() for xid in xids]
+    assert len(xid_strings) == len(set(xid_strings)) == 4800
+    counter_max = (1 << 24) - 1
+    for xids in results.values():
+        # Within a block the counters of one thread are consecutive.
+        steps = [(b.counter - a.counter) & counter_max for a, b in zip(xids, xids[1:])]
+        assert steps.count(1) >= len(steps) - 600 // 256 - 1
+
+
+def test_xid_value_semantics():
+    """
+    Tests that XIDs are hashable, totally ordered, immutable and compact.
+    """
+    first = Xid(timestamp=100, machine_id=b"abc", process_id=b"de", counter=1)
+    same = Xid.from_string(str(first))
+    later = Xid(timestamp=100, machine_id=b"abc", process_id=b"de", counter=2)
+
+    assert first == same and hash(first) == hash(same)
+    assert {first: "a"}[same] == "a"
+    assert len({first, same, later}) == 2
+    assert first <= same < later and later > first and later >= same
+    # The hex form is encoded on first use and cached.
+    assert later._str is None
+    a = str(later)
+    b = str(later)
+    assert a is b and later._str is a
+    assert not hasattr(first, "__dict__")
+    with pytest.raises(AttributeError):
+        first.counter = 5
+    assert pickle.loads(pickle.dumps(first)) == first